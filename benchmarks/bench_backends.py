@@ -0,0 +1,59 @@
+"""Porównanie silników rozwiązujących: maski bitowe, Dancing Links i dawna rekurencja.
+
+Mierzy rozwiązanie (solve) i sprawdzenie jednoznaczności (count_solutions z limitem 2)
+na zestawie trudnych plansz oraz liczenie wszystkich rozwiązań planszy z wieloma rozwiązaniami.
+
+Uruchomienie: python benchmarks/bench_backends.py [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_solver import best_of, legacy_solve, load_puzzles  # noqa: E402
+
+from sudoku_core.generator import BACKENDS  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5, help="liczba powtórzeń (liczy się najlepszy czas)")
+    parser.add_argument("--removed", type=int, default=2,
+                        help="liczba wskazówek usuniętych przed wyliczaniem wszystkich rozwiązań")
+    args = parser.parse_args()
+
+    puzzles = load_puzzles()
+    totals = {}
+    print(f"{'':4}" + "".join(f"{name + ' solve':>16}{name + ' count':>16}" for name in BACKENDS)
+          + f"{'rekurencja':>14}")
+    for i, grid in enumerate(puzzles):
+        line = f"#{i:<3}"
+        for name, (solve, count_solutions) in BACKENDS.items():
+            for kind, func in (("solve", solve), ("count", count_solutions)):
+                elapsed = best_of(func, grid, args.repeat)
+                totals[name, kind] = totals.get((name, kind), 0.0) + elapsed
+                line += f"{elapsed * 1000:13.2f} ms"
+        elapsed = best_of(legacy_solve, grid, 1)
+        totals["legacy", "solve"] = totals.get(("legacy", "solve"), 0.0) + elapsed
+        print(line + f"{elapsed * 1000:11.2f} ms")
+    print("Razem: " + ", ".join(f"{name} {kind} {total * 1000:.2f} ms" for (name, kind), total in totals.items()))
+
+    # Wyliczanie wszystkich rozwiązań: trudna plansza bez kilku wskazówek (2 -> 12748 rozwiązań)
+    grid = [row[:] for row in puzzles[0]]
+    removed = 0
+    for row in grid:
+        for col in range(len(row)):
+            if row[col] and removed < args.removed:
+                row[col] = 0
+                removed += 1
+    for name, (solve, count_solutions) in BACKENDS.items():
+        start = time.perf_counter()
+        found = count_solutions(grid, limit=10 ** 9)
+        elapsed = time.perf_counter() - start
+        print(f"{name}: {found} rozwiązań planszy bez {removed} wskazówek w {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
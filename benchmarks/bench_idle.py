@@ -0,0 +1,66 @@
+"""Zużycie procesora przez pętlę gry bez wejścia od gracza: odpytywanie 60 kl./s a pętla sterowana zdarzeniami.
+
+Dla każdego ekranu (start, gra, pauza) uruchamia `Game.run` na `--seconds` sekund
+bez okna (sterownik SDL "dummy") i wypisuje czas procesora na sekundę oraz
+podsumowanie `FrameStats` z całego pomiaru. Nakładka F3 jest wyłączona - sama
+budziłaby pętlę co okno pomiarowe.
+
+Uruchomienie: python benchmarks/bench_idle.py [--seconds 3]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sudoku  # noqa: E402
+from sudoku_core.pool import generate_puzzle  # noqa: E402
+
+
+def measure(state, event_driven, seconds):
+    game = sudoku.Game(event_driven=event_driven)
+    if state != "start":
+        game.new_game(generate_puzzle("łatwy"))
+    game.player_name = "gracz"
+    game.state = state
+    if state == "pause":
+        game.is_paused = True
+        game.pause_start_time = sudoku.datetime.now()
+    # Zdarzenie QUIT po zadanym czasie kończy `run` przez `Game.quit` (sys.exit)
+    sudoku.pygame.time.set_timer(sudoku.pygame.QUIT, int(seconds * 1000), 1)
+    start = time.process_time()
+    try:
+        game.run()
+    except SystemExit:
+        pass
+    cpu = (time.process_time() - start) / seconds
+    game.frame_stats.roll()  # Podsumowanie od ostatniego okna, także gdy pętla w ogóle się nie budziła
+    return cpu, game.frame_stats.describe()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=3.0, help="czas pomiaru każdego ekranu")
+    args = parser.parse_args()
+
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        # Gra zakłada bazę zapisów i plik puli w katalogu roboczym
+        os.chdir(directory)
+        try:
+            for event_driven in (False, True):
+                mode = "zdarzenia" if event_driven else "odpytywanie"
+                for state in ("start", "game", "pause"):
+                    cpu, frames = measure(state, event_driven, args.seconds)
+                    print(f"{mode:12} {state:6} procesor {cpu * 1000:7.1f} ms/s   {frames}")
+        finally:
+            os.chdir(previous)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Czas importu modułów bez interfejsu graficznego.
+
+Uruchomienie: python benchmarks/bench_import.py [--budget-ms 50]
+Kończy się kodem 1, jeśli import przekracza budżet albo wciąga Pygame.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = ["sudoku_core", "sudoku"]
+REPEAT = 10
+
+CHECK = "import sys, {module}; sys.exit('pygame' in sys.modules)"
+
+
+def import_time(code):
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT)
+        best = min(best, time.perf_counter() - start)
+        if result.returncode:
+            return None
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget-ms", type=float, default=50.0,
+                        help="dopuszczalny narzut importu ponad pusty interpreter")
+    args = parser.parse_args()
+
+    baseline = import_time("pass")
+    failed = False
+    for module in MODULES:
+        elapsed = import_time(CHECK.format(module=module))
+        if elapsed is None:
+            print(f"{module}: import wciąga pygame")
+            failed = True
+            continue
+        overhead = (elapsed - baseline) * 1000
+        status = "OK" if overhead <= args.budget_ms else "PRZEKROCZONO"
+        print(f"{module}: {overhead:.1f} ms ponad pusty interpreter (budżet {args.budget_ms:.0f} ms) {status}")
+        failed = failed or overhead > args.budget_ms
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""Zapytania bazy wyników (sudoku_core.results) przy milionach wierszy: z indeksami i bez.
+
+Wypełnia tymczasową bazę `--rows` losowymi wynikami (`--players` graczy, oba poziomy,
+plansze 4x4/9x9/16x16) i mierzy medianę czasu: N najlepszych czasów poziomu (zapytanie
+i tabela z pamięci), historię gracza i dopisanie wyniku. Na koniec usuwa indeksy i
+powtarza zapytania, żeby pokazać koszt pełnego przeglądu tabeli.
+
+Uruchomienie: python benchmarks/bench_results.py [--rows 1000000] [--players 10000]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sudoku_core.results import ResultStore  # noqa: E402
+
+DIFFICULTIES = ("łatwy", "trudny")
+SIZES = (4, 9, 9, 9, 16)  # Najczęściej grana jest plansza 9x9
+
+
+def fake_results(rng, rows, players):
+    for _ in range(rows):
+        size = rng.choice(SIZES)
+        yield (f"gracz{rng.randrange(players)}", rng.choice(DIFFICULTIES), size, "." * (size * size),
+               rng.randrange(60, 7200), rng.randrange(4), "2024-01-01T00:00:00")
+
+
+def median_ms(func, repeat=50):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def measure(store, rng, players, repeat=50):
+    def player():
+        return f"gracz{rng.randrange(players)}"
+
+    return [
+        ("top 10 (zapytanie)", median_ms(lambda: store.query_top("trudny", 9, 10), repeat)),
+        ("top 10 (z pamięci)", median_ms(lambda: store.top("trudny", 9, 10), repeat)),
+        ("historia gracza", median_ms(lambda: store.history(player()), repeat)),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000, help="liczba wyników w bazie")
+    parser.add_argument("--players", type=int, default=10_000, help="liczba graczy")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        store = ResultStore(os.path.join(directory, "results.db"))
+        try:
+            start = time.perf_counter()
+            store.add_many(fake_results(rng, args.rows, args.players))
+            print(f"Wstawiono {args.rows} wyników w {time.perf_counter() - start:.1f} s, "
+                  f"baza {os.path.getsize(store.path) / 1e6:.0f} MB")
+
+            results = measure(store, rng, args.players)
+            # Nowy wynik unieważnia tabelę z pamięci - dopisanie razem z ponownym zapytaniem
+            results.append(("dopisanie + top 10", median_ms(
+                lambda: (store.add("gracz0", "trudny", 9, "." * 81, 600, 0), store.top("trudny", 9, 10)), repeat=20)))
+            for (plan,) in [row[3:] for row in store.connection.execute(
+                    "EXPLAIN QUERY PLAN SELECT * FROM results WHERE difficulty = 'trudny' AND size = 9 "
+                    "ORDER BY seconds, id LIMIT 10")]:
+                print(f"Plan top 10: {plan}")
+
+            store.connection.execute("DROP INDEX results_top")
+            store.connection.execute("DROP INDEX results_player")
+            without = measure(store, rng, args.players, repeat=5)
+        finally:
+            store.close()
+
+    print(f"{'zapytanie':22} {'z indeksami':>12} {'bez indeksów':>13}")
+    for i, (name, ms) in enumerate(results):
+        other = f"{without[i][1]:10.3f} ms" if i < len(without) else ""
+        print(f"{name:22} {ms:9.3f} ms {other:>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Porównanie silnika masek bitowych z dawną rekurencją SudokuGenerator.solve_sudoku.
+
+Obok łącznego przyspieszenia wypisuje najmniejsze na pojedynczej planszy wraz z celem
+(x50), który dotyczy każdej planszy osobno - kończy się kodem 1, jeśli któraś jest
+poniżej celu. Silnik jest mierzony jako najlepszy z `ENGINE_REPEAT` przebiegów (pojedynczy
+przebieg trwa kilka ms i łatwo go zakłóca), dawna rekurencja raz.
+
+Uruchomienie: python benchmarks/bench_solver.py [--target 50]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sudoku_core.solver import solve  # noqa: E402
+
+ENGINE_REPEAT = 20
+PUZZLES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "hard_puzzles.txt")
+
+
+def load_puzzles(path=PUZZLES_FILE):
+    puzzles = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                puzzles.append([[0 if ch in ".0" else int(ch) for ch in line[r * 9:r * 9 + 9]] for r in range(9)])
+    return puzzles
+
+
+# Kopia poprzedniej implementacji (skan od (0, 0) przy każdym wywołaniu)
+def legacy_is_valid(board, row, col, num):
+    if num in board[row]:
+        return False
+    for r in range(9):
+        if board[r][col] == num:
+            return False
+    start_row, start_col = 3 * (row // 3), 3 * (col // 3)
+    for r in range(3):
+        for c in range(3):
+            if board[start_row + r][start_col + c] == num:
+                return False
+    return True
+
+
+def legacy_solve(board):
+    for row in range(9):
+        for col in range(9):
+            if board[row][col] == 0:
+                for num in range(1, 10):
+                    if legacy_is_valid(board, row, col, num):
+                        board[row][col] = num
+                        if legacy_solve(board):
+                            return True
+                        board[row][col] = 0
+                return False
+    return True
+
+
+def best_of(func, grid, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        board = [row[:] for row in grid]
+        start = time.perf_counter()
+        func(board)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--target", type=float, default=50.0, help="wymagane przyspieszenie na każdej planszy")
+    args = parser.parse_args()
+
+    puzzles = load_puzzles()
+    total_new = total_old = 0.0
+    speedups = []
+    for i, grid in enumerate(puzzles):
+        new = best_of(solve, grid, ENGINE_REPEAT)
+        old = best_of(legacy_solve, grid, 1)
+        total_new += new
+        total_old += old
+        speedups.append(old / new)
+        print(f"#{i}: silnik {new * 1000:8.2f} ms | rekurencja {old * 1000:10.2f} ms | x{old / new:7.1f}")
+    print(f"Razem: silnik {total_new * 1000:.2f} ms, rekurencja {total_old * 1000:.2f} ms, "
+          f"x{total_old / total_new:.1f}")
+    worst = min(range(len(speedups)), key=speedups.__getitem__)
+    status = "OK" if speedups[worst] >= args.target else "PONIŻEJ CELU"
+    print(f"Najmniejsze przyspieszenie: x{speedups[worst]:.1f} (#{worst}), cel x{args.target:.0f} {status}")
+    return 0 if speedups[worst] >= args.target else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
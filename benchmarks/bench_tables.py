@@ -0,0 +1,94 @@
+"""Koszt pojedynczego wywołania has_conflict i is_valid: dawne pętle po wierszu, kolumnie i kwadracie
+a tablice sąsiadów z sudoku_core.units.
+
+Uruchomienie: python benchmarks/bench_tables.py [--number 20000]
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import timeit
+from collections import deque
+from functools import partial
+from itertools import starmap
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sudoku_core import validation  # noqa: E402
+from sudoku_core.conflicts import ConflictTracker  # noqa: E402
+from sudoku_core.generator import SudokuGenerator  # noqa: E402
+
+
+# Kopie poprzednich implementacji (początek kwadratu i pętle `range` przy każdym wywołaniu)
+def legacy_has_conflict(board, row, col, num):
+    grid_size = len(board)
+    box_size = math.isqrt(grid_size)
+    for c in range(grid_size):
+        if c != col and board[row][c] == num:
+            return True
+    for r in range(grid_size):
+        if r != row and board[r][col] == num:
+            return True
+    start_row, start_col = box_size * (row // box_size), box_size * (col // box_size)
+    for r in range(box_size):
+        for c in range(box_size):
+            box_row = start_row + r
+            box_col = start_col + c
+            if (box_row != row or box_col != col) and board[box_row][box_col] == num:
+                return True
+    return False
+
+
+def legacy_is_valid(board, box, row, col, num):
+    if num in board[row]:
+        return False
+    for r in range(len(board)):
+        if board[r][col] == num:
+            return False
+    start_row, start_col = box * (row // box), box * (col // box)
+    for r in range(box):
+        for c in range(box):
+            if board[start_row + r][start_col + c] == num:
+                return False
+    return True
+
+
+def per_call(func, calls, number):
+    # Najlepszy z pięciu pomiarów, w ns na jedno wywołanie
+    best = min(timeit.repeat(lambda: deque(starmap(func, calls), maxlen=0), number=number, repeat=5))
+    return best / number / len(calls) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=2000, help="liczba przebiegów po wszystkich polach")
+    args = parser.parse_args()
+
+    random.seed(0)
+    generator = SudokuGenerator("trudny")
+    board = generator.board
+    grid = board.to_grid()
+    box = board.box_size
+    tracker = ConflictTracker(board.copy())
+    # Każde pole planszy z każdą cyfrą - sprawdzenia z wczesnym wyjściem i bez
+    calls = [(row, col, num) for row in range(9) for col in range(9) for num in range(1, 10)]
+    number = max(args.number // 9, 1)
+
+    results = [
+        ("has_conflict", "dawne pętle", per_call(partial(legacy_has_conflict, grid), calls, number)),
+        ("has_conflict", "lista wierszy", per_call(partial(validation.has_conflict, grid), calls, number)),
+        ("has_conflict", "Board", per_call(partial(validation.has_conflict, board), calls, number)),
+        ("has_conflict", "ConflictTracker", per_call(tracker.has_conflict, calls, number)),
+        ("is_valid", "dawne pętle", per_call(partial(legacy_is_valid, grid, box), calls, number)),
+        ("is_valid", "SudokuGenerator", per_call(generator.is_valid, calls, number)),
+        ("is_valid", "Board", per_call(board.is_valid, calls, number)),
+    ]
+    baseline = {}
+    for name, variant, ns in results:
+        baseline.setdefault(name, ns)
+        print(f"{name:13} {variant:16} {ns:8.0f} ns/wywołanie  x{baseline[name] / ns:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Przepustowość wektorowego sprawdzania i rozwiązywania plansz (wymaga numpy).
+
+Uruchomienie: python benchmarks/bench_vectorized.py [--count 1000000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from sudoku_core import vectorized  # noqa: E402
+from sudoku_core.generator import SudokuGenerator  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=1_000_000, help="liczba plansz do sprawdzenia")
+    parser.add_argument("--solve-count", type=int, default=100_000, help="liczba plansz do rozwiązania")
+    args = parser.parse_args()
+
+    random.seed(0)
+    generators = [SudokuGenerator("trudny") for _ in range(200)]
+    puzzles = np.array([g.board for g in generators], dtype=np.uint8)
+    solutions = np.array([g.solution for g in generators], dtype=np.uint8)
+
+    boards = np.resize(solutions, (args.count, 9, 9))
+    for func in (vectorized.validate_boards, vectorized.conflict_masks, vectorized.candidate_masks):
+        start = time.perf_counter()
+        func(boards)
+        elapsed = time.perf_counter() - start
+        print(f"{func.__name__}: {args.count} plansz w {elapsed:.2f} s ({args.count / elapsed:,.0f} plansz/s)")
+
+    boards = np.resize(puzzles, (args.solve_count, 9, 9))
+    start = time.perf_counter()
+    _, solved = vectorized.solve_boards(boards)
+    elapsed = time.perf_counter() - start
+    print(f"solve_boards: {args.solve_count} plansz w {elapsed:.2f} s ({args.solve_count / elapsed:,.0f} plansz/s), "
+          f"rozwiązano {solved.sum()}")
+
+
+if __name__ == "__main__":
+    main()
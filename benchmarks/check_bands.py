@@ -0,0 +1,49 @@
+"""Sprawdza, czy plansze generatora trafiają w przedział oceny swojego poziomu.
+
+Dla każdego poziomu i rozmiaru generuje plansze z ziarnami 0..`--seeds`-1 i wypisuje
+ocenę, liczbę wskazówek i czas generowania. Kończy się kodem 1, jeśli któraś plansza
+wypadła poza przedział (`SudokuGenerator.in_band`), np. po zmianie
+`generator.MAX_NODES` albo sposobu wycinania liczb.
+
+Uruchomienie: python benchmarks/check_bands.py [--seeds 3] [--size 4 9 16 25]
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sudoku_core.generator import DIFFICULTY_BANDS, SudokuGenerator, difficulty_band  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seeds", type=int, default=3, help="liczba plansz na poziom i rozmiar")
+    parser.add_argument("--size", type=int, nargs="+", default=[4, 9, 16, 25], choices=[4, 9, 16, 25],
+                        help="rozmiary planszy")
+    args = parser.parse_args()
+
+    failed = 0
+    for size in args.size:
+        box_size = math.isqrt(size)
+        label = f"{size}x{size}"
+        for difficulty in DIFFICULTY_BANDS:
+            low, high = difficulty_band(difficulty, box_size)
+            for seed in range(args.seeds):
+                start = time.perf_counter()
+                generator = SudokuGenerator(difficulty, box_size, seed=seed)
+                elapsed = time.perf_counter() - start
+                clues = sum(1 for num in generator.board.cells if num)
+                status = "OK" if generator.in_band else "POZA PRZEDZIAŁEM"
+                print(f"{label:5} {difficulty:7} ziarno {seed}: ocena {generator.grade.rating} "
+                      f"(przedział {low}-{high}), wskazówki {clues}, {elapsed:.2f} s {status}", flush=True)
+                failed += not generator.in_band
+    if failed:
+        print(f"Plansze poza przedziałem: {failed}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
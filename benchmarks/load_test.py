@@ -0,0 +1,145 @@
+"""Test obciążeniowy serwera plansz (sudoku_core.server).
+
+Otwiera `--connections` równoczesnych połączeń HTTP/1.1 z utrzymywaniem połączenia
+i przez `--duration` sekund wysyła w każdym z nich kolejne żądania z wybranej
+mieszanki końcówek. Wypisuje liczbę żądań na sekundę oraz opóźnienia p50/p99
+dla każdej końcówki.
+
+Uruchomienie:
+    python benchmarks/load_test.py --spawn                  # uruchamia własny serwer
+    python benchmarks/load_test.py --port 8080 --mix puzzle solve validate
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import subprocess
+import sys
+import time
+from urllib.parse import urlencode
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_solver import load_puzzles  # noqa: E402
+
+from sudoku_core.codec import grid_to_string  # noqa: E402
+from sudoku_core.pool import DIFFICULTIES  # noqa: E402
+
+
+def build_requests(puzzles):
+    # Kilka trudnych plansz na przemian - część równoczesnych /solve trafia w tę samą planszę (łączenie żądań)
+    boards = [grid_to_string(grid) for grid in puzzles[:4]]
+    return {
+        "puzzle": lambda: ("GET", "/puzzle?" + urlencode({"difficulty": random.choice(DIFFICULTIES)}), None),
+        "solve": lambda: ("POST", "/solve", {"board": random.choice(boards)}),
+        "validate": lambda: ("POST", "/validate", {"board": random.choice(boards)}),
+    }
+
+
+async def request(reader, writer, host, method, path, payload):
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def client(host, port, makers, deadline, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            name = random.choice(list(makers))
+            start = time.perf_counter()
+            status = await request(reader, writer, host, *makers[name]())
+            latencies[name].append(time.perf_counter() - start)
+            if status != 200:
+                errors[name] = errors.get(name, 0) + 1
+    finally:
+        writer.close()
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+async def run(args):
+    puzzles = load_puzzles()
+    makers = {name: maker for name, maker in build_requests(puzzles).items() if name in args.mix}
+    latencies = {name: [] for name in makers}
+    errors = {}
+    start = time.perf_counter()
+    await asyncio.gather(*(client(args.host, args.port, makers, start + args.duration, latencies, errors)
+                           for _ in range(args.connections)))
+    elapsed = time.perf_counter() - start
+
+    total = sum(len(values) for values in latencies.values())
+    print(f"{total} żądań w {elapsed:.1f} s: {total / elapsed:.1f} żądań/s ({args.connections} połączeń)")
+    for name, values in latencies.items():
+        if values:
+            print(f"{name:10} {len(values):7} żądań   p50 {percentile(values, 0.50) * 1000:8.2f} ms"
+                  f"   p99 {percentile(values, 0.99) * 1000:8.2f} ms   błędy: {errors.get(name, 0)}")
+
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    try:
+        writer.write(f"GET /stats HTTP/1.1\r\nHost: {args.host}\r\nConnection: close\r\n\r\n".encode())
+        stats = json.loads((await reader.read()).partition(b"\r\n\r\n")[2])
+    finally:
+        writer.close()
+    print(f"Serwer: {stats['requests']} żądań, połączonych: {stats['coalesced']}, pula: {stats['pool']}")
+
+
+def wait_for_server(host, port, timeout=30):
+    async def probe():
+        deadline = time.perf_counter() + timeout
+        while True:
+            try:
+                _, writer = await asyncio.open_connection(host, port)
+                writer.close()
+                return
+            except OSError:
+                if time.perf_counter() > deadline:
+                    raise
+                await asyncio.sleep(0.1)
+    asyncio.run(probe())
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--connections", type=int, default=32, help="liczba równoczesnych połączeń")
+    parser.add_argument("--duration", type=float, default=10.0, help="czas trwania testu w sekundach")
+    parser.add_argument("--mix", nargs="+", choices=("puzzle", "solve", "validate"),
+                        default=["puzzle", "solve", "validate"], help="końcówki losowane w żądaniach")
+    parser.add_argument("--spawn", action="store_true", help="uruchom serwer w osobnym procesie na czas testu")
+    args = parser.parse_args()
+
+    server = None
+    if args.spawn:
+        server = subprocess.Popen([sys.executable, "-m", "sudoku", "serve", "--host", args.host,
+                                   "--port", str(args.port)], cwd=ROOT)
+        wait_for_server(args.host, args.port)
+    try:
+        asyncio.run(run(args))
+    finally:
+        if server is not None:
+            # SIGINT jak Ctrl+C - serwer zapisuje pulę przed zakończeniem
+            server.send_signal(signal.SIGINT)
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
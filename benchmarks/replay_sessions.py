@@ -0,0 +1,174 @@
+"""Odtwarzanie sesji graczy bez okna: opóźnienie obsługi każdej akcji i przyrost bazy zapisów.
+
+Sesje (sudoku_core.replay) pochodzą z pliku nagrań (`--input`, np. nagranego z
+SUDOKU_RECORD=sesje.jsonl) albo są generowane przez `synthetic_session` na planszach
+z `generate_by_id`. Każda akcja trafia do `Game.handle_events` jako zdarzenie pygame
+(kliknięcie w środek pola lub przycisku, klawisz), a zegar gry jest wirtualny, więc
+pauzy i namysł gracza nie wydłużają pomiaru. Mierzony jest czas `handle_events` razem
+z `draw_frame` (`--draw`) albo tylko sprawdzeniem wygranej.
+
+Uruchomienie: python benchmarks/replay_sessions.py [--sessions 1000] [--puzzles 20] [--draw]
+              python benchmarks/replay_sessions.py --input sesje.jsonl
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sudoku  # noqa: E402
+from sudoku_core.generator import generate_by_id, puzzle_id  # noqa: E402
+from sudoku_core.replay import read_sessions, synthetic_session, write_sessions  # noqa: E402
+
+PLAYERS = 100
+DIFFICULTIES = ("łatwy", "trudny")
+
+
+class VirtualClock:
+    # Podstawiany za `Game.now`; czas ustawia odtwarzana akcja
+    def __init__(self):
+        self.time = datetime(2024, 1, 1)
+
+    def __call__(self):
+        return self.time
+
+
+def synthetic_sessions(count, puzzles, seed):
+    rng = random.Random(seed)
+    grids = [generate_by_id(puzzle_id(DIFFICULTIES[i % 2], seed * puzzles + i)) for i in range(puzzles)]
+    for i in range(count):
+        board, solution = grids[i % puzzles]
+        yield synthetic_session(rng, f"gracz{rng.randrange(PLAYERS)}", DIFFICULTIES[i % puzzles % 2], board,
+                                solution)
+
+
+# sudoku.pygame jest ustawiane dopiero przy tworzeniu okna gry (init_pygame)
+def click(pos):
+    pygame = sudoku.pygame
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)
+
+
+def key(key, unicode="", mod=0):
+    pygame = sudoku.pygame
+    return pygame.event.Event(pygame.KEYDOWN, key=key, unicode=unicode, mod=mod)
+
+
+def action_event(game, name, args):
+    pygame = sudoku.pygame
+    if name == "select":
+        return click(game.cell_rect(*args).center)
+    if name == "key":
+        return key(ord(args[0].lower()), args[0])
+    if name == "clear":
+        return key(pygame.K_BACKSPACE)
+    if name in ("undo", "redo"):
+        return key(pygame.K_z if name == "undo" else pygame.K_y, mod=pygame.KMOD_CTRL)
+    button = {"pause": game.pause_button, "resume": game.return_button, "save": game.save_pause_button,
+              "hint": game.hint_button}[name]
+    return click(button.rect.center)
+
+
+def replay(game, clock, session, draw, latencies):
+    """Odtwarza sesję; zwraca (czy rozwiązana, wirtualny czas sesji w sekundach)."""
+    game.player_name = session.player
+    game.difficulty = session.difficulty
+    game.new_game(session.puzzle())
+    game.state = "game"
+    game.start_time = clock()
+    start = clock.time
+    for seconds, name, *args in session.actions:
+        clock.time = start + timedelta(seconds=seconds)
+        if not draw:
+            # Bez rysowania czas gry (zapisywany w save_game) nie jest odświeżany przez draw_game_screen
+            game.elapsed_time = game.current_elapsed()
+        event = action_event(game, name, args)
+        started = time.perf_counter()
+        game.handle_events([event])
+        if draw:
+            game.draw_frame()
+        else:
+            game.update_win()
+        latencies[name].append(time.perf_counter() - started)
+        if game.state == "end":
+            break
+    return game.state == "end", session.duration
+
+
+def database_size(store):
+    # Rozmiar bazy po przeniesieniu dziennika WAL do pliku bazy - bez tego wynik zależy od tego,
+    # kiedy SQLite ostatnio wykonał automatyczny punkt kontrolny (co ~4 MB dziennika)
+    store.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    return store.file_size()
+
+
+def percentile(values, fraction):
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--input", help="plik nagrań JSON Lines zamiast sesji syntetycznych")
+    parser.add_argument("--sessions", type=int, default=1000, help="liczba sesji syntetycznych")
+    parser.add_argument("--puzzles", type=int, default=20, help="liczba różnych plansz w sesjach syntetycznych")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--draw", action="store_true", help="rysuj klatkę po każdej akcji")
+    parser.add_argument("--save-sessions", help="zapisz sesje syntetyczne do pliku JSON Lines")
+    args = parser.parse_args()
+
+    if args.input:
+        sessions = list(read_sessions(args.input))
+    else:
+        sessions = list(synthetic_sessions(args.sessions, args.puzzles, args.seed))
+        if args.save_sessions:
+            write_sessions(args.save_sessions, sessions)
+
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        # Gra zakłada bazę zapisów i plik puli w katalogu roboczym
+        os.chdir(directory)
+        game = sudoku.Game()
+        clock = game.now = VirtualClock()
+        try:
+            latencies = defaultdict(list)
+            initial_size = database_size(game.save_store)
+            solved = 0
+            virtual = 0.0
+            start = time.perf_counter()
+            for session in sessions:
+                won, seconds = replay(game, clock, session, args.draw, latencies)
+                solved += won
+                virtual += seconds
+            wall = time.perf_counter() - start
+            final_size = database_size(game.save_store)
+        finally:
+            game.puzzle_pool.close()
+            game.pool_executor.shutdown(cancel_futures=True)
+            game.save_store.close()
+            game.results.close()
+            os.chdir(previous)
+
+    actions = sum(len(values) for values in latencies.values())
+    print(f"Sesje: {len(sessions)} (rozwiązane {solved}), akcje: {actions}, "
+          f"{'z rysowaniem' if args.draw else 'bez rysowania'}")
+    print(f"{'akcja':8} {'liczba':>8} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for name, values in sorted(latencies.items(), key=lambda item: -len(item[1])):
+        values.sort()
+        print(f"{name:8} {len(values):8} {percentile(values, 0.5) * 1000:8.3f} {percentile(values, 0.99) * 1000:8.3f} "
+              f"{values[-1] * 1000:8.3f}")
+    saves = len(latencies["save"])
+    growth = final_size - initial_size
+    print(f"Baza zapisów: {initial_size} -> {final_size} B, {saves} zapisów, "
+          f"{growth / saves if saves else 0:.0f} B/zapis")
+    print(f"Czas gry {virtual / 3600:.1f} h odtworzony w {wall:.1f} s (x{virtual / wall if wall else 0:.0f})")
+
+
+if __name__ == "__main__":
+    main()
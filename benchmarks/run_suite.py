@@ -0,0 +1,220 @@
+"""Zestaw benchmarków zapisujący wyniki do JSON, do porównywania między commitami.
+
+Mierzy: generowanie plansz dla każdego poziomu, rozwiązywanie trudnych plansz,
+sprawdzanie konfliktów i wygranej w jednej klatce, zapis i odczyt w bazie z 1 tys.
+i 100 tys. zapisów oraz rysowanie ekranu gry bez okna (sterownik SDL "dummy").
+
+Uruchomienie:
+    python benchmarks/run_suite.py --output wyniki.json
+    python benchmarks/run_suite.py --output nowe.json --compare wyniki.json
+Zapisy mierzone są w wersji pełnej i przyrostowej (same nowe ruchy). Opcja --only wybiera
+grupy (generate, solve, conflicts, saves, render).
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+from datetime import datetime
+
+# Rysowanie bez okna - musi być ustawione przed importem pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_solver import load_puzzles  # noqa: E402
+
+from sudoku_core import validation  # noqa: E402
+from sudoku_core.conflicts import ConflictTracker  # noqa: E402
+from sudoku_core.generator import BACKENDS, SudokuGenerator  # noqa: E402
+from sudoku_core.moves import pack_moves  # noqa: E402
+from sudoku_core.pool import DIFFICULTIES  # noqa: E402
+from sudoku_core.saves import SaveStore, make_save  # noqa: E402
+
+SAVE_SIZES = (1_000, 100_000)
+PLAYERS = 100
+THRESHOLD = 0.10  # Spowolnienie o ponad 10% jest zgłaszane jako regresja
+
+
+def bench_generate():
+    for difficulty in DIFFICULTIES:
+        random.seed(0)
+        yield f"generate/{difficulty}", lambda: SudokuGenerator(difficulty)
+
+
+def bench_solve():
+    puzzles = load_puzzles()
+    for backend, (solve, _) in BACKENDS.items():
+        yield f"solve/{backend}/hard_set", lambda: [solve(grid) for grid in puzzles]
+
+
+def bench_conflicts():
+    random.seed(0)
+    generator = SudokuGenerator("trudny")
+    board = generator.board.copy()
+    grid, solution = board.to_grid(), generator.solution.to_grid()
+    tracker = ConflictTracker(board)
+    cells = [(row, col) for row in range(9) for col in range(9)]
+
+    # Jedna klatka: sprawdzenie wygranej i konfliktu wpisu w każdej komórce
+    yield "conflicts/tracker/frame", lambda: (tracker.is_solved(), [tracker.has_conflict(r, c, 5) for r, c in cells])
+    yield "conflicts/scan/frame", lambda: (validation.is_solved(grid, solution),
+                                          [validation.has_conflict(grid, r, c, 5) for r, c in cells])
+    # To samo na płaskim buforze `Board` przez tablicę sąsiadów pola
+    yield "conflicts/board/frame", lambda: (board.is_full(), [not board.is_valid(r, c, 5) for r, c in cells])
+    row, col = next(cell for cell in cells if not board.get(*cell))
+    yield "conflicts/tracker/set", lambda: (tracker.set(row, col, 5), tracker.set(row, col, 0))
+
+
+def bench_saves():
+    random.seed(0)
+    generator = SudokuGenerator("łatwy")
+    save = make_save("gracz0", "łatwy", generator.board, generator.solution, generator.board, 0, 3)
+    with tempfile.TemporaryDirectory() as directory:
+        for size in SAVE_SIZES:
+            store = SaveStore(os.path.join(directory, f"saves_{size}.db"))
+            try:
+                store.append_many({**save, "player": f"gracz{i % PLAYERS}"} for i in range(size))
+                yield f"saves/{size}/save", lambda: store.append(save)
+                yield f"saves/{size}/load", lambda: store.latest("gracz0")
+                # Zapis przyrostowy kilku ruchów zamiast całej planszy (po pomiarze odczytu - wydłuża łańcuch)
+                base = store.append(save)
+                moves = pack_moves((i, 0, 5, float(i)) for i in range(5))
+                yield f"saves/{size}/save_delta", lambda: store.append_delta(base, save, moves)
+            finally:
+                store.close()
+
+
+def bench_render():
+    import sudoku
+    from sudoku_core.pool import generate_puzzle
+
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        # Gra zakłada bazę zapisów i plik puli w katalogu roboczym
+        os.chdir(directory)
+        random.seed(0)
+        game = sudoku.Game()
+        try:
+            game.new_game(generate_puzzle("łatwy"))
+            game.player_name = "gracz"
+            game.state = "game"
+            game.draw_game_screen()
+            empty = [divmod(i, game.grid_size) for i, num in enumerate(game.board.cells) if not num]
+
+            def full_frame():
+                game.full_redraw = True
+                game.draw_game_screen()
+
+            def cell_frame():
+                row, col = random.choice(empty)
+                game.set_cell(row, col, random.randint(0, 9))
+                game.draw_game_screen()
+                game.check_win()
+
+            yield "render/full_frame", full_frame
+            yield "render/cell_frame", cell_frame
+            yield "render/idle_frame", game.draw_game_screen
+        finally:
+            game.puzzle_pool.close()
+            game.pool_executor.shutdown(cancel_futures=True)
+            game.save_store.close()
+            sudoku.pygame.quit()
+            os.chdir(previous)
+
+
+GROUPS = {
+    "generate": bench_generate,
+    "solve": bench_solve,
+    "conflicts": bench_conflicts,
+    "saves": bench_saves,
+    "render": bench_render,
+}
+
+
+def measure(func, repeat):
+    # Liczba wywołań w serii dobrana tak, żeby seria trwała co najmniej 0,2 s
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    times = [elapsed / number for elapsed in timer.repeat(repeat, number)]
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.mean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "rounds": repeat,
+        "number": number,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def format_time(seconds):
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} µs"
+
+
+def compare(results, path, threshold):
+    # Zwraca liczbę regresji względem wcześniejszego pliku wyników
+    with open(path) as f:
+        previous = json.load(f)["results"]
+    regressions = 0
+    for name, stats in results.items():
+        if name not in previous:
+            continue
+        old, new = previous[name]["median"], stats["median"]
+        change = new / old - 1
+        regression = change > threshold
+        regressions += regression
+        print(f"{name:32} {format_time(old):>12} -> {format_time(new):>12} {change:+7.1%}"
+              f"{'  REGRESJA' if regression else ''}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--output", default="benchmark_results.json", help="plik wyników JSON")
+    parser.add_argument("--only", nargs="+", choices=GROUPS, default=list(GROUPS), help="grupy do uruchomienia")
+    parser.add_argument("--repeat", type=int, default=5, help="liczba serii pomiarowych")
+    parser.add_argument("--compare", help="wcześniejszy plik wyników do porównania")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="próg regresji (ułamek mediany)")
+    args = parser.parse_args()
+
+    results = {}
+    for group in args.only:
+        for name, func in GROUPS[group]():
+            results[name] = measure(func, args.repeat)
+            print(f"{name:32} mediana {format_time(results[name]['median']):>12}", flush=True)
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wyniki zapisano w {args.output}")
+
+    if args.compare:
+        return 1 if compare(results, args.compare, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
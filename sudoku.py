@@ -1,21 +1,36 @@
-import pygame
+import math
+import os
 import sys
-import json
-import random
+import time
 from datetime import datetime, timedelta
 
-# Inicjalizacja Pygame
-pygame.init()
-pygame.font.init()
+from sudoku_core.board import Board
+from sudoku_core.codec import grid_to_string
+from sudoku_core.conflicts import ConflictTracker
+from sudoku_core.frames import FrameStats
+from sudoku_core.hints import HintEngine
+from sudoku_core.moves import MoveLog, pack_moves
+from sudoku_core.pool import POOL_FILE, PuzzlePool
+from sudoku_core.profiling import PROFILE_ENV, profiler
+from sudoku_core.replay import RECORD_ENV, SessionRecorder
+from sudoku_core.results import ResultStore
+from sudoku_core.saves import DEFAULT_HINT_COUNT, FULL_SAVE_EVERY, SaveStore, make_save, migrate_json
+from sudoku_core.solver import SYMBOLS
+from sudoku_core.units import BOX_SIZE, BOX_SIZES
+
+# Pygame jest importowany dopiero przy tworzeniu okna gry (init_pygame)
+pygame = None
 
 # Stałe
 SCREEN_WIDTH, SCREEN_HEIGHT = 1000, 800
-GRID_SIZE = 9
-CELL_SIZE = 50
+CELL_SIZE = 50  # Rozmiar odniesienia dla czcionki; faktyczny rozmiar pola zależy od okna
 GRID_PADDING = 50
 BUTTON_WIDTH, BUTTON_HEIGHT = 150, 50
 FONT_SIZE = 36
 SMALL_FONT_SIZE = 24
+FPS = 60  # Górny limit klatek na sekundę
+LOADING_POLL_MS = 100  # Co ile ekran ładowania sprawdza, czy pula ma już planszę
+INPUT_POLL_MS = 1000 // FPS  # Co ile bezczynna pętla sprawdza kolejkę zdarzeń (jedna klatka przy limicie FPS)
 
 # Kolory
 WHITE = (255, 255, 255)
@@ -31,74 +46,20 @@ CONFLICT_COLOR = (255, 100, 100)
 PAUSE_OVERLAY = (0, 0, 0, 150)
 
 
-class SudokuGenerator:
-    def __init__(self, difficulty):
-        self.difficulty = difficulty
-        self.board = [[0 for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
-        self.solution = [[0 for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
-        self.generate_complete_board()
-        self.remove_numbers()
-
-    def generate_complete_board(self):
-        # Wypełnij przekątną 3x3
-        self.fill_diagonal()
-
-        # Rozwiąż resztę planszy
-        self.solve_sudoku()
-        self.solution = [row[:] for row in self.board]
-
-    def fill_diagonal(self):
-        for i in range(0, GRID_SIZE, 3):
-            nums = list(range(1, 10))
-            random.shuffle(nums)
-            for r in range(3):
-                for c in range(3):
-                    self.board[i + r][i + c] = nums.pop()
-
-    def is_valid(self, row, col, num):
-        # Sprawdź wiersz
-        if num in self.board[row]:
-            return False
-
-        # Sprawdź kolumnę
-        for r in range(GRID_SIZE):
-            if self.board[r][col] == num:
-                return False
-
-        # Sprawdź kwadrat 3x3
-        start_row, start_col = 3 * (row // 3), 3 * (col // 3)
-        for r in range(3):
-            for c in range(3):
-                if self.board[start_row + r][start_col + c] == num:
-                    return False
-
-        return True
-
-    def solve_sudoku(self):
-        for row in range(GRID_SIZE):
-            for col in range(GRID_SIZE):
-                if self.board[row][col] == 0:
-                    for num in range(1, 10):
-                        if self.is_valid(row, col, num):
-                            self.board[row][col] = num
-                            if self.solve_sudoku():
-                                return True
-                            self.board[row][col] = 0
-                    return False
-        return True
-
-    def remove_numbers(self):
-        if self.difficulty == "łatwy":
-            to_remove = 30
-        else:  # trudny
-            to_remove = 50
+def init_pygame():
+    global pygame
+    if pygame is None:
+        import pygame as pygame_module
+        pygame = pygame_module
+    pygame.init()
+    pygame.font.init()
 
-        cells = [(r, c) for r in range(GRID_SIZE) for c in range(GRID_SIZE)]
-        random.shuffle(cells)
 
-        for i in range(to_remove):
-            row, col = cells[i]
-            self.board[row][col] = 0
+def render_text(font, text, color):
+    # Wszystkie napisy gry przechodzą tędy, żeby licznik renderowań obejmował całą klatkę
+    if profiler.enabled:
+        profiler.count("font.render")
+    return font.render(text, True, color)
 
 
 class Button:
@@ -114,7 +75,7 @@ class Button:
         pygame.draw.rect(screen, self.current_color, self.rect, border_radius=10)
         pygame.draw.rect(screen, BLACK, self.rect, 2, border_radius=10)
 
-        text_surf = self.font.render(self.text, True, BLACK)
+        text_surf = render_text(self.font, self.text, BLACK)
         text_rect = text_surf.get_rect(center=self.rect.center)
         screen.blit(text_surf, text_rect)
 
@@ -132,13 +93,22 @@ class Button:
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, event_driven=True):
+        # Inicjalizacja Pygame dopiero przy tworzeniu okna gry
+        init_pygame()
+
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
         pygame.display.set_caption("Sudoku")
         self.clock = pygame.time.Clock()
+        # Zegar gry; benchmarks/replay_sessions.py podmienia go na zegar wirtualny
+        self.now = datetime.now
+        self.recorder = None  # SessionRecorder, gdy nagrywanie jest włączone (SUDOKU_RECORD)
         self.state = "start"
         self.player_name = ""
         self.difficulty = "łatwy"
+        self.box_size = BOX_SIZE
+        self.grid_size = BOX_SIZE * BOX_SIZE
+        self.cell_size = CELL_SIZE
         self.selected_cell = None
         self.start_time = None
         self.elapsed_time = 0
@@ -146,6 +116,25 @@ class Game:
         self.small_font = pygame.font.SysFont(None, SMALL_FONT_SIZE)
         self.hint_count = 3  # Liczba dostępnych wskazówek
 
+        # Renderowanie przyrostowe: gotowe glify cyfr, statyczne tło i lista zmienionych komórek
+        self.glyph_cache = {}
+        self.cell_font = None
+        self.background = None
+        self.dirty_cells = set()
+        self.full_redraw = True
+        self.drawn_state = None
+        self.drawn_buttons = {}
+        self.time_rect = None
+
+        # Pętla sterowana zdarzeniami: bez wejścia i zmiany zegara nic nie jest rysowane (F3 - koszt klatek,
+        # F4 - liczniki sudoku_core.profiling)
+        self.event_driven = event_driven
+        self.frame_stats = FrameStats()
+        self.show_frame_stats = False
+        self.show_profile = False
+        self.stats_dirty = False
+        self.stats_rect = None
+
         # Pause tracking
         self.is_paused = False
         self.pause_start_time = None
@@ -159,6 +148,8 @@ class Game:
                                   "Łatwy", LIGHT_BLUE, (135, 206, 250))
         self.hard_button = Button(SCREEN_WIDTH // 2 + 10, button_y + 70, BUTTON_WIDTH, BUTTON_HEIGHT,
                                   "Trudny", RED, (255, 160, 122))
+        self.size_button = Button(SCREEN_WIDTH // 2 + 10, button_y + 70, BUTTON_WIDTH, BUTTON_HEIGHT,
+                                  self.size_label(), LIGHT_BLUE, (135, 206, 250))
         self.back_button = Button(SCREEN_WIDTH // 2 - BUTTON_WIDTH - 10, SCREEN_HEIGHT - 70, BUTTON_WIDTH,
                                   BUTTON_HEIGHT,
                                   "Powrót", GRAY, (220, 220, 220))
@@ -182,14 +173,48 @@ class Game:
                                   BUTTON_HEIGHT,
                                   "Menu", RED, (255, 160, 122))
 
-        # Generowanie planszy
-        self.new_game()
-
-    def new_game(self):
-        self.generator = SudokuGenerator(self.difficulty)
-        self.board = [row[:] for row in self.generator.board]
-        self.solution = [row[:] for row in self.generator.solution]
-        self.start_time = datetime.now()
+        # Zapisy gry; dawny plik JSON jest jednorazowo przenoszony do bazy
+        self.save_store = SaveStore()
+        migrate_json(self.save_store)
+        # Wyniki wygranych partii i tabela najlepszych czasów na ekranie końcowym
+        self.results = ResultStore()
+
+        # Pula gotowych plansz uzupełniana w osobnym procesie, żeby "Nowa Gra" nie blokowała pętli;
+        # moduły procesów są importowane dopiero tutaj, jak pygame w init_pygame (budżet importu)
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        self.pool_executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+        self.puzzle_pool = PuzzlePool(path=POOL_FILE, executor=self.pool_executor)
+        self.puzzle_pool.start()
+
+        # Plansza powstaje dopiero po "Nowa Gra" lub "Kontynuuj" - ekran startowy nie zużywa planszy z puli
+        self.board = self.givens = self.solution = None
+
+    def start_game(self):
+        # "Nowa Gra": plansza z puli bez czekania; przy pustej kolejce ekran ładowania ponawia próbę co klatkę
+        puzzle = self.puzzle_pool.pop(self.difficulty, self.box_size)
+        if puzzle is None:
+            self.state = "loading"
+            return
+        self.new_game(puzzle)
+        self.state = "game"
+        self.start_time = self.now()
+        if self.recorder:
+            self.recorder.start(self.start_time, self.player_name, self.difficulty, self.givens, self.solution)
+
+    def new_game(self, puzzle):
+        # `puzzle` to (plansza, rozwiązanie) - z puli albo np. z odtwarzanego nagrania
+        board, solution = puzzle
+        self.grid_size = len(board)
+        self.givens = Board.from_grid(board)
+        self.board = self.givens.copy()
+        self.solution = Board.from_grid(solution)
+        self.conflicts = ConflictTracker(self.board)
+        self.hints = HintEngine(self.board)
+        self.hint_message = ""
+        self.reset_moves()
+        self.start_time = self.now()
         self.elapsed_time = 0
         self.selected_cell = None
         self.hint_count = 3
@@ -197,85 +222,138 @@ class Game:
         self.is_paused = False
         self.pause_duration = 0
         self.pause_start_time = None
+        self.background = None  # Rozmiar pól zależy od rozmiaru planszy
+        self.full_redraw = True
+
+    def size_label(self):
+        return f"Rozmiar: {self.grid_size}x{self.grid_size}"
+
+    def next_size(self):
+        # Przełącza rozmiar planszy po kolei: 4x4, 9x9, 16x16, 25x25
+        self.box_size = BOX_SIZES[(BOX_SIZES.index(self.box_size) + 1) % len(BOX_SIZES)]
+        self.grid_size = self.box_size * self.box_size
+        self.size_button.text = self.size_label()
+        self.puzzle_pool.prefetch(self.difficulty, self.box_size)
+
+    def reset_moves(self):
+        # Nowa partia: pusty dziennik ruchów, a pierwszy zapis będzie pełny
+        self.moves = MoveLog(self.board)
+        self.save_base = None
+        self.save_chain = 0
+
+    def set_cell(self, row, col, num, record=True):
+        if record:
+            self.moves.record(row, col, self.board.get(row, col), num, self.current_elapsed())
+        # Przerysowania wymagają tylko komórki, których stan konfliktu mógł się zmienić
+        self.dirty_cells.update(self.conflicts.set(row, col, num))
+        self.hints.set(row, col, num)
+
+    def undo(self):
+        move = self.moves.undo()
+        if move:
+            self.set_cell(*move, record=False)
+
+    def redo(self):
+        move = self.moves.redo()
+        if move:
+            self.set_cell(*move, record=False)
+
+    def select_cell(self, cell):
+        if self.selected_cell:
+            self.dirty_cells.add(self.selected_cell)
+        self.selected_cell = cell
+        if cell:
+            self.dirty_cells.add(cell)
 
     def has_conflict(self, row, col, num):
-        # Check row
-        for c in range(GRID_SIZE):
-            if c != col and self.board[row][c] == num:
-                return True
-
-        # Check column
-        for r in range(GRID_SIZE):
-            if r != row and self.board[r][col] == num:
-                return True
-
-        start_row, start_col = 3 * (row // 3), 3 * (col // 3)
-        for r in range(3):
-            for c in range(3):
-                box_row = start_row + r
-                box_col = start_col + c
-                if (box_row != row or box_col != col) and self.board[box_row][box_col] == num:
-                    return True
+        return self.conflicts.has_conflict(row, col, num)
 
-        return False
-
-    def draw_grid(self, start_x, start_y):
-        grid_width = GRID_SIZE * CELL_SIZE
+    def grid_origin(self):
+        grid_width = self.grid_size * self.cell_size
         start_x = (self.screen.get_width() - grid_width) // 2
         start_y = (self.screen.get_height() - grid_width) // 2 - 30
-
-        # Rysowanie komórek
-        for row in range(GRID_SIZE):
-            for col in range(GRID_SIZE):
-                cell_rect = pygame.Rect(
-                    start_x + col * CELL_SIZE,
-                    start_y + row * CELL_SIZE,
-                    CELL_SIZE,
-                    CELL_SIZE
-                )
-
-                # Kolorowanie zaznaczonej komórki
-                if self.selected_cell == (row, col):
-                    pygame.draw.rect(self.screen, LIGHT_BLUE, cell_rect)
-                elif (row // 3 + col // 3) % 2 == 0:
-                    pygame.draw.rect(self.screen, (240, 240, 240), cell_rect)
-                else:
-                    pygame.draw.rect(self.screen, WHITE, cell_rect)
-
-                pygame.draw.rect(self.screen, GRAY, cell_rect, 1)
-
-                # Rysowanie liczb
-                if self.board[row][col] != 0:
-                    # Original numbers are black
-                    if self.generator.board[row][col] != 0:
-                        text_color = BLACK
-                    else:
-                        if self.has_conflict(row, col, self.board[row][col]):
-                            text_color = CONFLICT_COLOR
-                        else:
-                            text_color = DARK_BLUE
-
-                    num = self.board[row][col]
-                    text_surf = self.font.render(str(num), True, text_color)
-                    text_rect = text_surf.get_rect(center=cell_rect.center)
-                    self.screen.blit(text_surf, text_rect)
-
-        for i in range(0, GRID_SIZE + 1):
-            if i % 3 == 0:
-                pygame.draw.line(
-                    self.screen,
-                    BLACK,
-                    (start_x, start_y + i * CELL_SIZE),
-                    (start_x + grid_width, start_y + i * CELL_SIZE),
-                    3
-                )
-                pygame.draw.line(
-                    self.screen,
-                    BLACK,
-                    (start_x + i * CELL_SIZE, start_y),
-                    (start_x + i * CELL_SIZE, start_y + grid_width),
-                    3
-                )
+        return start_x, start_y
+
+    def cell_rect(self, row, col):
+        start_x, start_y = self.grid_origin()
+        size = self.cell_size
+        return pygame.Rect(start_x + col * size, start_y + row * size, size, size)
+
+    def glyph(self, num, color):
+        # Każda para (cyfra, kolor) jest renderowana czcionką tylko raz
+        surf = self.glyph_cache.get((num, color))
+        if surf is None:
+            surf = self.glyph_cache[(num, color)] = render_text(self.cell_font, SYMBOLS[num - 1], color)
+        return surf
+
+    def build_background(self):
+        # Statyczna część ekranu gry: tło, kolory kwadratów i linie siatki
+        self.background = pygame.Surface(self.screen.get_size())
+        self.background.fill(WHITE)
+
+        # Pola dopasowane do okna: marginesy na czas u góry i przyciski pod planszą
+        width, height = self.screen.get_size()
+        cell_size = max(min(width - 2 * GRID_PADDING, height - 4 * GRID_PADDING) // self.grid_size, 1)
+        if cell_size != self.cell_size or self.cell_font is None:
+            self.cell_size = cell_size
+            self.cell_font = pygame.font.SysFont(None, FONT_SIZE * cell_size // CELL_SIZE)
+            self.glyph_cache.clear()
+
+        box = self.box_size
+        grid_width = self.grid_size * self.cell_size
+        start_x, start_y = self.grid_origin()
+        for row in range(self.grid_size):
+            for col in range(self.grid_size):
+                cell_rect = self.cell_rect(row, col)
+                if (row // box + col // box) % 2 == 0:
+                    pygame.draw.rect(self.background, (240, 240, 240), cell_rect)
+                pygame.draw.rect(self.background, GRAY, cell_rect, 1)
+
+        for i in range(0, self.grid_size + 1, box):
+            pygame.draw.line(self.background, BLACK, (start_x, start_y + i * self.cell_size),
+                             (start_x + grid_width, start_y + i * self.cell_size), 3)
+            pygame.draw.line(self.background, BLACK, (start_x + i * self.cell_size, start_y),
+                             (start_x + i * self.cell_size, start_y + grid_width), 3)
+
+    def draw_cell(self, row, col):
+        cell_rect = self.cell_rect(row, col)
+        self.screen.blit(self.background, cell_rect, cell_rect)
+
+        # Kolorowanie zaznaczonej komórki (wewnątrz linii siatki, które są już w tle)
+        if self.selected_cell == (row, col):
+            pygame.draw.rect(self.screen, LIGHT_BLUE, cell_rect.inflate(-4, -4))
+
+        # Rysowanie liczb
+        num = self.board.get(row, col)
+        if num != 0:
+            # Original numbers are black
+            if self.givens.get(row, col) != 0:
+                text_color = BLACK
+            elif (row, col) in self.conflicts.cells:
+                text_color = CONFLICT_COLOR
+            else:
+                text_color = DARK_BLUE
+
+            text_surf = self.glyph(num, text_color)
+            self.screen.blit(text_surf, text_surf.get_rect(center=cell_rect.center))
+        return cell_rect
+
+    def draw_grid(self):
+        # Rysuje tylko komórki zmienione od poprzedniej klatki i zwraca ich prostokąty
+        if profiler.enabled:
+            profiler.count("cells", len(self.dirty_cells))
+        rects = [self.draw_cell(row, col) for row, col in self.dirty_cells]
+        self.dirty_cells.clear()
+        return rects
+
+    def draw_button(self, button):
+        # Przycisk jest przerysowywany tylko po zmianie koloru (hover) lub tekstu
+        if self.drawn_buttons.get(button) == (button.current_color, button.text, button.rect.topleft):
+            return None
+        self.screen.blit(self.background, button.rect, button.rect)
+        button.draw(self.screen)
+        self.drawn_buttons[button] = (button.current_color, button.text, button.rect.topleft)
+        return button.rect.copy()
 
     def draw_start_screen(self):
         self.screen.fill(LIGHT_BLUE)
@@ -284,7 +362,7 @@ class Game:
 
         # Title
         title_font = pygame.font.SysFont(None, FONT_SIZE + 20)
-        title = title_font.render("SUDOKU", True, DARK_BLUE)
+        title = render_text(title_font, "SUDOKU", DARK_BLUE)
         title_rect = title.get_rect(center=(center_x, self.screen.get_height() // 4))
         self.screen.blit(title, title_rect)
 
@@ -292,7 +370,7 @@ class Game:
         current_y = self.screen.get_height() // 2 - 80
 
         # Player name field
-        name_text = self.small_font.render("Nazwa gracza:", True, BLACK)
+        name_text = render_text(self.small_font, "Nazwa gracza:", BLACK)
         name_rect = name_text.get_rect(center=(center_x, current_y))
         self.screen.blit(name_text, name_rect)
         current_y += vertical_spacing
@@ -300,7 +378,7 @@ class Game:
         # Player name input box
         pygame.draw.rect(self.screen, WHITE, (center_x - 150, current_y - 20, 300, 40))
         pygame.draw.rect(self.screen, BLACK, (center_x - 150, current_y - 20, 300, 40), 2)
-        player_surf = self.font.render(self.player_name, True, BLACK)
+        player_surf = render_text(self.font, self.player_name, BLACK)
         self.screen.blit(player_surf, (center_x - 140, current_y - 15))
         current_y += vertical_spacing
 
@@ -314,7 +392,7 @@ class Game:
         current_y += vertical_spacing
 
         # Difficulty selection
-        level_text = self.small_font.render("Wybierz poziom trudności:", True, BLACK)
+        level_text = render_text(self.small_font, "Wybierz poziom trudności:", BLACK)
         level_rect = level_text.get_rect(center=(center_x, current_y))
         self.screen.blit(level_text, level_rect)
         current_y += vertical_spacing
@@ -328,41 +406,122 @@ class Game:
         self.hard_button.draw(self.screen)
         current_y += vertical_spacing
 
+        # Wybór rozmiaru planszy obok przycisków poziomu
+        self.size_button.text = self.size_label()
+        self.size_button.rect.center = (center_x + BUTTON_WIDTH + 20, current_y - 2 * vertical_spacing)
+        self.size_button.draw(self.screen)
+
         # Current difficulty display
-        diff_text = self.small_font.render(f"Aktualny: {self.difficulty.capitalize()}", True, BLACK)
+        diff_text = render_text(self.small_font, f"Aktualny: {self.difficulty.capitalize()}", BLACK)
         diff_rect = diff_text.get_rect(center=(center_x, current_y))
         self.screen.blit(diff_text, diff_rect)
 
-    def draw_game_screen(self):
-        self.screen.fill(WHITE)
-
+    def current_elapsed(self):
         if self.start_time and not self.is_paused:
-            base_time = datetime.now() - timedelta(seconds=self.pause_duration)
-            self.elapsed_time = (base_time - self.start_time).seconds
+            base_time = self.now() - timedelta(seconds=self.pause_duration)
+            return (base_time - self.start_time).seconds
+        return self.elapsed_time
 
-        # Czas gry
-        time_text = self.small_font.render(f"Czas: {self.elapsed_time // 60}:{self.elapsed_time % 60:02d}", True, BLACK)
-        self.screen.blit(time_text, (20, 20))
-
-        # Nazwa gracza i poziom
-        info_text = self.small_font.render(f"Gracz: {self.player_name} | Poziom: {self.difficulty}", True, BLACK)
-        self.screen.blit(info_text, (self.screen.get_width() - info_text.get_width() - 20, 20))
-
-        grid_width = GRID_SIZE * CELL_SIZE
-        grid_height = GRID_SIZE * CELL_SIZE
-        start_x = (self.screen.get_width() - grid_width) // 2
-        start_y = (self.screen.get_height() - grid_height - 100) // 2
-
-        self.draw_grid(start_x, start_y)
-
-        button_y = start_y + grid_height + 60
+    def draw_game_screen(self):
+        # Zwraca listę zmienionych prostokątów albo None, gdy przerysowano cały ekran
+        elapsed_time = self.current_elapsed()
+
+        full = self.full_redraw
+        if self.background is None or self.background.get_size() != self.screen.get_size():
+            self.build_background()
+            full = True
+
+        rects = []
+        if full:
+            self.screen.blit(self.background, (0, 0))
+            self.dirty_cells.update((row, col) for row in range(self.grid_size) for col in range(self.grid_size))
+            self.drawn_buttons.clear()
+
+            # Nazwa gracza i poziom
+            info_text = render_text(self.small_font, f"Gracz: {self.player_name} | Poziom: {self.difficulty}", BLACK)
+            self.screen.blit(info_text, (self.screen.get_width() - info_text.get_width() - 20, 20))
+
+        # Czas gry (przerysowywany raz na sekundę)
+        if full or elapsed_time != self.elapsed_time or self.time_rect is None:
+            self.elapsed_time = elapsed_time
+            time_text = render_text(self.small_font, f"Czas: {self.elapsed_time // 60}:{self.elapsed_time % 60:02d}",
+                                    BLACK)
+            time_rect = time_text.get_rect(topleft=(20, 20))
+            dirty_rect = time_rect.union(self.time_rect) if self.time_rect else time_rect
+            self.screen.blit(self.background, dirty_rect, dirty_rect)
+            self.screen.blit(time_text, time_rect)
+            self.time_rect = time_rect
+            rects.append(dirty_rect)
+
+        rects.extend(self.draw_grid())
+
+        start_x, start_y = self.grid_origin()
+        button_y = start_y + self.grid_size * self.cell_size + 40
         center_x = self.screen.get_width() // 2
 
         self.pause_button.rect.center = (center_x - BUTTON_WIDTH // 2 - 10, button_y)
         self.hint_button.rect.center = (center_x + BUTTON_WIDTH // 2 + 10, button_y)
 
-        self.pause_button.draw(self.screen)
-        self.hint_button.draw(self.screen)
+        for button in (self.pause_button, self.hint_button):
+            rect = self.draw_button(button)
+            if rect:
+                rects.append(rect)
+
+        if full and self.hint_message:
+            self.draw_hint_message()
+
+        self.full_redraw = False
+        return None if full else rects
+
+    def draw_hint_message(self):
+        # Opis ostatniej wskazówki pod przyciskami
+        hint_text = render_text(self.small_font, self.hint_message, BLACK)
+        self.screen.blit(hint_text, hint_text.get_rect(center=(self.screen.get_width() // 2,
+                                                                self.hint_button.rect.centery + BUTTON_HEIGHT)))
+
+    def restore_game_area(self, rect):
+        # Odtwarza fragment ekranu gry spod nakładki: tło, komórki, przyciski i opis wskazówki
+        self.screen.blit(self.background, rect, rect)
+        for row in range(self.grid_size):
+            for col in range(self.grid_size):
+                if self.cell_rect(row, col).colliderect(rect):
+                    self.draw_cell(row, col)
+        for button in (self.pause_button, self.hint_button):
+            if button.rect.colliderect(rect):
+                button.draw(self.screen)
+        if self.hint_message:
+            self.draw_hint_message()
+
+    def overlay_lines(self):
+        lines = []
+        if self.show_frame_stats:
+            lines.append(self.frame_stats.describe())
+        if self.show_profile:
+            lines.extend(profiler.describe())
+        return lines
+
+    def draw_overlay(self, full):
+        # Nakładki diagnostyczne w lewym dolnym rogu; zwraca prostokąt do odświeżenia
+        if not full and not self.stats_dirty and not self.show_profile:
+            return None
+        # Bez render_text - nakładka nie powinna zawyżać licznika renderowań
+        surfaces = [self.small_font.render(line, True, BLACK) for line in self.overlay_lines()]
+        rects = []
+        bottom = self.screen.get_height() - 10
+        for surf in reversed(surfaces):
+            rects.append(surf.get_rect(bottomleft=(10, bottom)))
+            bottom = rects[-1].top - 2
+        text_rect = rects[0].unionall(rects[1:])
+        rect = text_rect
+        if not full:
+            # Ekran gry odświeżany fragmentami - najpierw odtworzenie tego, co zasłaniał poprzedni tekst
+            rect = text_rect.union(self.stats_rect) if self.stats_rect else text_rect
+            self.restore_game_area(rect)
+        for surf, surf_rect in zip(reversed(surfaces), rects):
+            self.screen.blit(surf, surf_rect)
+        self.stats_rect = text_rect
+        self.stats_dirty = False
+        return rect
 
     def draw_pause_menu(self):
         overlay = pygame.Surface((self.screen.get_width(), self.screen.get_height()), pygame.SRCALPHA)
@@ -379,7 +538,7 @@ class Game:
         pygame.draw.rect(self.screen, BLACK, menu_rect, 2, border_radius=15)
 
         # Tytuł
-        title = self.font.render("PAUZA", True, DARK_BLUE)
+        title = render_text(self.font, "PAUZA", DARK_BLUE)
         title_rect = title.get_rect(center=(center_x, center_y - 100))
         self.screen.blit(title, title_rect)
 
@@ -394,14 +553,30 @@ class Game:
 
     def draw_end_screen(self):
         self.screen.fill(GREEN)
-        congrats = self.font.render("Gratulacje!", True, WHITE)
+        congrats = render_text(self.font, "Gratulacje!", WHITE)
         congrats_rect = congrats.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 3))
         self.screen.blit(congrats, congrats_rect)
 
-        time_text = self.font.render(f"Czas: {self.elapsed_time // 60}:{self.elapsed_time % 60:02d}", True, WHITE)
+        time_text = render_text(self.font, f"Czas: {self.elapsed_time // 60}:{self.elapsed_time % 60:02d}", WHITE)
         time_rect = time_text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2))
         self.screen.blit(time_text, time_rect)
 
+        # Najlepsze czasy poziomu (tabela z pamięci ResultStore, odświeżana tylko po nowym wyniku)
+        y = time_rect.bottom + 20
+        for place, result in enumerate(self.results.top(self.difficulty, self.grid_size, limit=5), 1):
+            line = render_text(self.small_font, f"{place}. {result.player} {result.seconds // 60}:"
+                                                f"{result.seconds % 60:02d} (wskazówki: {result.hints})", WHITE)
+            self.screen.blit(line, line.get_rect(center=(self.screen.get_width() // 2, y)))
+            y += SMALL_FONT_SIZE
+
+        self.back_button.rect.center = (self.screen.get_width() // 2, self.screen.get_height() * 3 // 4)
+        self.back_button.draw(self.screen)
+
+    def draw_loading_screen(self):
+        self.screen.fill(LIGHT_BLUE)
+        text = render_text(self.font, f"Generowanie planszy {self.grid_size}x{self.grid_size}...", DARK_BLUE)
+        self.screen.blit(text, text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2)))
+
         self.back_button.rect.center = (self.screen.get_width() // 2, self.screen.get_height() * 2 // 3)
         self.back_button.draw(self.screen)
 
@@ -409,121 +584,139 @@ class Game:
         if not self.player_name:
             return
 
-        try:
-            with open("sudoku_saves.json", "r") as f:
-                saves = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            saves = {}
-
-        save_data = {
-            "board": self.board,
-            "solution": self.solution,
-            "difficulty": self.difficulty,
-            "player": self.player_name,
-            "elapsed_time": self.elapsed_time,
-            "timestamp": datetime.now().isoformat(),
-            "hint_count": self.hint_count
-        }
-
-        if self.player_name not in saves:
-            saves[self.player_name] = []
-
-        saves[self.player_name].append(save_data)
-
-        with open("sudoku_saves.json", "w") as f:
-            json.dump(saves, f, indent=2)
+        started = time.perf_counter()
+        save_data = make_save(self.player_name, self.difficulty, self.board, self.solution, self.givens,
+                              self.elapsed_time, self.hint_count)
+        # Pierwszy zapis partii i co FULL_SAVE_EVERY zapisów pełny, pomiędzy nimi tylko nowe ruchy
+        if self.save_base is None or self.save_chain >= FULL_SAVE_EVERY:
+            self.save_base = self.save_store.append(save_data)
+            self.save_chain = 0
+        else:
+            self.save_store.append_delta(self.save_base, save_data, pack_moves(self.moves.unsaved(self.elapsed_time)))
+            self.save_chain += 1
+        self.moves.mark_saved()
+        if profiler.enabled:
+            profiler.observe("save_game", time.perf_counter() - started)
+            profiler.size(os.path.basename(self.save_store.path), self.save_store.file_size())
+
+    def save_result(self):
+        started = time.perf_counter()
+        self.elapsed_time = self.current_elapsed()
+        self.results.add(self.player_name, self.difficulty, self.grid_size, grid_to_string(self.givens),
+                         self.elapsed_time, DEFAULT_HINT_COUNT - self.hint_count, self.now())
+        if profiler.enabled:
+            profiler.observe("save_result", time.perf_counter() - started)
 
     def load_game(self):
         if not self.player_name:
             return False
 
-        try:
-            with open("sudoku_saves.json", "r") as f:
-                saves = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+        # Wybierz najnowszy zapis
+        started = time.perf_counter()
+        save_data = self.save_store.latest(self.player_name)
+        if save_data is None:
             return False
 
-        if self.player_name in saves and saves[self.player_name]:
-            # Wybierz najnowszy zapis
-            save_data = saves[self.player_name][-1]
-            self.board = save_data["board"]
-            self.solution = save_data["solution"]
-            self.difficulty = save_data["difficulty"]
-            self.elapsed_time = save_data["elapsed_time"]
-            self.hint_count = save_data.get("hint_count", 3)  # Domyślnie 3 jeśli brak
-            self.start_time = datetime.now() - timedelta(seconds=self.elapsed_time)
-            self.hint_button.text = f"Wskazówka ({self.hint_count})"  # Aktualizacja tekstu przycisku
-            self.is_paused = False
-            self.pause_duration = 0
-            return True
-
-        return False
+        self.board = Board.from_grid(save_data["board"])
+        self.grid_size = len(self.board)
+        self.box_size = math.isqrt(self.grid_size)
+        self.background = None
+        self.conflicts = ConflictTracker(self.board)
+        self.hints = HintEngine(self.board)
+        self.hint_message = ""
+        self.reset_moves()
+        self.solution = Board.from_grid(save_data["solution"])
+        self.givens = Board.from_grid(save_data["givens"])
+        self.difficulty = save_data["difficulty"]
+        self.elapsed_time = save_data["elapsed_time"]
+        self.hint_count = save_data["hint_count"]
+        self.start_time = self.now() - timedelta(seconds=self.elapsed_time)
+        self.hint_button.text = f"Wskazówka ({self.hint_count})"  # Aktualizacja tekstu przycisku
+        self.is_paused = False
+        self.pause_duration = 0
+        self.full_redraw = True
+        if profiler.enabled:
+            profiler.observe("load_game", time.perf_counter() - started)
+        return True
 
     def check_win(self):
-        for row in range(GRID_SIZE):
-            for col in range(GRID_SIZE):
-                if self.board[row][col] != self.solution[row][col]:
-                    return False
-        return True
+        # Plansza ma jedno rozwiązanie, więc pełna plansza bez konfliktów jest tym rozwiązaniem
+        return self.conflicts.is_solved()
 
     def use_hint(self):
         if self.hint_count <= 0:
             return
 
-        # Znajdź wszystkie puste komórki
-        empty_cells = []
-        for row in range(GRID_SIZE):
-            for col in range(GRID_SIZE):
-                if self.board[row][col] == 0:
-                    empty_cells.append((row, col))
-
-        # Jeśli nie ma pustych komórek, zakończ
-        if not empty_cells:
-            return
-
-        # Przygotuj struktury do zliczania pustych komórek
-        row_empty = [0] * GRID_SIZE  # Liczba pustych w każdym wierszu
-        col_empty = [0] * GRID_SIZE  # Liczba pustych w każdej kolumnie
-        box_empty = [[0] * 3 for _ in range(3)]  # Liczba pustych w każdym kwadracie 3x3
-
-        # Wypełnij struktury danymi
-        for row in range(GRID_SIZE):
-            for col in range(GRID_SIZE):
-                if self.board[row][col] == 0:
-                    row_empty[row] += 1
-                    col_empty[col] += 1
-                    box_empty[row // 3][col // 3] += 1
-
-        # Znajdź komórkę z największą liczbą pustych sąsiadów
-        best_cell = None
-        max_empty = -1
-
-        for (row, col) in empty_cells:
-            # Suma pustych komórek w wierszu, kolumnie i kwadracie komórki
-            total_empty = row_empty[row] + col_empty[col] + box_empty[row // 3][col // 3]
-
-            if total_empty > max_empty:
-                max_empty = total_empty
-                best_cell = (row, col)
-
-        # Jeśli znaleziono komórkę, wypełnij ją poprawną wartością
-        if best_cell:
-            row, col = best_cell
-            self.board[row][col] = self.solution[row][col]
-            self.hint_count -= 1
-            self.hint_button.text = f"Wskazówka ({self.hint_count})"  # Aktualizacja tekstu przycisku
-
-    def handle_events(self):
+        hint = self.hints.next_hint()
+        if hint and hint.num == self.solution.get(hint.row, hint.col):
+            row, col, num = hint.row, hint.col, hint.num
+            self.hint_message = f"Wskazówka: {hint.name}"
+        else:
+            # Błędne wpisy gracza albo plansza wymagająca zgadywania - wpis z rozwiązania
+            empty_cells = [i for i, num in enumerate(self.board.cells) if not num]
+            if not empty_cells:
+                return
+            i = min(empty_cells, key=lambda i: self.hints.cand[i].bit_count())
+            row, col = divmod(i, self.grid_size)
+            num = self.solution.cells[i]
+            self.hint_message = "Wskazówka: z rozwiązania"
+
+        self.set_cell(row, col, num)
+        self.hint_count -= 1
+        self.hint_button.text = f"Wskazówka ({self.hint_count})"  # Aktualizacja tekstu przycisku
+        self.full_redraw = True  # Nowy opis wskazówki pod przyciskami
+
+    def quit(self):
+        # Wyjście nie czeka na planszę generowaną w tle: najpierw executor (bez czekania, z anulowaniem
+        # kolejki), potem wątek puli, a proces roboczy w trakcie generowania jest przerywany
+        import multiprocessing
+
+        self.pool_executor.shutdown(wait=False, cancel_futures=True)
+        self.puzzle_pool.close()
+        for process in multiprocessing.active_children():
+            process.terminate()
+        self.save_store.close()
+        self.results.close()
+        profiler.finish()
+        if self.recorder:
+            self.recorder.finish()
+        pygame.quit()
+        sys.exit()
+
+    def record(self, name, *args):
+        if self.recorder:
+            self.recorder.record(self.now(), name, *args)
+
+    def update_win(self):
+        # Pełna plansza bez konfliktów kończy partię
+        if self.state == "game" and self.check_win():
+            self.state = "end"
+            self.save_result()
+            if self.recorder:
+                self.recorder.finish()
+
+    def handle_events(self, events=None):
         mouse_pos = pygame.mouse.get_pos()
 
-        for event in pygame.event.get():
+        for event in pygame.event.get() if events is None else events:
             if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+                self.quit()
+
+            # Nakładka z kosztem klatek
+            if event.type == pygame.KEYDOWN and event.key in (pygame.K_F3, pygame.K_F4):
+                if event.key == pygame.K_F3:
+                    self.show_frame_stats = not self.show_frame_stats
+                else:
+                    # Liczniki zostają włączone po ukryciu nakładki, żeby zapis przy wyjściu objął całą sesję
+                    self.show_profile = not self.show_profile
+                    profiler.enabled = True
+                self.full_redraw = True
+                continue
 
             # Zmiana rozmiaru okna
             if event.type == pygame.VIDEORESIZE:
                 self.screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+                self.full_redraw = True
 
             # Obsługa klawiatury
             if event.type == pygame.KEYDOWN:
@@ -533,27 +726,44 @@ class Game:
                     elif event.unicode.isalnum() and len(self.player_name) < 15:
                         self.player_name += event.unicode
 
+                elif self.state == "game" and event.key in (pygame.K_z, pygame.K_y) and event.mod & pygame.KMOD_CTRL:
+                    # Ctrl+Z cofa ruch, Ctrl+Y ponawia cofnięty
+                    if event.key == pygame.K_z:
+                        self.record("undo")
+                        self.undo()
+                    else:
+                        self.record("redo")
+                        self.redo()
+
                 elif self.state == "game" and self.selected_cell:
                     row, col = self.selected_cell
-                    if event.unicode.isdigit() and 1 <= int(event.unicode) <= 9:
-                        self.board[row][col] = int(event.unicode)
+                    # Cyfry 1-9, a na większych planszach dalej litery A-P
+                    symbol = event.unicode.upper()
+                    if symbol and symbol in SYMBOLS[:self.grid_size]:
+                        self.record("key", symbol)
+                        self.set_cell(row, col, SYMBOLS.index(symbol) + 1)
                     elif event.key == pygame.K_BACKSPACE or event.key == pygame.K_DELETE:
-                        self.board[row][col] = 0
+                        self.record("clear")
+                        self.set_cell(row, col, 0)
 
-            # Obsługa myszy
+            # Obsługa myszy (pozycja ze zdarzenia - zdarzenia odtwarzane nie przesuwają kursora)
             if event.type == pygame.MOUSEBUTTONDOWN:
+                mouse_pos = event.pos
                 if self.state == "start":
                     if self.start_button.is_clicked(mouse_pos, event):
                         if self.player_name:
-                            self.new_game()
-                            self.state = "game"
-                            self.start_time = datetime.now()
+                            self.start_game()
 
                     elif self.easy_button.is_clicked(mouse_pos, event):
                         self.difficulty = "łatwy"
+                        self.puzzle_pool.prefetch(self.difficulty, self.box_size)
 
                     elif self.hard_button.is_clicked(mouse_pos, event):
                         self.difficulty = "trudny"
+                        self.puzzle_pool.prefetch(self.difficulty, self.box_size)
+
+                    elif self.size_button.is_clicked(mouse_pos, event):
+                        self.next_size()
 
                     elif self.load_button.is_clicked(mouse_pos, event):
                         if self.load_game():
@@ -562,52 +772,63 @@ class Game:
                 elif self.state == "game":
                     if self.pause_button.is_clicked(mouse_pos, event):
                         if not self.is_paused:  # Pausing the game
+                            self.record("pause")
                             self.is_paused = True
-                            self.pause_start_time = datetime.now()
+                            self.pause_start_time = self.now()
                             self.state = "pause"
                         else:
+                            self.record("resume")
                             self.is_paused = False
-                            self.pause_duration += (datetime.now() - self.pause_start_time).seconds
+                            self.pause_duration += (self.now() - self.pause_start_time).seconds
                             self.state = "game"
 
                     elif self.hint_button.is_clicked(mouse_pos, event):
+                        self.record("hint")
                         self.use_hint()
 
                     else:
                         # Wybór komórki
-                        grid_width = GRID_SIZE * CELL_SIZE
-                        start_x = (self.screen.get_width() - grid_width) // 2
-                        start_y = (self.screen.get_height() - grid_width) // 2 - 30
+                        grid_width = self.grid_size * self.cell_size
+                        start_x, start_y = self.grid_origin()
 
                         if (start_x <= mouse_pos[0] <= start_x + grid_width and
                                 start_y <= mouse_pos[1] <= start_y + grid_width):
 
-                            col = (mouse_pos[0] - start_x) // CELL_SIZE
-                            row = (mouse_pos[1] - start_y) // CELL_SIZE
+                            col = min((mouse_pos[0] - start_x) // self.cell_size, self.grid_size - 1)
+                            row = min((mouse_pos[1] - start_y) // self.cell_size, self.grid_size - 1)
 
                             # Sprawdź czy komórka nie jest stała
-                            if self.generator.board[row][col] == 0:
-                                self.selected_cell = (row, col)
+                            if self.givens.get(row, col) == 0:
+                                self.record("select", row, col)
+                                self.select_cell((row, col))
 
                 elif self.state == "pause":
                     if self.return_button.is_clicked(mouse_pos, event):
+                        self.record("resume")
                         self.is_paused = False
-                        self.pause_duration += (datetime.now() - self.pause_start_time).seconds
+                        self.pause_duration += (self.now() - self.pause_start_time).seconds
                         self.state = "game"
                     elif self.save_pause_button.is_clicked(mouse_pos, event):
+                        self.record("save")
                         self.save_game()
                     elif self.menu_button.is_clicked(mouse_pos, event):
                         self.state = "start"
+                        if self.recorder:
+                            self.recorder.finish()
 
-                elif self.state == "end":
+                elif self.state in ("end", "loading"):
                     if self.back_button.is_clicked(mouse_pos, event):
                         self.state = "start"
 
+        if self.state == "loading":
+            self.start_game()
+
         # Aktualizacja przycisków (hover)
         if self.state == "start":
             self.start_button.check_hover(mouse_pos)
             self.easy_button.check_hover(mouse_pos)
             self.hard_button.check_hover(mouse_pos)
+            self.size_button.check_hover(mouse_pos)
             self.load_button.check_hover(mouse_pos)
         elif self.state == "game":
             self.pause_button.check_hover(mouse_pos)
@@ -616,30 +837,112 @@ class Game:
             self.return_button.check_hover(mouse_pos)
             self.save_pause_button.check_hover(mouse_pos)
             self.menu_button.check_hover(mouse_pos)
-        elif self.state == "end":
+        elif self.state in ("end", "loading"):
             self.back_button.check_hover(mouse_pos)
 
-    def run(self):
+    def wait_timeout(self):
+        # Czas (ms) do najbliższej zmiany zegara gry; 0 oznacza czekanie bez limitu
+        timeout = 0
+        if self.state == "game" and self.start_time and not self.is_paused:
+            base_time = self.now() - timedelta(seconds=self.pause_duration)
+            timeout = 1000 - (base_time - self.start_time).microseconds // 1000
+        elif self.state == "loading":
+            timeout = LOADING_POLL_MS
+        if self.show_frame_stats:
+            window = int(self.frame_stats.window * 1000)
+            timeout = min(timeout, window) if timeout else window
+        return timeout
+
+    def wait_events(self):
+        # Czeka do pierwszego zdarzenia lub zmiany zegara i zwraca całą kolejkę. `pygame.event.wait`
+        # nie blokuje naprawdę - sprawdza kolejkę co 1 ms (ok. 25 ms procesora na sekundę czekania),
+        # więc pętla śpi po INPUT_POLL_MS i między drzemkami tylko zagląda do kolejki
+        if self.state != self.drawn_state or self.full_redraw:
+            return pygame.event.get()
+        timeout = self.wait_timeout()
+        deadline = time.perf_counter() + timeout / 1000 if timeout else None
         while True:
-            self.handle_events()
-
-            # Rysowanie odpowiedniego ekranu
-            if self.state == "start":
-                self.draw_start_screen()
-            elif self.state == "game":
-                self.draw_game_screen()
-                if self.check_win():
-                    self.state = "end"
-            elif self.state == "pause":
-                self.draw_game_screen() 
-                self.draw_pause_menu()
-            elif self.state == "end":
-                self.draw_end_screen()
-
+            events = pygame.event.get()
+            if events:
+                return events
+            nap = INPUT_POLL_MS / 1000
+            if deadline is not None:
+                nap = min(nap, deadline - time.perf_counter())
+                if nap <= 0:
+                    return []
+            time.sleep(nap)
+
+    def needs_redraw(self, events):
+        return (bool(events) or self.full_redraw or self.stats_dirty or self.state != self.drawn_state
+                or (self.state == "game" and self.current_elapsed() != self.elapsed_time))
+
+    def draw_frame(self):
+        # Rysowanie odpowiedniego ekranu
+        state = self.state
+        dirty_rects = None
+        if state == "start":
+            self.draw_start_screen()
+            self.full_redraw = False  # Ekran startowy jest zawsze rysowany w całości
+        elif state == "game":
+            # Po zmianie ekranu (np. powrót z pauzy) plansza musi zostać narysowana w całości
+            if self.drawn_state != "game":
+                self.full_redraw = True
+            dirty_rects = self.draw_game_screen()
+            self.update_win()
+        elif state == "pause":
+            self.full_redraw = True
+            self.draw_game_screen()
+            self.draw_pause_menu()
+        elif state == "end":
+            self.draw_end_screen()
+            self.full_redraw = False
+        elif state == "loading":
+            self.draw_loading_screen()
+            self.full_redraw = False
+        self.drawn_state = state
+
+        if self.show_frame_stats or self.show_profile:
+            rect = self.draw_overlay(full=dirty_rects is None)
+            if rect and dirty_rects is not None:
+                dirty_rects.append(rect)
+
+        # Na ekranie gry odświeżane są tylko zmienione fragmenty
+        if dirty_rects is None:
             pygame.display.flip()
-            self.clock.tick(60)
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
+
+    def run(self):
+        while True:
+            waiting = time.perf_counter()
+            events = self.wait_events() if self.event_driven else pygame.event.get()
+            woke = time.perf_counter()
+            self.frame_stats.idle(woke - waiting)
+
+            self.handle_events(events)
+            if self.frame_stats.roll() and self.show_frame_stats:
+                self.stats_dirty = True
+            drawn = not self.event_driven or self.needs_redraw(events)
+            if drawn:
+                self.draw_frame()
+                if profiler.enabled:
+                    profiler.end_frame()
+            self.frame_stats.work(time.perf_counter() - woke, drawn)
+
+            # Limit klatek przy szybkim wejściu (np. ruch myszy); czas uśpienia liczy się jako bezczynność
+            if drawn:
+                throttle = time.perf_counter()
+                self.clock.tick(FPS)
+                self.frame_stats.idle(time.perf_counter() - throttle)
 
 
 if __name__ == "__main__":
+    # Polecenia wsadowe (np. `python -m sudoku generate`) działają bez okna gry
+    if len(sys.argv) > 1:
+        from sudoku_core import cli
+        sys.exit(cli.main(sys.argv[1:]))
+    profiler.configure(os.environ.get(PROFILE_ENV))
     game = Game()
+    if os.environ.get(RECORD_ENV):
+        game.recorder = SessionRecorder(os.environ[RECORD_ENV])
     game.run()
\ No newline at end of file
@@ -0,0 +1,7 @@
+"""Rdzeń gry Sudoku niezależny od interfejsu graficznego."""
+
+from sudoku_core.generator import SudokuGenerator
+from sudoku_core.solver import count_solutions, solve
+from sudoku_core.validation import has_conflict, is_solved
+
+__all__ = ["SudokuGenerator", "count_solutions", "has_conflict", "is_solved", "solve"]
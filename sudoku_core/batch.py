@@ -0,0 +1,62 @@
+"""Wsadowe generowanie plansz w puli procesów."""
+import math
+import os
+import random
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from sudoku_core.codec import encode_puzzles, grid_to_string
+from sudoku_core.generator import SudokuGenerator
+from sudoku_core.units import BOX_SIZE
+
+CHUNK_SIZE = 100
+
+
+def generate_chunk(difficulty, count, seed, binary=False, box_size=BOX_SIZE):
+    # Każda paczka ma własne ziarno, z którego losuje ziarna swoich plansz, więc wynik nie zależy
+    # od przydziału do procesów, a globalny stan `random` procesu roboczego pozostaje nietknięty
+    seeds = random.Random(seed)
+    puzzles = []
+    for _ in range(count):
+        generator = SudokuGenerator(difficulty, box_size, seed=seeds.randrange(2 ** 32))
+        puzzles.append((generator.board, generator.solution))
+    if binary:
+        return encode_puzzles(puzzles)
+    return "".join(f"{grid_to_string(board)},{grid_to_string(solution)}\n" for board, solution in puzzles)
+
+
+def generate_batch(output, count, difficulty, workers=None, seed=None, chunk_size=CHUNK_SIZE, binary=False,
+                   box_size=BOX_SIZE):
+    """Generuje `count` plansz i dopisuje je strumieniowo do pliku `output`.
+
+    W trybie tekstowym każda linia ma postać `plansza,rozwiązanie`, w binarnym plik
+    to ciąg rekordów `sudoku_core.codec.encode_puzzle`. Zwraca liczbę zapisanych plansz.
+    """
+    workers = workers or os.cpu_count() or 1
+    if seed is None:
+        seed = random.SystemRandom().randrange(2 ** 32)
+
+    chunks = [(difficulty, min(chunk_size, count - start), f"{seed}-{index}", binary, box_size)
+              for index, start in enumerate(range(0, count, chunk_size))]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor, open(output, "wb" if binary else "w") as f:
+        # Ograniczona liczba zadań w locie utrzymuje stałe zużycie pamięci
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(generate_chunk, *chunk))
+            if len(pending) >= workers * 2:
+                f.write(pending.popleft().result())
+        while pending:
+            f.write(pending.popleft().result())
+    return count
+
+
+def run(args):
+    start = time.perf_counter()
+    written = generate_batch(args.output, args.count, args.difficulty, args.workers, args.seed,
+                             binary=args.format == "bin", box_size=math.isqrt(args.size))
+    elapsed = time.perf_counter() - start
+    print(f"Wygenerowano {written} plansz ({args.difficulty}, {args.size}x{args.size}) w {elapsed:.1f} s "
+          f"({written / elapsed:.0f} plansz/s) -> {args.output}")
+    return 0
@@ -0,0 +1,102 @@
+"""Plansza trzymana w jednym płaskim buforze bajtów.
+
+`Board` przechowuje n*n pól wierszami w `bytearray`, a tablice sąsiadów i jednostek
+bierze z `Shape` (sudoku_core.units), liczonego raz na rozmiar. `board[row][col]`
+działa jak dla listy wierszy (wiersz to `memoryview` na ten sam bufor, więc zapis
+przez niego zmienia planszę), dzięki czemu plansza pasuje do funkcji przyjmujących
+listę wierszy; gorące ścieżki korzystają z indeksu pola `row * n + col` i `cells`.
+`view()` oddaje bufor bez kopiowania, np. `numpy.asarray(board.view())` to tablica
+(n, n) uint8 na tej samej pamięci.
+"""
+from sudoku_core.units import BOX_SIZE, get_shape, shape_of
+
+
+class Board:
+    __slots__ = ("shape", "cells")
+
+    def __init__(self, cells=None, box_size=BOX_SIZE):
+        self.shape = get_shape(box_size)
+        self.cells = bytearray(self.shape.cells) if cells is None else bytearray(cells)
+        if len(self.cells) != self.shape.cells:
+            raise ValueError(f"Oczekiwano {self.shape.cells} pól, otrzymano {len(self.cells)}")
+
+    @classmethod
+    def from_grid(cls, grid):
+        """Plansza z listy wierszy (albo kopia innej planszy `Board`)."""
+        if isinstance(grid, Board):
+            return grid.copy()
+        return cls(bytes(num for row in grid for num in row), shape_of(grid).box_size)
+
+    def to_grid(self):
+        return self.shape.to_grid(list(self.cells))
+
+    @property
+    def box_size(self):
+        return self.shape.box_size
+
+    @property
+    def grid_size(self):
+        return self.shape.grid_size
+
+    def copy(self):
+        board = Board.__new__(Board)
+        board.shape = self.shape
+        board.cells = self.cells[:]
+        return board
+
+    def snapshot(self):
+        return bytes(self.cells)
+
+    def restore(self, snapshot):
+        # Przypisanie do wycinka zachowuje bufor, więc widoki z `view()` pozostają aktualne
+        self.cells[:] = snapshot
+
+    def view(self):
+        """Widok (n, n) na bufor planszy bez kopiowania (protokół bufora)."""
+        n = self.shape.grid_size
+        return memoryview(self.cells).cast("B", (n, n))
+
+    def __array__(self, dtype=None, copy=None):
+        import numpy as np
+
+        array = np.asarray(self.view())
+        return array if dtype is None else array.astype(dtype)
+
+    def get(self, row, col):
+        return self.cells[row * self.shape.grid_size + col]
+
+    def set(self, row, col, num):
+        self.cells[row * self.shape.grid_size + col] = num
+
+    def is_valid(self, row, col, num):
+        # Czy `num` nie występuje u żadnego z sąsiadów pola (wiersz, kolumna, kwadrat)
+        return num not in self.shape.peer_getters[row * self.shape.grid_size + col](self.cells)
+
+    def is_full(self):
+        return 0 not in self.cells
+
+    def __len__(self):
+        return self.shape.grid_size
+
+    def __getitem__(self, row):
+        n = self.shape.grid_size
+        start = range(0, self.shape.cells, n)[row]
+        return memoryview(self.cells)[start:start + n]
+
+    def __iter__(self):
+        n = self.shape.grid_size
+        view = memoryview(self.cells)
+        return (view[start:start + n] for start in range(0, self.shape.cells, n))
+
+    def __eq__(self, other):
+        if not isinstance(other, Board):
+            return NotImplemented
+        return self.shape is other.shape and self.cells == other.cells
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return Board, (bytes(self.cells), self.shape.box_size)
+
+    def __repr__(self):
+        return f"Board({bytes(self.cells)!r}, box_size={self.shape.box_size})"
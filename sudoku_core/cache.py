@@ -0,0 +1,100 @@
+"""Podręczna pamięć plansz na dysku, adresowana identyfikatorem planszy.
+
+Identyfikator (`generator.puzzle_id`) wyznacza planszę jednoznacznie, więc raz
+wygenerowana plansza może być zwracana z bazy zamiast generowana od nowa
+(plansza dnia, udostępnione linki, powtórki). Liczba plansz jest ograniczona:
+po przekroczeniu `capacity` usuwane są najdawniej używane (LRU).
+"""
+import sqlite3
+from collections import OrderedDict
+
+from sudoku_core.codec import grid_from_string, grid_to_string
+from sudoku_core.generator import generate_by_id, parse_puzzle_id
+
+CACHE_FILE = "sudoku_cache.db"
+CACHE_CAPACITY = 10_000
+MEMORY_CAPACITY = 256
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS puzzles (
+    id TEXT PRIMARY KEY,
+    puzzle TEXT NOT NULL,
+    used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS puzzles_used ON puzzles (used);
+"""
+
+
+class PuzzleCache:
+    """Plansze w bazie SQLite z licznikiem ostatniego użycia i małą warstwą w pamięci.
+
+    Trafienie w warstwie w pamięci nie dotyka bazy (licznik użycia trafia do bazy
+    dopiero przy wypadnięciu planszy z pamięci lub zamknięciu). Zawartość jest
+    odtwarzalna z identyfikatora, więc baza działa bez synchronicznego zapisu na dysk.
+    """
+
+    def __init__(self, path=CACHE_FILE, capacity=CACHE_CAPACITY, memory_capacity=MEMORY_CAPACITY):
+        self.capacity = capacity
+        self.memory_capacity = memory_capacity
+        self.memory = OrderedDict()  # id -> (plansza, rozwiązanie, ostatnie użycie)
+        self.hits = self.misses = 0
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=OFF")
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+        self.clock, self.size = self.connection.execute(
+            "SELECT COALESCE(MAX(used), 0), COUNT(*) FROM puzzles").fetchone()
+
+    def close(self):
+        with self.connection:
+            self._flush()
+        self.connection.close()
+
+    def _flush(self):
+        # Zapisuje w bazie liczniki użycia plansz trafiających w pamięci
+        self.connection.executemany("UPDATE puzzles SET used = ? WHERE id = ?",
+                                    [(used, puzzle_id) for puzzle_id, (_, _, used) in self.memory.items()])
+
+    def get(self, puzzle_id):
+        """Zwraca (plansza, rozwiązanie) dla identyfikatora, generując planszę przy braku w pamięci podręcznej."""
+        self.clock += 1
+        entry = self.memory.pop(puzzle_id, None)
+        if entry is not None:
+            self.hits += 1
+            board, solution, _ = entry
+        else:
+            parse_puzzle_id(puzzle_id)  # Niepoprawny identyfikator nie trafia do bazy
+            with self.connection:
+                row = self.connection.execute("SELECT puzzle FROM puzzles WHERE id = ?", (puzzle_id,)).fetchone()
+                if row is not None:
+                    self.hits += 1
+                    board, solution = (grid_from_string(text) for text in row[0].split(","))
+                else:
+                    self.misses += 1
+                    board, solution = generate_by_id(puzzle_id)
+                    self.connection.execute("INSERT INTO puzzles (id, puzzle, used) VALUES (?, ?, ?)",
+                                            (puzzle_id, f"{grid_to_string(board)},{grid_to_string(solution)}",
+                                             self.clock))
+                    self.size += 1
+                    self._evict()
+
+        self.memory[puzzle_id] = (board, solution, self.clock)
+        if len(self.memory) > self.memory_capacity:
+            old_id, (_, _, used) = self.memory.popitem(last=False)
+            with self.connection:
+                self.connection.execute("UPDATE puzzles SET used = ? WHERE id = ?", (used, old_id))
+        # Kopie - gra modyfikuje planszę w miejscu
+        return [row[:] for row in board], [row[:] for row in solution]
+
+    def _evict(self):
+        # Usuwa najdawniej używane plansze ponad limit
+        excess = self.size - self.capacity
+        if excess > 0:
+            self._flush()
+            self.connection.execute(
+                "DELETE FROM puzzles WHERE id IN (SELECT id FROM puzzles ORDER BY used LIMIT ?)", (excess,))
+            self.size -= excess
+
+    def __len__(self):
+        return self.size
@@ -0,0 +1,124 @@
+"""Polecenia wiersza poleceń działające bez interfejsu graficznego."""
+import argparse
+
+DIFFICULTIES = ("łatwy", "trudny")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m sudoku", description="Narzędzia Sudoku bez okna gry")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="wygeneruj plansze wsadowo")
+    generate.add_argument("--count", type=int, default=100, help="liczba plansz")
+    generate.add_argument("--difficulty", choices=DIFFICULTIES, default="łatwy", help="poziom trudności")
+    generate.add_argument("--size", type=int, choices=(4, 9, 16, 25), default=9, help="bok planszy")
+    generate.add_argument("--workers", type=int, default=None, help="liczba procesów (domyślnie liczba rdzeni)")
+    generate.add_argument("--seed", type=int, default=None, help="ziarno losowania")
+    generate.add_argument("--output", default="puzzles.txt", help="plik wynikowy")
+    generate.add_argument("--format", choices=("txt", "bin"), default="txt",
+                          help="txt: linie 'plansza,rozwiązanie'; bin: rekordy po 52 bajty (sudoku_core.codec)")
+
+    puzzle = commands.add_parser("puzzle", help="wypisz planszę o danym identyfikatorze (z pamięci podręcznej)")
+    source = puzzle.add_mutually_exclusive_group(required=True)
+    source.add_argument("--id", help="identyfikator planszy, np. 4-trudny-9x9-12345")
+    source.add_argument("--daily", action="store_true", help="plansza dnia (ziarno z dzisiejszej daty)")
+    puzzle.add_argument("--difficulty", choices=DIFFICULTIES, default="łatwy", help="poziom planszy dnia")
+    puzzle.add_argument("--size", type=int, choices=(4, 9, 16, 25), default=9, help="bok planszy dnia")
+    puzzle.add_argument("--cache", default="sudoku_cache.db", help="plik pamięci podręcznej plansz")
+
+    corpus = commands.add_parser("corpus", help="rozwiąż plansze z pliku (jedna plansza 81 znaków na linię)")
+    corpus.add_argument("input", help="plik z planszami")
+    corpus.add_argument("--output", default="solved.csv", help="plik wyników (plansza,rozwiązanie,liczba,ocena)")
+    corpus.add_argument("--workers", type=int, default=None, help="liczba procesów (domyślnie liczba rdzeni)")
+    corpus.add_argument("--chunk-size", type=int, default=1000, help="liczba linii w paczce")
+    corpus.add_argument("--grade", action="store_true", help="oceń trudność każdej planszy")
+    corpus.add_argument("--resume", action="store_true", help="wznów od punktu kontrolnego <output>.checkpoint")
+
+    serve = commands.add_parser("serve", help="uruchom serwer HTTP wydający i rozwiązujący plansze")
+    serve.add_argument("--host", default="127.0.0.1", help="adres nasłuchu")
+    serve.add_argument("--port", type=int, default=8080, help="port nasłuchu")
+    serve.add_argument("--workers", type=int, default=None, help="liczba procesów (domyślnie liczba rdzeni)")
+    serve.add_argument("--pool-size", type=int, default=50, help="liczba gotowych plansz na poziom w puli")
+    serve.add_argument("--pool-file", default="sudoku_pool.json", help="plik puli gotowych plansz")
+
+    migrate = commands.add_parser("migrate-saves", help="przenieś zapisy z pliku JSON do bazy SQLite")
+    migrate.add_argument("--source", default="sudoku_saves.json", help="dawny plik zapisów JSON")
+    migrate.add_argument("--target", default="sudoku_saves.db", help="baza zapisów SQLite")
+
+    results = commands.add_parser("results", help="wypisz najlepsze czasy poziomu albo historię gracza")
+    results.add_argument("--difficulty", choices=DIFFICULTIES, default="łatwy", help="poziom tabeli najlepszych czasów")
+    results.add_argument("--size", type=int, choices=(4, 9, 16, 25), default=9, help="bok planszy")
+    results.add_argument("--player", help="historia partii gracza zamiast najlepszych czasów")
+    results.add_argument("--limit", type=int, default=10, help="liczba wyników")
+    results.add_argument("--db", default="sudoku_results.db", help="baza wyników")
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "generate":
+        if args.format == "bin" and args.size != 9:
+            parser.error("format bin obsługuje tylko plansze 9x9")
+        from sudoku_core import batch
+        return batch.run(args)
+    if args.command == "puzzle":
+        return show_puzzle(args)
+    if args.command == "corpus":
+        from sudoku_core import corpus
+        return corpus.run(args)
+    if args.command == "serve":
+        from sudoku_core import server
+        return server.run(args)
+    if args.command == "migrate-saves":
+        from sudoku_core.saves import SaveStore, migrate_json
+        store = SaveStore(args.target)
+        try:
+            print(f"Przeniesiono {migrate_json(store, args.source)} zapisów do {args.target}")
+        finally:
+            store.close()
+        return 0
+    if args.command == "results":
+        return show_results(args)
+    return 1
+
+
+def show_puzzle(args):
+    import math
+    from datetime import date
+
+    from sudoku_core.cache import PuzzleCache
+    from sudoku_core.codec import grid_to_string
+    from sudoku_core.generator import puzzle_id
+
+    if args.daily:
+        args.id = puzzle_id(args.difficulty, int(date.today().strftime("%Y%m%d")), math.isqrt(args.size))
+    cache = PuzzleCache(args.cache)
+    try:
+        board, solution = cache.get(args.id)
+    except ValueError as error:
+        print(error)
+        return 1
+    finally:
+        cache.close()
+    print(args.id)
+    print(f"{grid_to_string(board)},{grid_to_string(solution)}")
+    return 0
+
+
+def show_results(args):
+    from sudoku_core.results import ResultStore
+
+    store = ResultStore(args.db)
+    try:
+        if args.player:
+            results = store.history(args.player, args.limit)
+        else:
+            results = store.top(args.difficulty, args.size, args.limit)
+    finally:
+        store.close()
+    for place, result in enumerate(results, 1):
+        print(f"{place:3}. {result.player:15} {result.difficulty:7} {result.size}x{result.size} "
+              f"{result.seconds // 60}:{result.seconds % 60:02d} wskazówki: {result.hints} {result.finished}")
+    return 0
@@ -0,0 +1,118 @@
+"""Zapis planszy w postaci tekstowej i zwartej binarnej.
+
+Tekst: n*n znaków wierszami (cyfry 1-9, dalej litery A-P), '.' oznacza puste pole.
+Binarnie (tylko plansze 9x9): plansza to 81 pól po 4 bity (41 bajtów), a łamigłówka to rozwiązanie
+wraz z mapą bitową wskazówek (41 + 11 = 52 bajty), z której odtwarzana jest plansza startowa.
+"""
+import math
+from itertools import zip_longest
+
+from sudoku_core.board import Board
+from sudoku_core.solver import SYMBOLS
+from sudoku_core.units import CELLS, GRID_SIZE
+
+GRID_BYTES = (CELLS + 1) // 2
+GIVENS_BYTES = (CELLS + 7) // 8
+PUZZLE_BYTES = GRID_BYTES + GIVENS_BYTES
+
+# Bajt -> (starsza, młodsza) połówka, żeby dekodowanie nie liczyło przesunięć
+_NIBBLES = [(byte >> 4, byte & 0x0F) for byte in range(256)]
+
+
+def _flat(grid):
+    # Plansza `Board` oddaje swój bufor bez kopiowania, lista wierszy jest spłaszczana
+    return grid.cells if isinstance(grid, Board) else [num for row in grid for num in row]
+
+
+def grid_to_string(grid):
+    return "".join(SYMBOLS[num - 1] if num else "." for num in _flat(grid))
+
+
+def grid_from_string(text):
+    text = text.strip()
+    grid_size = math.isqrt(len(text))
+    if grid_size * grid_size != len(text) or grid_size not in (4, 9, 16, 25):
+        raise ValueError(f"Oczekiwano 16, 81, 256 lub 625 znaków, otrzymano {len(text)}")
+    cells = []
+    for position, ch in enumerate(text, 1):
+        num = 0 if ch in ".0" else SYMBOLS.find(ch.upper()) + 1
+        if num < 0 or num > grid_size or (num == 0 and ch not in ".0"):
+            raise ValueError(f"Niedozwolony znak {ch!r} na pozycji {position} planszy {grid_size}x{grid_size}")
+        cells.append(num)
+    return _to_grid(cells, grid_size)
+
+
+def _to_grid(cells, grid_size=GRID_SIZE):
+    return [cells[r * grid_size:(r + 1) * grid_size] for r in range(grid_size)]
+
+
+def encode_grid(grid):
+    if len(grid) != GRID_SIZE:
+        raise ValueError(f"Zapis binarny obsługuje tylko plansze {GRID_SIZE}x{GRID_SIZE}")
+    cells = _flat(grid)
+    # Nieparzysta liczba pól - ostatni bajt wyrównany zerem
+    return bytes((high << 4) | low for high, low in zip_longest(cells[0::2], cells[1::2], fillvalue=0))
+
+
+def decode_grid(data):
+    if len(data) != GRID_BYTES:
+        raise ValueError(f"Oczekiwano {GRID_BYTES} bajtów, otrzymano {len(data)}")
+    cells = [num for byte in data for num in _NIBBLES[byte]]
+    return _to_grid(cells[:CELLS])
+
+
+def encode_givens(board):
+    bits = 0
+    for i, num in enumerate(_flat(board)):
+        if num:
+            bits |= 1 << i
+    return bits.to_bytes(GIVENS_BYTES, "little")
+
+
+def apply_givens(solution, givens):
+    # Plansza startowa: rozwiązanie z wyzerowanymi polami spoza mapy wskazówek
+    bits = int.from_bytes(givens, "little")
+    return [[num if bits >> (r * GRID_SIZE + c) & 1 else 0 for c, num in enumerate(row)]
+            for r, row in enumerate(solution)]
+
+
+def encode_puzzle(board, solution):
+    return encode_grid(solution) + encode_givens(board)
+
+
+def decode_puzzle(data):
+    """Zwraca (plansza, rozwiązanie) z rekordu `encode_puzzle`."""
+    if len(data) != PUZZLE_BYTES:
+        raise ValueError(f"Oczekiwano {PUZZLE_BYTES} bajtów, otrzymano {len(data)}")
+    solution = decode_grid(data[:GRID_BYTES])
+    return apply_givens(solution, data[GRID_BYTES:]), solution
+
+
+def _split(buffer, size):
+    view = memoryview(buffer)
+    if len(view) % size:
+        raise ValueError(f"Długość bufora ({len(view)}) nie jest wielokrotnością {size}")
+    return (view[start:start + size] for start in range(0, len(view), size))
+
+
+def encode_grids(grids):
+    return b"".join(encode_grid(grid) for grid in grids)
+
+
+def decode_grids(buffer):
+    return [decode_grid(chunk) for chunk in _split(buffer, GRID_BYTES)]
+
+
+def encode_puzzles(puzzles):
+    """Koduje ciąg par (plansza, rozwiązanie) do jednego bufora rekordów stałej długości."""
+    return b"".join(encode_puzzle(board, solution) for board, solution in puzzles)
+
+
+def iter_puzzles(buffer):
+    # Bez kopiowania bufora - wygodne dla dużych plików otwartych przez mmap
+    for chunk in _split(buffer, PUZZLE_BYTES):
+        yield decode_puzzle(chunk)
+
+
+def decode_puzzles(buffer):
+    return list(iter_puzzles(buffer))
@@ -0,0 +1,98 @@
+"""Przyrostowe śledzenie konfliktów na planszy."""
+from sudoku_core.profiling import profiler
+
+
+class ConflictTracker:
+    """Liczniki cyfr w każdej jednostce aktualizowane przy każdym wpisie.
+
+    Plansza (`sudoku_core.board.Board`) jest współdzielona z właścicielem, ale zapisy
+    do niej muszą przechodzić przez `set`, wtedy sprawdzenie konfliktu i wygranej
+    kosztuje O(1), a `cells` zawiera wszystkie komórki w konflikcie.
+    """
+
+    def __init__(self, board):
+        self.board = board
+        self.values = board.cells  # Bufor planszy; `Board` nigdy go nie podmienia
+        shape = board.shape
+        self.grid_size = shape.grid_size
+        # Tablice sudoku_core.units: pola jednostek, jednostki pola, indeks pola -> (wiersz, kolumna)
+        self.unit_cells = shape.units
+        self.cell_units = shape.units_of
+        self.coords = shape.coords
+        self.counts = [[0] * (self.grid_size + 1) for _ in range(len(self.unit_cells))]
+        # Pole -> liczniki jego wiersza, kolumny i kwadratu (te same listy co w `counts`), żeby
+        # sprawdzenie konfliktu było trzema odczytami bez pętli i wyszukiwania jednostek
+        self.cell_counts = tuple(tuple(self.counts[unit] for unit in units) for units in self.cell_units)
+        self.duplicates = 0  # Liczba par (jednostka, cyfra) występujących więcej niż raz
+        self.empty = 0
+        for i, num in enumerate(board.cells):
+            if not num:
+                self.empty += 1
+                continue
+            for unit in self.cell_units[i]:
+                self.counts[unit][num] += 1
+                if self.counts[unit][num] == 2:
+                    self.duplicates += 1
+        self.cells = {self.coords[i] for i in range(shape.cells) if self._is_conflict(i)}
+
+    def has_conflict(self, row, col, num):
+        # Czy `num` występuje w wierszu, kolumnie lub kwadracie poza samą komórką
+        if profiler.enabled:
+            profiler.count("has_conflict")
+        i = row * self.grid_size + col
+        own = 1 if self.values[i] == num else 0
+        row_counts, col_counts, box_counts = self.cell_counts[i]
+        return row_counts[num] > own or col_counts[num] > own or box_counts[num] > own
+
+    def is_conflict(self, row, col):
+        return self._is_conflict(row * self.grid_size + col)
+
+    def _is_conflict(self, i):
+        num = self.values[i]
+        if not num:
+            return False
+        row_counts, col_counts, box_counts = self.cell_counts[i]
+        return row_counts[num] > 1 or col_counts[num] > 1 or box_counts[num] > 1
+
+    def is_solved(self):
+        return self.empty == 0 and self.duplicates == 0
+
+    def set(self, row, col, num):
+        """Wpisuje liczbę i zwraca komórki, których stan konfliktu mógł się zmienić."""
+        i = row * self.grid_size + col
+        values = self.values
+        old = values[i]
+        if old == num:
+            return set()
+        values[i] = num
+
+        # Stan innych komórek zmienia się tylko, gdy licznik przechodzi między 1 a 2
+        crossed = []
+        units = self.cell_units[i]
+        if old:
+            for unit in units:
+                self.counts[unit][old] -= 1
+                if self.counts[unit][old] == 1:
+                    self.duplicates -= 1
+                    crossed.append((unit, old))
+        else:
+            self.empty -= 1
+        if num:
+            for unit in units:
+                self.counts[unit][num] += 1
+                if self.counts[unit][num] == 2:
+                    self.duplicates += 1
+                    crossed.append((unit, num))
+        else:
+            self.empty += 1
+
+        changed = {i}
+        for unit, digit in crossed:
+            changed.update(j for j in self.unit_cells[unit] if values[j] == digit)
+        changed = {self.coords[j]: j for j in changed}
+        for cell, j in changed.items():
+            if self._is_conflict(j):
+                self.cells.add(cell)
+            else:
+                self.cells.discard(cell)
+        return set(changed)
@@ -0,0 +1,162 @@
+"""Strumieniowe rozwiązywanie zbiorów plansz w formacie jednej planszy 9x9 na linię.
+
+Linia zaczyna się od 81 znaków planszy (cyfry, '.' lub '0' jako puste pole); reszta
+linii (np. rozwiązanie albo ocena z innego programu) jest pomijana, a linie puste
+i zaczynające się od '#' są ignorowane. Plik wejściowy jest czytany przez `mmap`
+paczkami linii, paczki są rozwiązywane w puli procesów, a wyniki dopisywane do pliku
+wynikowego w kolejności wejścia. Liczba paczek w locie jest ograniczona, więc zużycie
+pamięci nie zależy od rozmiaru pliku.
+
+Po każdej zapisanej paczce plik `<wynik>.checkpoint` zapamiętuje pozycję w pliku
+wejściowym i długość pliku wynikowego - przerwane przetwarzanie można wznowić od tego
+miejsca.
+
+Linia wyniku: `plansza,rozwiązanie,liczba rozwiązań,ocena`, gdzie liczba rozwiązań to
+0, 1 albo 2 (dwa lub więcej), a ocena to najtrudniejsza potrzebna technika (z `--grade`).
+Niepoprawna linia daje `-` w miejscu rozwiązania i liczby rozwiązań.
+"""
+import json
+import mmap
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from sudoku_core import grader
+from sudoku_core.codec import grid_from_string, grid_to_string
+from sudoku_core.solver import solve_unique
+from sudoku_core.units import CELLS
+
+CHUNK_SIZE = 1000  # Linie w paczce
+LINE_BYTES = CELLS + 1
+VALID_CHARS = ".0123456789"
+
+
+def checkpoint_path(output):
+    return output + ".checkpoint"
+
+
+def iter_chunks(path, offset=0, chunk_size=CHUNK_SIZE):
+    """Zwraca kolejne paczki (pozycja końca paczki, bajty paczki) od pozycji `offset`.
+
+    Paczka to około `chunk_size` pełnych linii; kopiowana jest tylko bieżąca paczka.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            size = len(data)
+            while offset < size:
+                end = data.find(b"\n", min(offset + chunk_size * LINE_BYTES, size) - 1)
+                end = size if end == -1 else end + 1
+                yield end, data[offset:end]
+                offset = end
+
+
+def solve_line(line, grade=False):
+    text = line[:CELLS]
+    if len(text) != CELLS or text.strip(VALID_CHARS):
+        return f"{text},-,-,-"
+    grid = grid_from_string(text)
+    # Rozwiązanie i jednoznaczność jednym przeszukiwaniem do dwóch rozwiązań
+    solution, unique = solve_unique(grid)
+    if solution is None:
+        return f"{grid_to_string(grid)},-,0,-"
+    solutions = 1 if unique else 2
+    rating = "-"
+    if grade:
+        result = grader.grade(grid)
+        rating = result.name if result else "-"
+    return f"{grid_to_string(grid)},{grid_to_string(solution)},{solutions},{rating}"
+
+
+def solve_chunk(data, grade=False):
+    # Wykonywane w procesie roboczym: bajty paczki -> (bajty wyniku, liczba plansz)
+    results = []
+    for line in data.decode("ascii", "replace").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            results.append(solve_line(line, grade))
+    return "".join(f"{result}\n" for result in results).encode(), len(results)
+
+
+def _save_checkpoint(output, source, offset, written, puzzles):
+    state = {"input": os.path.abspath(source), "offset": offset, "output_size": written, "puzzles": puzzles}
+    path = checkpoint_path(output)
+    # Zapis przez plik tymczasowy, żeby przerwanie nie zostawiło uszkodzonego punktu kontrolnego
+    with open(path + ".tmp", "w") as f:
+        json.dump(state, f)
+    os.replace(path + ".tmp", path)
+
+
+def load_checkpoint(output, source):
+    """Stan z punktu kontrolnego albo None, gdy go nie ma lub dotyczy innego pliku wejściowego."""
+    try:
+        with open(checkpoint_path(output)) as f:
+            state = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    return state if state.get("input") == os.path.abspath(source) else None
+
+
+def process_file(source, output, workers=None, chunk_size=CHUNK_SIZE, grade=False, resume=False, progress=None):
+    """Rozwiązuje wszystkie plansze z pliku `source` i dopisuje wyniki do `output`.
+
+    Z `resume=True` zaczyna od punktu kontrolnego (jeśli istnieje). `progress(plansze, sekundy)`
+    jest wywoływane po każdej zapisanej paczce. Zwraca liczbę plansz przetworzonych w tym
+    uruchomieniu; po pełnym przebiegu punkt kontrolny jest usuwany.
+    """
+    workers = workers or os.cpu_count() or 1
+    state = load_checkpoint(output, source) if resume else None
+    offset, written, total = (state["offset"], state["output_size"], state["puzzles"]) if state else (0, 0, 0)
+
+    start = time.perf_counter()
+    processed = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor, open(output, "r+b" if state else "wb") as f:
+        # Wyniki zapisane po punkcie kontrolnym (przerwana paczka) są odrzucane
+        f.truncate(written)
+        f.seek(written)
+        pending = deque()
+
+        def write_next():
+            nonlocal written, total, processed
+            end, future = pending.popleft()
+            data, count = future.result()
+            f.write(data)
+            f.flush()
+            written += len(data)
+            total += count
+            processed += count
+            _save_checkpoint(output, source, end, written, total)
+            if progress is not None:
+                progress(processed, time.perf_counter() - start)
+
+        for end, chunk in iter_chunks(source, offset, chunk_size):
+            pending.append((end, executor.submit(solve_chunk, chunk, grade)))
+            if len(pending) >= workers * 2:
+                write_next()
+        while pending:
+            write_next()
+    try:
+        os.remove(checkpoint_path(output))
+    except FileNotFoundError:
+        pass
+    return processed
+
+
+def run(args):
+    last_report = 0.0
+
+    def progress(puzzles, elapsed):
+        nonlocal last_report
+        if elapsed - last_report >= 1.0:
+            last_report = elapsed
+            print(f"\r{puzzles} plansz, {puzzles / elapsed:.0f} plansz/s", end="", flush=True)
+
+    start = time.perf_counter()
+    processed = process_file(args.input, args.output, args.workers, args.chunk_size, args.grade, args.resume,
+                             progress)
+    elapsed = time.perf_counter() - start
+    print(f"\rRozwiązano {processed} plansz w {elapsed:.1f} s ({processed / elapsed if elapsed else 0:.0f} plansz/s) "
+          f"-> {args.output}")
+    return 0
@@ -0,0 +1,229 @@
+"""Silnik Dancing Links (algorytm X Knutha) dla Sudoku jako problemu dokładnego pokrycia.
+
+Węzły macierzy są przechowywane w płaskich listach indeksów (L, R, U, D, C) zamiast
+w obiektach. Pusta macierz dla danego rozmiaru planszy jest budowana raz, a każde
+rozwiązywanie zaczyna od jej kopii. Wiersz macierzy to para (pole, cyfra), kolumny
+to ograniczenia: pole wypełnione, cyfra w wierszu, w kolumnie, w kwadracie oraz
+w każdej dodatkowej jednostce (np. przekątnej w wariancie "Sudoku X").
+"""
+from sudoku_core.profiling import profiler
+from sudoku_core.units import shape_of
+
+
+class _Matrix:
+    def __init__(self, shape, extra_units=()):
+        n, cells = shape.grid_size, shape.cells
+        units = [shape.rows, shape.cols, shape.boxes]
+        unit_of = []
+        for group in units:
+            owner = [None] * cells
+            for index, unit in enumerate(group):
+                for i in unit:
+                    owner[i] = index
+            unit_of.append(owner)
+        extra_of = [[] for _ in range(cells)]
+        for index, unit in enumerate(extra_units):
+            for i in unit:
+                extra_of[i].append(index)
+
+        root_columns = self.columns = cells + 3 * n * n + len(extra_units) * n
+        # Węzeł 0 to korzeń, 1..columns to nagłówki kolumn
+        self.L = [root_columns] + list(range(root_columns))
+        self.R = list(range(1, root_columns + 1)) + [0]
+        self.U = list(range(root_columns + 1))
+        self.D = list(range(root_columns + 1))
+        self.C = list(range(root_columns + 1))
+        self.S = [0] * (root_columns + 1)
+        self.row_of = [-1] * (root_columns + 1)
+        self.first = []  # Pierwszy węzeł każdego wiersza macierzy
+
+        for i in range(cells):
+            for d in range(n):
+                columns = [1 + i]
+                for group, owner in enumerate(unit_of):
+                    columns.append(1 + cells + (group * n + owner[i]) * n + d)
+                for index in extra_of[i]:
+                    columns.append(1 + cells + 3 * n * n + index * n + d)
+                self._add_row(i * n + d, columns)
+
+    def _add_row(self, row, columns):
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        first = len(C)
+        for k, column in enumerate(columns):
+            node = first + k
+            L.append(first + (k - 1) % len(columns))
+            R.append(first + (k + 1) % len(columns))
+            U.append(U[column])
+            D.append(column)
+            D[U[column]] = node
+            U[column] = node
+            C.append(column)
+            S[column] += 1
+            self.row_of.append(row)
+        self.first.append(first)
+
+
+_MATRICES = {}
+
+
+def _matrix(shape, extra_units):
+    key = (shape.box_size, tuple(map(tuple, extra_units)))
+    matrix = _MATRICES.get(key)
+    if matrix is None:
+        matrix = _MATRICES[key] = _Matrix(shape, extra_units)
+    return matrix
+
+
+class _Search:
+    def __init__(self, grid, extra_units=()):
+        self.shape = shape = shape_of(grid)
+        matrix = _matrix(shape, extra_units)
+        # Kopie list - macierz wzorcowa zostaje nienaruszona
+        self.L, self.R, self.U, self.D = matrix.L[:], matrix.R[:], matrix.U[:], matrix.D[:]
+        self.S = matrix.S[:]
+        self.C, self.row_of = matrix.C, matrix.row_of
+        self.chosen = []
+        self.solutions = []
+        self.record = True  # Przy samym zliczaniu rozwiązania nie są zapamiętywane
+        self.nodes = 0
+        self.max_nodes = None
+        self.valid = self._load(grid, matrix)
+
+    def _load(self, grid, matrix):
+        # Wskazówki wybierają swoje wiersze od razu; sprzeczne wskazówki dają False
+        n = self.shape.grid_size
+        covered = set()
+        for row, values in enumerate(grid):
+            for col, num in enumerate(values):
+                if num:
+                    node = matrix.first[(row * n + col) * n + num - 1]
+                    columns = [self.C[node]]
+                    j = self.R[node]
+                    while j != node:
+                        columns.append(self.C[j])
+                        j = self.R[j]
+                    if covered.intersection(columns):
+                        return False
+                    covered.update(columns)
+                    for column in columns:
+                        self._cover(column)
+                    self.chosen.append(self.row_of[node])
+        return True
+
+    def _cover(self, c):
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        R[L[c]] = R[c]
+        L[R[c]] = L[c]
+        i = D[c]
+        while i != c:
+            j = R[i]
+            while j != i:
+                U[D[j]] = U[j]
+                D[U[j]] = D[j]
+                S[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def _uncover(self, c):
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        i = U[c]
+        while i != c:
+            j = L[i]
+            while j != i:
+                S[C[j]] += 1
+                U[D[j]] = j
+                D[U[j]] = j
+                j = L[j]
+            i = U[i]
+        R[L[c]] = c
+        L[R[c]] = c
+
+    def search(self, limit):
+        # Zwraca liczbę znalezionych rozwiązań (nie więcej niż limit)
+        self.nodes += 1
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            return 0
+        R, D, S, C = self.R, self.D, self.S, self.C
+        if R[0] == 0:
+            if self.record:
+                self.solutions.append(self.chosen[:])
+            return 1
+
+        # Kolumna z najmniejszą liczbą wierszy (odpowiednik MRV)
+        best, best_size = 0, None
+        c = R[0]
+        while c:
+            if best_size is None or S[c] < best_size:
+                best, best_size = c, S[c]
+                if best_size <= 1:
+                    break
+            c = R[c]
+        if best_size == 0:
+            return 0
+
+        found = 0
+        self._cover(best)
+        r = D[best]
+        while r != best:
+            self.chosen.append(self.row_of[r])
+            j = R[r]
+            while j != r:
+                self._cover(C[j])
+                j = R[j]
+            found += self.search(limit - found)
+            j = self.L[r]
+            while j != r:
+                self._uncover(C[j])
+                j = self.L[j]
+            self.chosen.pop()
+            if found >= limit:
+                break
+            r = D[r]
+        self._uncover(best)
+        return found
+
+    def to_grid(self, rows):
+        n = self.shape.grid_size
+        cells = [0] * self.shape.cells
+        for row in rows:
+            cells[row // n] = row % n + 1
+        return self.shape.to_grid(cells)
+
+
+def solve(grid, extra_units=()):
+    """Zwraca rozwiązaną kopię planszy lub None, gdy plansza nie ma rozwiązania.
+
+    `extra_units` to dodatkowe jednostki (listy indeksów pól), w których każda cyfra
+    musi wystąpić dokładnie raz, np. przekątne.
+    """
+    search = _Search(grid, extra_units)
+    found = search.valid and search.search(1)
+    if profiler.enabled:
+        profiler.count("solver/nodes", search.nodes)
+    if not found:
+        return None
+    return search.to_grid(search.solutions[0])
+
+
+def count_solutions(grid, limit=2, max_nodes=None, extra_units=()):
+    """Zlicza rozwiązania planszy jak `solver.count_solutions` (te same `limit` i `max_nodes`)."""
+    search = _Search(grid, extra_units)
+    if not search.valid:
+        return 0
+    search.record = False
+    search.max_nodes = max_nodes
+    found = search.search(limit)
+    if profiler.enabled:
+        profiler.count("solver/nodes", search.nodes)
+    if max_nodes is not None and search.nodes > max_nodes:
+        return limit
+    return found
+
+
+def all_solutions(grid, extra_units=()):
+    """Zwraca wszystkie rozwiązania planszy (uwaga: pusta plansza ma ich astronomicznie wiele)."""
+    search = _Search(grid, extra_units)
+    if not search.valid:
+        return []
+    search.search(float("inf"))
+    return [search.to_grid(rows) for rows in search.solutions]
@@ -0,0 +1,57 @@
+"""Pomiar kosztu klatek pętli gry i udziału czasu bezczynności."""
+import time
+
+WINDOW = 1.0  # Długość okna pomiarowego w sekundach
+
+
+class FrameStats:
+    """Sumuje czas pracy (obsługa zdarzeń i rysowanie) oraz czas oczekiwania na zdarzenia.
+
+    Co `window` sekund `roll` zamyka okno pomiarowe i zapisuje jego podsumowanie
+    w `summary`: liczbę klatek na sekundę, średni i najdłuższy czas klatki oraz
+    procent czasu spędzonego w oczekiwaniu.
+    """
+
+    def __init__(self, window=WINDOW, clock=time.perf_counter):
+        self.window = window
+        self.clock = clock
+        self.summary = None
+        self.reset()
+
+    def reset(self):
+        self.started = self.clock()
+        self.frames = 0
+        self.busy = self.drawing = self.waiting = self.worst = 0.0
+
+    def idle(self, seconds):
+        self.waiting += seconds
+
+    def work(self, seconds, drawn=True):
+        # Obudzenie pętli bez przerysowania też kosztuje, ale nie jest klatką
+        self.busy += seconds
+        if drawn:
+            self.frames += 1
+            self.drawing += seconds
+            self.worst = max(self.worst, seconds)
+
+    def roll(self):
+        """Zamyka okno po upływie `window` sekund; zwraca True, gdy powstało nowe podsumowanie."""
+        elapsed = self.clock() - self.started
+        if elapsed < self.window:
+            return False
+        total = self.busy + self.waiting
+        self.summary = {
+            "fps": self.frames / elapsed,
+            "frame_ms": self.drawing / self.frames * 1000 if self.frames else 0.0,
+            "worst_ms": self.worst * 1000,
+            "idle": self.waiting / total if total else 1.0,
+        }
+        self.reset()
+        return True
+
+    def describe(self):
+        if self.summary is None:
+            return "Klatki: pomiar..."
+        s = self.summary
+        return (f"Klatki: {s['fps']:.0f}/s  śr. {s['frame_ms']:.2f} ms  maks. {s['worst_ms']:.2f} ms  "
+                f"bezczynność {s['idle']:.1%}")
@@ -0,0 +1,196 @@
+"""Generator plansz Sudoku."""
+import math
+import random
+import time
+
+from sudoku_core import dlx, grader, solver
+from sudoku_core.board import Board
+from sudoku_core.profiling import profiler
+from sudoku_core.solver import solvable_by_singles
+from sudoku_core.units import BOX_SIZE, BOX_SIZES
+
+# Przedział oceny (sudoku_core.grader) dla każdego poziomu trudności
+DIFFICULTY_BANDS = {
+    "łatwy": (grader.HIDDEN_SINGLE, grader.NAKED_SINGLE),
+    "trudny": (grader.NAKED_PAIR, grader.GUESS),
+}
+# Przedziały zależne od rozmiaru (poziom, bok kwadratu): na planszy 4x4 każda plansza o jednym
+# rozwiązaniu rozwiązuje się pojedynczymi kandydaturami (sprawdzone na 3000 plansz wyciętych do
+# minimum), więc "trudny" oznacza tam planszę wyciętą do minimum, bez wymagań co do oceny
+SIZE_BANDS = {
+    ("trudny", 2): (grader.HIDDEN_SINGLE, grader.GUESS),
+}
+# Budżet ponownego wycinania w sprawdzeniach usunięć na pole planszy (9x9: 5 * 81 sprawdzeń, czyli
+# najwyżej ok. 70 ms). Liczony w sprawdzeniach, a nie w sekundach, żeby ziarno dawało tę samą planszę
+# na każdym komputerze
+CARVE_BUDGET = 5
+# Poziom łatwy usuwa najwyżej taką część pól jak pierwotny generator (30 z 81), żeby plansza
+# miała dużo wskazówek, a nie tylko dało się ją rozwiązać pojedynczymi kandydaturami
+EASY_REMOVED = 30 / 81
+# Silniki rozwiązujące do wyboru: (solve, count_solutions)
+BACKENDS = {
+    "bitmask": (solver.solve, solver.count_solutions),
+    "dlx": (dlx.solve, dlx.count_solutions),
+}
+DEFAULT_BACKEND = "bitmask"
+# Limit węzłów sprawdzenia jednoznaczności na planszach większych niż 9x9, według boku kwadratu.
+# Za mały limit odrzuca zbyt wiele usunięć i trudne plansze wypadają z przedziału (25x25 z limitem 0:
+# ocena 2), za duży tylko wydłuża generowanie; wartości sprawdza benchmarks/check_bands.py
+MAX_NODES = {
+    4: 16,
+    5: 8,
+}
+
+# Wersja algorytmu w identyfikatorach plansz: zmiana czegokolwiek, co wpływa na wynik
+# dla danego ziarna (losowanie, silnik, wycinanie, przedziały ocen), wymaga jej podbicia
+GENERATOR_VERSION = 4
+
+
+def puzzle_id(difficulty, seed, box_size=BOX_SIZE):
+    """Identyfikator planszy, np. "4-trudny-9x9-20240501"; ta sama wartość zawsze daje tę samą planszę."""
+    size = box_size * box_size
+    return f"{GENERATOR_VERSION}-{difficulty}-{size}x{size}-{seed}"
+
+
+def parse_puzzle_id(text):
+    """Zwraca (poziom, ziarno, bok kwadratu) z identyfikatora planszy; błędny identyfikator -> ValueError."""
+    parts = text.strip().split("-")
+    if len(parts) == 4 and parts[0].isdigit() and int(parts[0]) != GENERATOR_VERSION:
+        raise ValueError(f"Plansza z innej wersji generatora ({parts[0]}, obecna {GENERATOR_VERSION})")
+    try:
+        _, difficulty, size, seed = parts
+        rows, _, cols = size.partition("x")
+        box_size = math.isqrt(int(rows))
+        valid_size = rows == cols and box_size * box_size == int(rows) and box_size in BOX_SIZES
+        if difficulty in DIFFICULTY_BANDS and valid_size:
+            return difficulty, int(seed), box_size
+    except ValueError:
+        pass
+    raise ValueError(f"Niepoprawny identyfikator planszy: {text!r}")
+
+
+def difficulty_band(difficulty, box_size=BOX_SIZE):
+    """Przedział oceny (najniższa, najwyższa) dla poziomu na planszy o danym boku kwadratu."""
+    return SIZE_BANDS.get((difficulty, box_size), DIFFICULTY_BANDS[difficulty])
+
+
+def generate_by_id(text):
+    difficulty, seed, box_size = parse_puzzle_id(text)
+    generator = SudokuGenerator(difficulty, box_size, seed=seed)
+    return generator.board.to_grid(), generator.solution.to_grid()
+
+
+class SudokuGenerator:
+    def __init__(self, difficulty, box_size=BOX_SIZE, backend=DEFAULT_BACKEND, seed=None):
+        self.difficulty = difficulty
+        self.solve, self.count_solutions = BACKENDS[backend]
+        # Z ziarnem generator ma własny stan losowania, bez ziarna korzysta z globalnego `random`
+        self.random = random.Random(seed) if seed is not None else random
+        self.seed = seed
+        # Identyfikator odtwarza planszę tylko dla domyślnego silnika (inne inaczej uzupełniają pełną planszę)
+        self.puzzle_id = None
+        if seed is not None and backend == DEFAULT_BACKEND:
+            self.puzzle_id = puzzle_id(difficulty, seed, box_size)
+        self.box_size = box_size
+        self.grid_size = box_size * box_size
+        self.board = Board(box_size=box_size)
+        self.solution = Board(box_size=box_size)
+        started = time.perf_counter()
+        self.generate_complete_board()
+        self.remove_numbers()
+        if profiler.enabled:
+            profiler.count("generator/puzzles")
+            profiler.observe("generator", time.perf_counter() - started)
+
+    def generate_complete_board(self):
+        # Wypełnij przekątną kwadratów i rozwiąż resztę planszy; na małych planszach
+        # losowa przekątna bywa sprzeczna - wtedy losujemy ją od nowa
+        while True:
+            self.board = Board(box_size=self.box_size)
+            self.fill_diagonal()
+            if self.solve_sudoku():
+                break
+        self.solution = self.board.copy()
+
+    def fill_diagonal(self):
+        box = self.box_size
+        for i in range(0, self.grid_size, box):
+            nums = list(range(1, self.grid_size + 1))
+            self.random.shuffle(nums)
+            for r in range(box):
+                for c in range(box):
+                    self.board.set(i + r, i + c, nums.pop())
+
+    def is_valid(self, row, col, num):
+        # Wiersz, kolumna i kwadrat naraz - tablica sąsiadów pola
+        return self.board.is_valid(row, col, num)
+
+    def solve_sudoku(self):
+        solution = self.solve(self.board)
+        if solution is None:
+            return False
+        self.board = Board.from_grid(solution)
+        return True
+
+    def remove_numbers(self):
+        low, high = difficulty_band(self.difficulty, self.box_size)
+
+        # Wycinaj liczby z tego samego rozwiązania, aż plansza osiągnie przedział oceny. Nieudane
+        # wycinanie (np. każde usunięcie zostawia planszę rozwiązywalną pojedynczymi kandydaturami)
+        # zaczyna się od nowa w innej kolejności, dopóki starcza CARVE_BUDGET; potem zostaje ostatnia
+        # plansza, a `in_band` jest False (profiler liczy takie plansze jako "generator/out_of_band")
+        self.checks = 0
+        budget = CARVE_BUDGET * self.board.shape.cells
+        while True:
+            self.board = self.solution.copy()
+            if self.carve(low, high) or self.checks >= budget:
+                break
+        self.grade = grader.grade(self.board)
+        self.in_band = low <= self.grade.rating <= high
+        if not self.in_band and profiler.enabled:
+            profiler.count("generator/out_of_band")
+
+    def carve(self, low, high):
+        """Wycina liczby, oceniając planszę na bieżąco; zwraca True, gdy plansza osiągnęła przedział."""
+        # Indeksy pól w kolejności wierszy - to samo tasowanie co dla par (wiersz, kolumna)
+        cells = list(range(self.board.shape.cells))
+        self.random.shuffle(cells)
+        values = self.board.cells
+        # Poziom łatwy usuwa najwyżej EASY_REMOVED pól, pozostałe - ile się da
+        easy = high <= grader.NAKED_SINGLE
+        limit = round(len(cells) * EASY_REMOVED) if easy else len(cells)
+        carved = solver.CarvedBoard(self.board) if self.count_solutions is solver.count_solutions else None
+        removed = 0
+        singles = True  # Czy plansza nadal rozwiązuje się pojedynczymi kandydaturami (ocena do NAKED_SINGLE)
+        for i in cells:
+            if removed == limit:
+                break
+            self.checks += 1
+            num = values[i]
+            values[i] = 0
+            # Łatwa plansza zostawia usunięcie tylko wtedy, gdy pojedyncze kandydatury odtwarzają pole
+            kept = self.check_removal(carved, i, search=not easy)
+            if kept == 2 and singles:
+                # Plansza ma nadal jedno rozwiązanie, ale wymaga innych technik - ocena przekroczyła
+                # NAKED_SINGLE; przedział zaczynający się wyżej został właśnie osiągnięty
+                if low > grader.NAKED_SINGLE:
+                    return True
+                singles = False
+            if kept:
+                removed += 1
+                if carved:
+                    carved.remove(i)
+            else:
+                values[i] = num
+        return low <= grader.NAKED_SINGLE or not singles
+
+    def check_removal(self, carved, i, search):
+        # Wynik jak w solver.CarvedBoard.check; silnik inny niż domyślny liczy rozwiązania planszy bez pola
+        max_nodes = MAX_NODES.get(self.box_size)
+        if carved:
+            return carved.check(i, max_nodes, search)
+        if solvable_by_singles(self.board):
+            return 1
+        if not search or self.count_solutions(self.board, limit=2, max_nodes=max_nodes) != 1:
+            return 0
+        return 2
@@ -0,0 +1,236 @@
+"""Ocena trudności planszy na podstawie technik potrzebnych do jej rozwiązania.
+
+Plansza jest rozwiązywana "po ludzku": w każdym kroku stosowana jest najprostsza
+technika, która coś zmienia. Ocena (`Grade.rating`) to waga najtrudniejszej użytej
+techniki; gdy techniki nie wystarczają, pozostała część jest rozwiązywana
+przeszukiwaniem, a liczba jego węzłów trafia do `Grade.guesses`.
+"""
+from sudoku_core.solver import _Search
+from sudoku_core.units import shape_of
+
+HIDDEN_SINGLE = 1
+NAKED_SINGLE = 2
+NAKED_PAIR = 3
+LOCKED_CANDIDATES = 4
+HIDDEN_PAIR = 5
+X_WING = 6
+GUESS = 7
+
+TECHNIQUE_NAMES = {
+    HIDDEN_SINGLE: "hidden single",
+    NAKED_SINGLE: "naked single",
+    NAKED_PAIR: "naked pair",
+    LOCKED_CANDIDATES: "locked candidates",
+    HIDDEN_PAIR: "hidden pair",
+    X_WING: "x-wing",
+    GUESS: "guess",
+}
+
+
+class Grade:
+    def __init__(self, techniques, guesses):
+        self.techniques = techniques  # waga techniki -> liczba użyć
+        self.guesses = guesses
+        self.rating = max(techniques) if techniques else 0
+
+    @property
+    def name(self):
+        return TECHNIQUE_NAMES.get(self.rating, "brak")
+
+    def __repr__(self):
+        used = ", ".join(f"{TECHNIQUE_NAMES[t]}: {n}" for t, n in sorted(self.techniques.items()))
+        return f"Grade(rating={self.rating}, guesses={self.guesses}, {used})"
+
+
+class Contradiction(Exception):
+    """Plansza (albo stan po wykluczeniach) nie ma rozwiązania."""
+
+
+class CandidateBoard:
+    """Plansza z kandydatami pól; metody technik wykluczają kandydatów i zwracają, czy coś zmieniły."""
+
+    def __init__(self, grid):
+        self.shape = shape_of(grid)
+        self.cells = [num for row in grid for num in row]
+        self.cand = [0] * self.shape.cells
+        for i in range(self.shape.cells):
+            if not self.cells[i]:
+                self.cand[i] = self.candidates(i)
+                if not self.cand[i]:
+                    raise Contradiction
+
+    def candidates(self, i):
+        used = 0
+        for p in self.shape.peers[i]:
+            if self.cells[p]:
+                used |= 1 << self.cells[p]
+        return self.shape.all_digits & ~used
+
+    def place(self, i, num):
+        if not self.cand[i] & (1 << num):
+            raise Contradiction
+        self.cells[i] = num
+        self.cand[i] = 0
+        mask = ~(1 << num)
+        for p in self.shape.peers[i]:
+            if self.cand[p]:
+                self.cand[p] &= mask
+                if not self.cand[p]:
+                    raise Contradiction
+
+    def eliminate(self, cells, mask):
+        # Usuwa cyfry z `mask` z kandydatów podanych pól; zwraca True, jeśli coś usunięto
+        changed = False
+        for i in cells:
+            if self.cand[i] & mask:
+                self.cand[i] &= ~mask
+                if not self.cand[i]:
+                    raise Contradiction
+                changed = True
+        return changed
+
+    def solved(self):
+        return all(self.cells)
+
+    # Techniki: każda zwraca True, jeśli zmieniła stan planszy
+
+    def naked_single(self):
+        for i in range(self.shape.cells):
+            mask = self.cand[i]
+            if mask and not mask & (mask - 1):
+                self.place(i, self.shape.bit_digit[mask])
+                return True
+        return False
+
+    def hidden_single(self):
+        # Jedno przejście wstawia wszystkie znalezione ukryte pojedynki. Cyfry jednostki są
+        # sprawdzane rosnąco; po wstawieniu maski liczone są od nowa dla cyfr większych
+        found = False
+        cand, bit_digit = self.cand, self.shape.bit_digit
+        for unit in self.shape.units:
+            checked = 0
+            while True:
+                once = twice = 0
+                for i in unit:
+                    twice |= once & cand[i]
+                    once |= cand[i]
+                hidden = once & ~twice & ~checked
+                if not hidden:
+                    break
+                bit = hidden & -hidden
+                checked |= (bit << 1) - 1
+                self.place(next(i for i in unit if cand[i] & bit), bit_digit[bit])
+                found = True
+        return found
+
+    def naked_pair(self):
+        for unit in self.shape.units:
+            pairs = [i for i in unit if self.cand[i].bit_count() == 2]
+            for a in range(len(pairs)):
+                for b in range(a + 1, len(pairs)):
+                    mask = self.cand[pairs[a]]
+                    if mask == self.cand[pairs[b]]:
+                        others = [i for i in unit if i != pairs[a] and i != pairs[b]]
+                        if self.eliminate(others, mask):
+                            return True
+        return False
+
+    def locked_candidates(self):
+        shape = self.shape
+        for box in shape.boxes:
+            box_set = set(box)
+            for bit in shape.digit_bits:
+                where = [i for i in box if self.cand[i] & bit]
+                if len(where) < 2:
+                    continue
+                # Pointing: cyfra w kwadracie tylko w jednym wierszu lub kolumnie
+                for lines, index in ((shape.rows, shape.row_of[where[0]]), (shape.cols, shape.col_of[where[0]])):
+                    line = lines[index]
+                    if all(i in line for i in where):
+                        if self.eliminate([i for i in line if i not in box_set], bit):
+                            return True
+        for line in shape.rows + shape.cols:
+            line_set = set(line)
+            for bit in shape.digit_bits:
+                where = [i for i in line if self.cand[i] & bit]
+                if len(where) < 2:
+                    continue
+                # Claiming: cyfra w wierszu/kolumnie tylko w jednym kwadracie
+                box = shape.boxes[shape.box_of[where[0]]]
+                if all(i in box for i in where):
+                    if self.eliminate([i for i in box if i not in line_set], bit):
+                        return True
+        return False
+
+    def hidden_pair(self):
+        for unit in self.shape.units:
+            places = {}
+            for bit in self.shape.digit_bits:
+                where = tuple(i for i in unit if self.cand[i] & bit)
+                if len(where) == 2:
+                    places.setdefault(where, []).append(bit)
+            for where, bits in places.items():
+                if len(bits) == 2:
+                    keep = bits[0] | bits[1]
+                    if self.eliminate(where, self.shape.all_digits & ~keep):
+                        return True
+        return False
+
+    def x_wing(self):
+        shape = self.shape
+        for lines, crosses, position in ((shape.rows, shape.cols, shape.col_of),
+                                         (shape.cols, shape.rows, shape.row_of)):
+            for bit in shape.digit_bits:
+                found = {}
+                for index, line in enumerate(lines):
+                    where = tuple(position[i] for i in line if self.cand[i] & bit)
+                    if len(where) == 2:
+                        if where in found:
+                            skip = {found[where], index}
+                            cells = [i for p in where for k, i in enumerate(crosses[p]) if k not in skip]
+                            if self.eliminate(cells, bit):
+                                return True
+                        else:
+                            found[where] = index
+        return False
+
+
+# Techniki od najprostszej: (waga, metoda CandidateBoard)
+TECHNIQUES = (
+    (HIDDEN_SINGLE, CandidateBoard.hidden_single),
+    (NAKED_SINGLE, CandidateBoard.naked_single),
+    (NAKED_PAIR, CandidateBoard.naked_pair),
+    (LOCKED_CANDIDATES, CandidateBoard.locked_candidates),
+    (HIDDEN_PAIR, CandidateBoard.hidden_pair),
+    (X_WING, CandidateBoard.x_wing),
+)
+
+
+def grade(grid, max_rating=GUESS):
+    """Ocenia planszę; zwraca Grade albo None, gdy plansza jest sprzeczna.
+
+    Jeśli do postępu potrzebna jest technika trudniejsza niż `max_rating`, ocena kończy
+    się od razu z `rating` powyżej limitu - pozwala to szybko odrzucać plansze w generatorze.
+    """
+    techniques = {}
+    try:
+        board = CandidateBoard(grid)
+        while not board.solved():
+            for weight, technique in TECHNIQUES:
+                if weight > max_rating:
+                    return Grade({**techniques, weight: 1}, 0)
+                if technique(board):
+                    techniques[weight] = techniques.get(weight, 0) + 1
+                    break
+            else:
+                if max_rating < GUESS:
+                    return Grade({**techniques, GUESS: 1}, 0)
+                # Techniki nie wystarczają - reszta przeszukiwaniem
+                search = _Search(board.shape)
+                if not search.load(board.shape.to_grid(board.cells)) or not search.search(1):
+                    return None
+                techniques[GUESS] = 1
+                return Grade(techniques, search.nodes)
+    except Contradiction:
+        return None
+    return Grade(techniques, 0)
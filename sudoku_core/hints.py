@@ -0,0 +1,105 @@
+"""Podpowiedzi oparte na technikach logicznych.
+
+`HintEngine` trzyma mapę kandydatów aktualizowaną przy każdym wpisie, więc kolejne
+podpowiedzi korzystają z eliminacji znalezionych wcześniej zamiast liczyć je od nowa.
+"""
+from collections import namedtuple
+
+from sudoku_core.grader import HIDDEN_SINGLE, NAKED_SINGLE, TECHNIQUE_NAMES, TECHNIQUES, CandidateBoard, Contradiction
+from sudoku_core.units import shape_of
+
+
+class Hint(namedtuple("Hint", "row col num technique")):
+    __slots__ = ()
+
+    @property
+    def name(self):
+        return TECHNIQUE_NAMES[self.technique]
+
+
+# Techniki eliminujące kandydatów, od najprostszej
+_ELIMINATIONS = [(weight, technique) for weight, technique in TECHNIQUES if weight > NAKED_SINGLE]
+
+
+class HintEngine(CandidateBoard):
+    """Mapa kandydatów planszy gracza; wpisy muszą przechodzić przez `set`.
+
+    Wpisanie cyfry tylko zawęża kandydatów sąsiadów, więc wcześniejsze eliminacje
+    pozostają ważne. Usunięcie cyfry może je unieważnić - wtedy mapa jest liczona od nowa.
+    """
+
+    def __init__(self, board):
+        self.shape = shape_of(board)
+        self.cells = [num for row in board for num in row]
+        self.rebuild()
+
+    def rebuild(self):
+        self.cand = [0] * self.shape.cells
+        self.broken = False  # Sprzeczność na planszy gracza - podpowiedzi logiczne niemożliwe
+        for i in range(self.shape.cells):
+            if not self.cells[i]:
+                self.cand[i] = self.candidates(i)
+                if not self.cand[i]:
+                    self.broken = True
+
+    def set(self, row, col, num):
+        i = row * self.shape.grid_size + col
+        old = self.cells[i]
+        if old == num:
+            return
+        self.cells[i] = num
+        if old:
+            self.rebuild()
+            return
+        self.cand[i] = 0
+        mask = ~(1 << num)
+        for p in self.shape.peers[i]:
+            if self.cand[p]:
+                self.cand[p] &= mask
+                if not self.cand[p]:
+                    self.broken = True
+
+    def single(self):
+        # Najprostsze pole do wpisania bez zmiany stanu: (pole, cyfra, technika) albo None
+        cand, bit_digit = self.cand, self.shape.bit_digit
+        for unit in self.shape.units:
+            # Cyfry występujące w kandydatach jednostki dokładnie raz; najmniejsza jak dotąd
+            once = twice = 0
+            for i in unit:
+                twice |= once & cand[i]
+                once |= cand[i]
+            hidden = once & ~twice
+            if hidden:
+                bit = hidden & -hidden
+                return next(i for i in unit if cand[i] & bit), bit_digit[bit], HIDDEN_SINGLE
+        for i in range(self.shape.cells):
+            mask = self.cand[i]
+            if mask and not mask & (mask - 1):
+                return i, bit_digit[mask], NAKED_SINGLE
+        return None
+
+    def next_hint(self):
+        """Zwraca następny logicznie wynikający wpis (Hint) albo None.
+
+        Jeśli pole wymaga trudniejszej techniki, technika to najtrudniejsza eliminacja
+        użyta po drodze. None oznacza sprzeczną planszę lub konieczność zgadywania.
+        """
+        if self.broken:
+            return None
+        technique = 0
+        try:
+            while True:
+                found = self.single()
+                if found:
+                    i, num, weight = found
+                    row, col = divmod(i, self.shape.grid_size)
+                    return Hint(row, col, num, max(technique, weight))
+                for weight, eliminate in _ELIMINATIONS:
+                    if eliminate(self):
+                        technique = max(technique, weight)
+                        break
+                else:
+                    return None
+        except Contradiction:
+            self.broken = True
+            return None
@@ -0,0 +1,122 @@
+"""Dziennik ruchów gracza: cofanie i ponawianie, zapis przyrostowy i odtwarzanie partii.
+
+Ruch to rekord (pole, stara wartość, nowa wartość, czas gry). Rekordy są trzymane
+w równoległych tablicach `array`, a co `SNAPSHOT_EVERY` ruchów zapamiętywany jest
+stan planszy, więc stan po dowolnym ruchu odtwarza się z najbliższej migawki
+i co najwyżej `SNAPSHOT_EVERY - 1` ruchów.
+"""
+import struct
+from array import array
+
+SNAPSHOT_EVERY = 32
+
+# Rekord ruchu w zapisie: pole (2 bajty), stara i nowa wartość, czas gry w sekundach
+MOVE_RECORD = struct.Struct("<HBBf")
+
+
+def pack_moves(moves):
+    return b"".join(MOVE_RECORD.pack(*move) for move in moves)
+
+
+def unpack_moves(data):
+    return list(MOVE_RECORD.iter_unpack(data))
+
+
+def apply_moves(board, moves):
+    """Wpisuje do planszy (lista wierszy) nowe wartości z rekordów ruchów."""
+    n = len(board)
+    for cell, _, new, _ in moves:
+        board[cell // n][cell % n] = new
+    return board
+
+
+class MoveLog:
+    """Historia ruchów z pozycją bieżącą; ruchy za pozycją można ponowić.
+
+    Nowy ruch po cofnięciu usuwa ruchy do ponowienia. `unsaved` zwraca ruchy od
+    ostatniego zapisu; gdy cofnięto się przed ten zapis, zwraca różnicę plansz
+    w postaci ruchów, więc zapis przyrostowy zawsze prowadzi do bieżącego stanu.
+    """
+
+    def __init__(self, board, snapshot_every=SNAPSHOT_EVERY):
+        self.grid_size = len(board)
+        self.current = bytearray(num for row in board for num in row)
+        self.cells = array("H")
+        self.old = array("B")
+        self.new = array("B")
+        self.times = array("f")
+        self.position = 0
+        self.snapshot_every = snapshot_every
+        self.snapshots = {0: bytes(self.current)}
+        self.saved_position = 0
+        self.saved_board = bytes(self.current)
+        self.saved_history = True  # Czy ruchy do `saved_position` nadal są w historii
+
+    def __len__(self):
+        return len(self.cells)
+
+    def record(self, row, col, old, new, timestamp=0.0):
+        if old == new:
+            return
+        if self.position < len(self.cells):
+            # Nowy ruch po cofnięciu: ruchy do ponowienia i ich migawki przestają obowiązywać
+            for column in (self.cells, self.old, self.new, self.times):
+                del column[self.position:]
+            for position in [p for p in self.snapshots if p > self.position]:
+                del self.snapshots[position]
+            if self.position < self.saved_position:
+                self.saved_history = False
+        cell = row * self.grid_size + col
+        self.cells.append(cell)
+        self.old.append(old)
+        self.new.append(new)
+        self.times.append(timestamp)
+        self.current[cell] = new
+        self.position += 1
+        if self.position % self.snapshot_every == 0:
+            self.snapshots[self.position] = bytes(self.current)
+
+    def undo(self):
+        """Cofa ruch; zwraca (wiersz, kolumna, wartość do wpisania) albo None."""
+        if self.position == 0:
+            return None
+        self.position -= 1
+        cell, old = self.cells[self.position], self.old[self.position]
+        self.current[cell] = old
+        return cell // self.grid_size, cell % self.grid_size, old
+
+    def redo(self):
+        """Ponawia cofnięty ruch; zwraca (wiersz, kolumna, wartość do wpisania) albo None."""
+        if self.position == len(self.cells):
+            return None
+        cell, new = self.cells[self.position], self.new[self.position]
+        self.position += 1
+        self.current[cell] = new
+        return cell // self.grid_size, cell % self.grid_size, new
+
+    def move(self, index):
+        return self.cells[index], self.old[index], self.new[index], self.times[index]
+
+    def board_at(self, position):
+        """Plansza (lista wierszy) po `position` ruchach od początku dziennika."""
+        if not 0 <= position <= len(self.cells):
+            raise IndexError(f"Pozycja poza dziennikiem: {position}")
+        start = position - position % self.snapshot_every
+        cells = bytearray(self.snapshots[start])
+        for index in range(start, position):
+            cells[self.cells[index]] = self.new[index]
+        n = self.grid_size
+        return [list(cells[row * n:(row + 1) * n]) for row in range(n)]
+
+    def unsaved(self, timestamp=0.0):
+        """Ruchy prowadzące od stanu z ostatniego zapisu do bieżącej planszy."""
+        if self.saved_history and self.position >= self.saved_position:
+            return [self.move(index) for index in range(self.saved_position, self.position)]
+        # Cofnięto się przed zapis - zamiast historii różnica plansz
+        return [(cell, old, new, timestamp)
+                for cell, (old, new) in enumerate(zip(self.saved_board, self.current)) if old != new]
+
+    def mark_saved(self):
+        self.saved_position = self.position
+        self.saved_board = bytes(self.current)
+        self.saved_history = True
@@ -0,0 +1,150 @@
+"""Pula wcześniej wygenerowanych plansz uzupełniana w tle."""
+import json
+import os
+import threading
+import time
+from collections import deque
+
+from sudoku_core.codec import grid_from_string, grid_to_string
+from sudoku_core.generator import SudokuGenerator
+from sudoku_core.profiling import profiler
+from sudoku_core.units import BOX_SIZE
+
+DIFFICULTIES = ("łatwy", "trudny")
+POOL_FILE = "sudoku_pool.json"
+LOW_WATER = 5
+STOP_POLL = 0.1  # Co ile sekund wątek czekający na proces roboczy sprawdza, czy pula jest zamykana
+
+
+def generate_puzzle(difficulty, box_size=BOX_SIZE):
+    generator = SudokuGenerator(difficulty, box_size)
+    return generator.board.to_grid(), generator.solution.to_grid()
+
+
+def _key_name(kind):
+    # Klucz w pliku puli: sam poziom dla plansz 9x9 (jak w starszych plikach), inaczej "poziom/rozmiar kwadratu"
+    difficulty, box_size = kind
+    return difficulty if box_size == BOX_SIZE else f"{difficulty}/{box_size}"
+
+
+def _parse_key(name):
+    difficulty, _, box_size = name.partition("/")
+    return difficulty, int(box_size) if box_size else BOX_SIZE
+
+
+class PuzzlePool:
+    """Kolejka gotowych plansz dla każdego poziomu trudności i rozmiaru planszy.
+
+    Od startu uzupełniane są plansze 9x9; kolejka innego rozmiaru powstaje przy
+    pierwszym pobraniu planszy tego rozmiaru. Wątek w tle uzupełnia kolejki do
+    `low_water` plansz. Jeśli podano `executor` (np. ProcessPoolExecutor), generowanie
+    odbywa się w nim, a wątek tylko czeka na wynik, więc nie konkuruje z pętlą gry o GIL.
+    """
+
+    def __init__(self, difficulties=DIFFICULTIES, low_water=LOW_WATER, path=None, executor=None):
+        self.difficulties = difficulties
+        self.puzzles = {(difficulty, BOX_SIZE): deque() for difficulty in difficulties}
+        self.low_water = low_water
+        self.path = path
+        self.executor = executor
+        self.waiting = None  # Rodzaj planszy, o który poproszono przy pustej kolejce - uzupełniany jako pierwszy
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self.path:
+            self.load()
+        self._thread = threading.Thread(target=self._refill, name="puzzle-pool", daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.path:
+            self.save()
+
+    def prefetch(self, difficulty, box_size=BOX_SIZE):
+        # Zakłada kolejkę, żeby wątek zaczął ją uzupełniać jeszcze przed pierwszym pobraniem
+        self.puzzles.setdefault((difficulty, box_size), deque())
+        self._wake.set()
+
+    def pop(self, difficulty, box_size=BOX_SIZE):
+        """Zwraca (plansza, rozwiązanie) w O(1) albo None, gdy kolejka jest pusta."""
+        queue = self.puzzles.setdefault((difficulty, box_size), deque())
+        self._wake.set()
+        try:
+            return queue.popleft()
+        except IndexError:
+            self.waiting = (difficulty, box_size)
+            return None
+
+    def _refill(self):
+        # Import w wątku, a nie przy imporcie modułu - concurrent.futures wciąga logging (budżet importu gry)
+        from concurrent.futures import BrokenExecutor, CancelledError
+
+        while not self._stop.is_set():
+            kind = self.waiting
+            if kind is None or self.puzzles[kind]:
+                # Kopia kluczy - `pop` może w tym czasie dodać kolejkę nowego rozmiaru
+                kind = min(list(self.puzzles), key=lambda k: len(self.puzzles[k]))
+            if len(self.puzzles[kind]) >= self.low_water:
+                self._wake.wait()
+                self._wake.clear()
+                continue
+            started = time.perf_counter()
+            if self.executor is not None:
+                try:
+                    puzzle = self._wait(self.executor.submit(generate_puzzle, *kind))
+                except BrokenExecutor:
+                    # Proces roboczy niedostępny - dalej generuj w wątku
+                    self.executor = None
+                    continue
+                except (CancelledError, RuntimeError):
+                    # Właściciel zamknął pulę procesów (zadanie anulowane) - pula plansz też się zamyka
+                    return
+                if puzzle is None:
+                    return
+            else:
+                puzzle = generate_puzzle(*kind)
+            if profiler.enabled:
+                # Przy generowaniu w osobnym procesie liczniki generatora zostają w nim - tu tylko czas
+                profiler.observe("pool/generate", time.perf_counter() - started)
+            self.puzzles[kind].append(puzzle)
+
+    def _wait(self, future):
+        # Wynik procesu roboczego albo None, gdy pula została zamknięta - `close` nie czeka na całe generowanie
+        while not self._stop.is_set():
+            try:
+                return future.result(timeout=STOP_POLL)
+            except TimeoutError:
+                pass
+        future.cancel()
+        return None
+
+    def load(self):
+        try:
+            with open(self.path, "r") as f:
+                stored = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        for name, lines in stored.items():
+            kind = _parse_key(name)
+            if kind[0] in self.difficulties:
+                queue = self.puzzles.setdefault(kind, deque())
+                for line in lines:
+                    board, solution = line.split(",")
+                    queue.append((grid_from_string(board), grid_from_string(solution)))
+
+    def save(self):
+        stored = {_key_name(kind): [f"{grid_to_string(board)},{grid_to_string(solution)}"
+                                    for board, solution in puzzles]
+                  for kind, puzzles in list(self.puzzles.items())}
+        # Zapis przez plik tymczasowy, żeby przerwany zapis nie uszkodził puli
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(stored, f)
+        os.replace(tmp_path, self.path)
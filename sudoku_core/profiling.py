@@ -0,0 +1,99 @@
+"""Opcjonalne liczniki gorących ścieżek i pomiary czasu.
+
+Punkty pomiarowe w kodzie mają postać `if profiler.enabled: profiler.count(...)`,
+więc przy wyłączonym pomiarze kosztują jeden odczyt atrybutu. Pomiar włącza
+zmienna środowiskowa `SUDOKU_PROFILE` (`json` - liczniki zapisywane przy wyjściu
+do `sudoku_profile.json`, `cprofile` - dodatkowo profil cProfile w
+`sudoku_profile.prof`) odczytywana przy starcie gry albo klawisz F4 w grze.
+"""
+import json
+import time
+
+PROFILE_ENV = "SUDOKU_PROFILE"
+STATS_FILE = "sudoku_profile.json"
+CPROFILE_FILE = "sudoku_profile.prof"
+
+
+class Profiler:
+    def __init__(self):
+        self.enabled = False
+        self.cprofile = None
+        self.reset()
+
+    def reset(self):
+        self.started = time.perf_counter()
+        self.frames = 0
+        self.totals = {}  # licznik -> suma od włączenia
+        self.frame = {}  # liczniki bieżącej klatki
+        self.last_frame = {}  # liczniki ostatniej zakończonej klatki
+        self.peaks = {}  # licznik -> największa wartość w jednej klatce
+        self.timings = {}  # nazwa -> [liczba, suma w s, maksimum w s]
+        self.sizes = {}  # nazwa -> ostatni rozmiar w bajtach
+
+    def configure(self, mode):
+        """Włącza pomiar według wartości `SUDOKU_PROFILE` (None lub pusta - bez pomiaru)."""
+        if not mode:
+            return
+        self.enabled = True
+        if mode == "cprofile":
+            import cProfile
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+
+    def count(self, name, n=1):
+        self.frame[name] = self.frame.get(name, 0) + n
+        self.totals[name] = self.totals.get(name, 0) + n
+
+    def observe(self, name, seconds):
+        entry = self.timings.get(name)
+        if entry is None:
+            self.timings[name] = [1, seconds, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], seconds)
+
+    def size(self, name, size):
+        self.sizes[name] = size
+
+    def end_frame(self):
+        self.frames += 1
+        for name, value in self.frame.items():
+            if value > self.peaks.get(name, 0):
+                self.peaks[name] = value
+        self.last_frame, self.frame = self.frame, {}
+
+    def report(self):
+        return {
+            "seconds": time.perf_counter() - self.started,
+            "frames": self.frames,
+            "counters": {name: {"total": total, "per_frame": total / self.frames if self.frames else None,
+                                "peak_frame": self.peaks.get(name, 0)}
+                         for name, total in sorted(self.totals.items())},
+            "timings": {name: {"count": count, "mean_ms": total / count * 1000, "max_ms": worst * 1000}
+                        for name, (count, total, worst) in sorted(self.timings.items())},
+            "sizes": dict(sorted(self.sizes.items())),
+        }
+
+    def describe(self):
+        # Wiersze nakładki: liczniki ostatniej klatki, czasy i rozmiary
+        lines = ["Ostatnia klatka: " + (", ".join(f"{name} {value}" for name, value in sorted(self.last_frame.items()))
+                                        or "brak zliczeń")]
+        for name, (count, total, worst) in sorted(self.timings.items()):
+            lines.append(f"{name}: {count}x, śr. {total / count * 1000:.2f} ms, maks. {worst * 1000:.2f} ms")
+        for name, size in sorted(self.sizes.items()):
+            lines.append(f"{name}: {size / 1024:.1f} KiB")
+        return lines
+
+    def finish(self, stats_file=STATS_FILE, cprofile_file=CPROFILE_FILE):
+        """Zapisuje liczniki (JSON) i profil cProfile, jeśli pomiar był włączony."""
+        if self.cprofile is not None:
+            self.cprofile.disable()
+            self.cprofile.dump_stats(cprofile_file)
+            self.cprofile = None
+        if self.enabled:
+            with open(stats_file, "w") as f:
+                json.dump(self.report(), f, indent=2)
+
+
+profiler = Profiler()
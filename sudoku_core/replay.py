@@ -0,0 +1,181 @@
+"""Nagrania sesji gracza i syntetyczne sesje do odtwarzania gry bez okna.
+
+Sesja to jedna partia rozpoczęta przyciskiem "Nowa Gra": gracz, poziom, plansza
+startowa i rozwiązanie (tekst `sudoku_core.codec`) oraz lista akcji
+`[czas, nazwa, *argumenty]`, gdzie czas to sekundy od początku partii:
+
+    select wiersz kolumna   wybór pola
+    key symbol              wpis cyfry lub litery ("1".."9", dalej "A".."P")
+    clear                   Backspace/Delete w wybranym polu
+    undo, redo              Ctrl+Z / Ctrl+Y
+    pause, resume           pauza i powrót z pauzy
+    save                    zapis z menu pauzy
+    hint                    wskazówka
+
+Plik nagrań to JSON Lines - jedna sesja w linii, więc nagrania dopisuje się na
+końcu pliku i czyta strumieniowo. Nagrywanie w grze włącza zmienna środowiskowa
+`SUDOKU_RECORD` z nazwą pliku; `benchmarks/replay_sessions.py` odtwarza nagrania
+(lub sesje z `synthetic_session`) przez `Game.handle_events`.
+"""
+import json
+
+from sudoku_core.codec import grid_from_string, grid_to_string
+from sudoku_core.solver import SYMBOLS
+
+RECORD_ENV = "SUDOKU_RECORD"
+# Akcja -> liczba argumentów
+ACTIONS = {"select": 2, "key": 1, "clear": 0, "undo": 0, "redo": 0, "pause": 0, "resume": 0, "save": 0, "hint": 0}
+
+# Zachowanie syntetycznego gracza: średnie czasy namysłu (s) i prawdopodobieństwa akcji
+THINK_SELECT = 4.0
+THINK_KEY = 1.0
+PAUSE_SECONDS = (10.0, 120.0)
+MISTAKE_RATE = 0.12
+PAUSE_RATE = 0.02
+HINT_RATE = 0.02
+SAVE_EVERY = 10  # Liczba wpisów między zapisami
+MAX_ACTIONS = 2000
+
+
+class Session:
+    def __init__(self, player, difficulty, board, solution, actions=None):
+        self.player = player
+        self.difficulty = difficulty
+        self.board = board  # Plansza startowa jako tekst
+        self.solution = solution
+        self.actions = actions if actions is not None else []
+
+    def add(self, seconds, name, *args):
+        if ACTIONS.get(name) != len(args):
+            raise ValueError(f"Nieznana akcja lub zła liczba argumentów: {name} {args}")
+        self.actions.append([round(seconds, 3), name, *args])
+
+    @property
+    def duration(self):
+        return self.actions[-1][0] if self.actions else 0.0
+
+    def puzzle(self):
+        """(plansza, rozwiązanie) jako listy wierszy."""
+        return grid_from_string(self.board), grid_from_string(self.solution)
+
+    def to_json(self):
+        return json.dumps({"player": self.player, "difficulty": self.difficulty, "board": self.board,
+                           "solution": self.solution, "actions": self.actions},
+                          ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, text):
+        data = json.loads(text)
+        session = cls(data["player"], data["difficulty"], data["board"], data["solution"])
+        for seconds, name, *args in data["actions"]:
+            session.add(seconds, name, *args)
+        return session
+
+
+def read_sessions(path):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield Session.from_json(line)
+
+
+def write_sessions(path, sessions, mode="w"):
+    count = 0
+    with open(path, mode, encoding="utf-8") as f:
+        for session in sessions:
+            f.write(session.to_json() + "\n")
+            count += 1
+    return count
+
+
+class SessionRecorder:
+    """Nagrywa bieżącą partię; `finish` dopisuje ją do pliku nagrań."""
+
+    def __init__(self, path):
+        self.path = path
+        self.session = None
+        self.started = None
+
+    def start(self, now, player, difficulty, board, solution):
+        self.finish()
+        self.session = Session(player, difficulty, grid_to_string(board), grid_to_string(solution))
+        self.started = now
+
+    def record(self, now, name, *args):
+        if self.session is not None:
+            self.session.add((now - self.started).total_seconds(), name, *args)
+
+    def finish(self):
+        if self.session is not None:
+            write_sessions(self.path, [self.session], mode="a")
+            self.session = None
+
+
+def synthetic_session(rng, player, difficulty, board, solution, hint_count=3, save_every=SAVE_EVERY,
+                      max_actions=MAX_ACTIONS):
+    """Sesja gracza rozwiązującego planszę z błędami, cofaniem, pauzami, zapisami i wskazówkami.
+
+    `rng` to `random.Random`, więc to samo ziarno daje tę samą sesję. Model gracza zna
+    tylko własne wpisy (pola wypełnione wskazówką wpisuje jeszcze raz tą samą cyfrą,
+    co gra pomija), a każde jego pole kończy się cyfrą z rozwiązania, więc poprawnie
+    odtworzona sesja kończy się wygraną.
+    """
+    n = len(board)
+    session = Session(player, difficulty, grid_to_string(board), grid_to_string(solution))
+    values = {(row, col): board[row][col] for row in range(n) for col in range(n) if not board[row][col]}
+    seconds = 0.0
+
+    def act(think, name, *args):
+        nonlocal seconds
+        seconds += rng.expovariate(1 / think)
+        session.add(seconds, name, *args)
+
+    def pause_break(save):
+        nonlocal seconds
+        act(THINK_SELECT, "pause")
+        if save:
+            act(THINK_KEY, "save")
+        seconds += rng.uniform(*PAUSE_SECONDS)
+        act(THINK_KEY, "resume")
+
+    entries = 0
+    while len(session.actions) < max_actions:
+        wrong = [cell for cell, num in values.items() if num != solution[cell[0]][cell[1]]]
+        if not wrong:
+            break
+        if hint_count and rng.random() < HINT_RATE:
+            act(THINK_SELECT, "hint")
+            hint_count -= 1
+            continue
+        if rng.random() < PAUSE_RATE:
+            pause_break(save=False)
+
+        cell = rng.choice(wrong)
+        act(THINK_SELECT, "select", *cell)
+        correct = solution[cell[0]][cell[1]]
+        if rng.random() < MISTAKE_RATE:
+            # Błędna cyfra różna od obecnej - inaczej gra nie zapisze ruchu, a "undo" cofnęłoby inny
+            previous = values[cell]
+            mistake = rng.choice([num for num in range(1, n + 1) if num not in (correct, previous)])
+            act(THINK_KEY, "key", SYMBOLS[mistake - 1])
+            values[cell] = mistake
+            fix = rng.random()
+            if fix < 0.5:
+                act(THINK_KEY, "undo")
+                values[cell] = previous
+                if rng.random() < 0.2:
+                    # Ponowienie przez pomyłkę i usunięcie błędnej cyfry
+                    act(THINK_KEY, "redo")
+                    act(THINK_KEY, "clear")
+                    values[cell] = 0
+            elif fix < 0.8:
+                act(THINK_KEY, "clear")
+                values[cell] = 0
+            # Pozostałe błędy zostają do poprawienia przy kolejnym wyborze pola
+        else:
+            act(THINK_KEY, "key", SYMBOLS[correct - 1])
+            values[cell] = correct
+        entries += 1
+        if entries % save_every == 0:
+            pause_break(save=True)
+    return session
@@ -0,0 +1,107 @@
+"""Wyniki ukończonych partii i tabela najlepszych czasów.
+
+Każda wygrana partia to wiersz w bazie SQLite: gracz, poziom, rozmiar planszy,
+plansza (tekst `sudoku_core.codec` planszy startowej - plansze z puli nie mają
+identyfikatora generatora, a tekst wyznacza planszę jednoznacznie), czas gry w
+sekundach i liczba użytych wskazówek. Indeks (poziom, rozmiar, czas) daje N
+najlepszych czasów poziomu bez sortowania tabeli, a indeks (gracz, id) - historię
+gracza od najnowszej partii; oba zapytania czytają tylko zwracane wiersze, więc
+ich czas nie zależy od liczby wyników w bazie.
+"""
+import sqlite3
+from collections import namedtuple
+from datetime import datetime
+
+from sudoku_core.units import GRID_SIZE
+
+RESULTS_DB = "sudoku_results.db"
+TOP_LIMIT = 10
+HISTORY_LIMIT = 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    puzzle TEXT NOT NULL,
+    seconds INTEGER NOT NULL,
+    hints INTEGER NOT NULL,
+    finished TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_top ON results (difficulty, size, seconds, id);
+CREATE INDEX IF NOT EXISTS results_player ON results (player, id);
+"""
+
+COLUMNS = "id, player, difficulty, size, puzzle, seconds, hints, finished"
+Result = namedtuple("Result", COLUMNS)
+
+
+class ResultStore:
+    """Wyniki w bazie SQLite z tabelą najlepszych czasów trzymaną w pamięci.
+
+    Tabela najlepszych czasów (`top`) jest liczona raz na (poziom, rozmiar, limit)
+    i unieważniana tylko przez nowy wynik: dopisany przez `add` albo przez inny
+    proces (wykrywany przez `PRAGMA data_version`), więc ponowne rysowanie ekranu
+    końcowego nie odpytuje bazy.
+    """
+
+    def __init__(self, path=RESULTS_DB):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+        self.leaderboards = {}
+        self.data_version = self._data_version()
+
+    def close(self):
+        self.connection.close()
+
+    def _data_version(self):
+        return self.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def add(self, player, difficulty, size, puzzle, seconds, hints, finished=None):
+        """Dopisuje wynik partii i zwraca jego identyfikator."""
+        finished = (finished or datetime.now()).isoformat(timespec="seconds")
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO results (player, difficulty, size, puzzle, seconds, hints, finished) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", (player, difficulty, size, puzzle, seconds, hints, finished))
+        self.leaderboards.clear()
+        return cursor.lastrowid
+
+    def add_many(self, results):
+        """Dopisuje wiele wyników (krotki jak argumenty `add`, z `finished` jako tekstem) w jednej transakcji."""
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO results (player, difficulty, size, puzzle, seconds, hints, finished) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", results)
+        self.leaderboards.clear()
+
+    def top(self, difficulty, size=GRID_SIZE, limit=TOP_LIMIT):
+        """N najlepszych czasów poziomu (przy równym czasie wcześniejszy wynik wyżej)."""
+        data_version = self._data_version()
+        if data_version != self.data_version:
+            # Wynik dopisany przez inne połączenie z bazą
+            self.data_version = data_version
+            self.leaderboards.clear()
+        key = (difficulty, size, limit)
+        leaderboard = self.leaderboards.get(key)
+        if leaderboard is None:
+            leaderboard = self.leaderboards[key] = self.query_top(difficulty, size, limit)
+        return leaderboard
+
+    def query_top(self, difficulty, size=GRID_SIZE, limit=TOP_LIMIT):
+        # Zapytanie do bazy bez tabeli w pamięci
+        return [Result(*row) for row in self.connection.execute(
+            f"SELECT {COLUMNS} FROM results WHERE difficulty = ? AND size = ? ORDER BY seconds, id LIMIT ?",
+            (difficulty, size, limit))]
+
+    def history(self, player, limit=HISTORY_LIMIT):
+        """Ostatnie partie gracza, od najnowszej."""
+        return [Result(*row) for row in self.connection.execute(
+            f"SELECT {COLUMNS} FROM results WHERE player = ? ORDER BY id DESC LIMIT ?", (player, limit))]
+
+    def count(self):
+        return self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
@@ -0,0 +1,184 @@
+"""Format i przechowywanie zapisów gry."""
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+from sudoku_core.board import Board
+from sudoku_core.codec import decode_grid, decode_puzzle, encode_grid, encode_puzzle
+from sudoku_core.moves import apply_moves, unpack_moves
+from sudoku_core.units import GRID_SIZE
+
+SAVE_DB = "sudoku_saves.db"
+LEGACY_SAVE_FILE = "sudoku_saves.json"
+DEFAULT_HINT_COUNT = 3
+
+# Plansze 9x9 trafiają do kolumn binarnych (sudoku_core.codec), w `data` zostają pozostałe pola;
+# plansze innych rozmiarów zostają w całości w `data`
+BOARD_FIELDS = ("board", "solution", "givens")
+# Po tylu zapisach przyrostowych z rzędu kolejny zapis jest pełny, żeby odczyt nie składał długiego łańcucha
+FULL_SAVE_EVERY = 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS saves (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    data TEXT NOT NULL,
+    board BLOB,
+    puzzle BLOB,
+    base INTEGER,
+    moves BLOB
+);
+CREATE INDEX IF NOT EXISTS saves_player ON saves (player, id);
+"""
+
+# Kolumny dodane po pierwszej wersji bazy; starsze bazy są uzupełniane przy otwarciu
+ADDED_COLUMNS = {"board": "BLOB", "puzzle": "BLOB", "base": "INTEGER", "moves": "BLOB"}
+
+
+def _json_value(value):
+    # Plansze `Board` w zapisach JSON (rozmiary inne niż 9x9) jako listy wierszy
+    if isinstance(value, Board):
+        return value.to_grid()
+    raise TypeError(f"Nieobsługiwany typ w zapisie: {type(value).__name__}")
+
+
+def make_save(player, difficulty, board, solution, givens, elapsed_time, hint_count):
+    return {
+        "board": board,
+        "solution": solution,
+        "givens": givens,
+        "difficulty": difficulty,
+        "player": player,
+        "elapsed_time": elapsed_time,
+        "timestamp": datetime.now().isoformat(),
+        "hint_count": hint_count
+    }
+
+
+class SaveStore:
+    """Zapisy w bazie SQLite: każdy zapis to nowy wiersz dopisany w osobnej transakcji.
+
+    Indeks (player, id) sprawia, że odczyt najnowszego zapisu gracza nie zależy
+    od liczby zapisów pozostałych graczy, a przerwany zapis nie psuje wcześniejszych.
+    """
+
+    def __init__(self, path=SAVE_DB):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+            # Bazy utworzone przed zapisem binarnym trzymały plansze w `data`
+            columns = {row[1] for row in self.connection.execute("PRAGMA table_info(saves)")}
+            for column, kind in ADDED_COLUMNS.items():
+                if column not in columns:
+                    self.connection.execute(f"ALTER TABLE saves ADD COLUMN {column} {kind}")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS saves_base ON saves (base, id)")
+
+    def close(self):
+        self.connection.close()
+
+    def file_size(self):
+        # Rozmiar bazy razem z dziennikiem WAL, do którego zapisy trafiają najpierw
+        return sum(os.path.getsize(path) for path in (self.path, self.path + "-wal") if os.path.exists(path))
+
+    def append(self, save_data):
+        """Dopisuje pełny zapis i zwraca jego identyfikator (podstawę kolejnych zapisów przyrostowych)."""
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO saves (player, timestamp, data, board, puzzle) VALUES (?, ?, ?, ?, ?)",
+                self._row(save_data))
+        return cursor.lastrowid
+
+    def append_delta(self, base, save_data, moves):
+        """Dopisuje zapis przyrostowy: tylko ruchy (`moves.pack_moves`) od poprzedniego zapisu partii.
+
+        `base` to identyfikator pełnego zapisu, od którego zaczyna się łańcuch.
+        Plansze w `save_data` są pomijane - odtwarza je `latest`.
+        """
+        fields = {key: value for key, value in save_data.items() if key not in BOARD_FIELDS}
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO saves (player, timestamp, data, base, moves) VALUES (?, ?, ?, ?, ?)",
+                (save_data["player"], save_data["timestamp"], json.dumps(fields, separators=(",", ":")), base,
+                 moves))
+
+    def append_many(self, saves):
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO saves (player, timestamp, data, board, puzzle) VALUES (?, ?, ?, ?, ?)",
+                [self._row(save_data) for save_data in saves])
+
+    @staticmethod
+    def _row(save_data):
+        if len(save_data["board"]) != GRID_SIZE:
+            data = json.dumps(save_data, separators=(",", ":"), default=_json_value)
+            return save_data["player"], save_data["timestamp"], data, None, None
+        fields = {key: value for key, value in save_data.items() if key not in BOARD_FIELDS}
+        board = encode_grid(save_data["board"])
+        if "givens" in save_data:
+            puzzle = encode_puzzle(save_data["givens"], save_data["solution"])
+        else:
+            # Dawne zapisy bez wskazówek: zachowujemy tylko rozwiązanie
+            puzzle = encode_grid(save_data["solution"])
+        return save_data["player"], save_data["timestamp"], json.dumps(fields, separators=(",", ":")), board, puzzle
+
+    def latest(self, player):
+        """Zwraca najnowszy zapis gracza lub None."""
+        row = self.connection.execute(
+            "SELECT id, data, board, puzzle, base FROM saves WHERE player = ? ORDER BY id DESC LIMIT 1",
+            (player,)).fetchone()
+        if row is None:
+            return None
+        save_id, data, board, puzzle, base = row
+        if base is None:
+            return self._decode(data, board, puzzle)
+
+        # Zapis przyrostowy: pełny zapis z początku łańcucha i kolejne ruchy do tego zapisu
+        save_data = self._decode(*self.connection.execute(
+            "SELECT data, board, puzzle FROM saves WHERE id = ?", (base,)).fetchone())
+        for (moves,) in self.connection.execute(
+                "SELECT moves FROM saves WHERE base = ? AND id <= ? ORDER BY id", (base, save_id)):
+            apply_moves(save_data["board"], unpack_moves(moves))
+        save_data.update(json.loads(data))
+        return save_data
+
+    @staticmethod
+    def _decode(data, board, puzzle):
+        save_data = json.loads(data)
+        if board is not None:
+            save_data["board"] = decode_grid(board)
+            if len(puzzle) == len(board):
+                save_data["solution"] = decode_grid(puzzle)
+            else:
+                save_data["givens"], save_data["solution"] = decode_puzzle(puzzle)
+        save_data.setdefault("hint_count", DEFAULT_HINT_COUNT)
+        # Starsze zapisy nie zawierają wskazówek planszy - wszystkie pola są wtedy edytowalne
+        save_data.setdefault("givens", [[0] * len(row) for row in save_data["board"]])
+        return save_data
+
+
+def migrate_json(store, path=LEGACY_SAVE_FILE):
+    """Przenosi zapisy z dawnego pliku JSON do bazy i zmienia nazwę pliku na *.migrated.
+
+    Zwraca liczbę przeniesionych zapisów (0, jeśli pliku nie ma).
+    """
+    try:
+        with open(path, "r") as f:
+            saves = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return 0
+
+    migrated = []
+    for player, player_saves in saves.items():
+        for save_data in player_saves:
+            save_data.setdefault("player", player)
+            save_data.setdefault("timestamp", "")
+            migrated.append(save_data)
+    # Kolejność w bazie wyznacza "najnowszy" zapis, więc zachowujemy porządek czasowy
+    migrated.sort(key=lambda save_data: save_data["timestamp"])
+    store.append_many(migrated)
+    os.replace(path, path + ".migrated")
+    return len(migrated)
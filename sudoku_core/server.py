@@ -0,0 +1,263 @@
+"""Usługa HTTP wydająca, rozwiązująca i sprawdzająca plansze (asyncio, tylko biblioteka standardowa).
+
+Końcówki:
+    GET  /puzzle?difficulty=łatwy&size=9   plansza z puli gotowych plansz
+    GET  /puzzle?id=4-trudny-9x9-12345     plansza o danym identyfikatorze
+    POST /solve     {"board": [[...]]} lub {"board": "81 znaków"}
+    POST /validate  {"board": ...}
+    GET  /stats     liczniki żądań, połączonych żądań i stan puli
+
+Rozwiązywanie i generowanie odbywa się w puli procesów, więc pętla zdarzeń obsługuje
+w tym czasie inne połączenia. Jednakowe równoczesne żądania (ta sama plansza do
+rozwiązania, ten sam identyfikator) są łączone i czekają na jeden wynik.
+"""
+import asyncio
+import json
+import math
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+from sudoku_core.board import Board
+from sudoku_core.codec import grid_from_string, grid_to_string
+from sudoku_core.conflicts import ConflictTracker
+from sudoku_core.generator import generate_by_id, parse_puzzle_id
+from sudoku_core.pool import DIFFICULTIES, PuzzlePool, generate_puzzle
+from sudoku_core.solver import solve_unique
+from sudoku_core.units import BOX_SIZES, CELLS
+
+HOST = "127.0.0.1"
+PORT = 8080
+POOL_SIZE = 50
+MAX_BODY = 64 * 1024
+# Limit węzłów przeszukiwania w /solve dla planszy 9x9; większe plansze dostają proporcjonalnie mniej węzłów
+# (węzeł planszy n x n kosztuje mniej więcej tyle, ile jej pól), czyli ok. 2 s procesu roboczego na żądanie
+SOLVE_MAX_NODES = 20_000
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+            422: "Unprocessable Entity", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def solve_text(text):
+    """Wykonywane w procesie roboczym: tekst planszy -> (tekst rozwiązania lub None, czy jedyne).
+
+    Czy jedyne jest None, gdy przeszukiwanie przekroczyło limit węzłów.
+    """
+    solution, unique = solve_unique(grid_from_string(text), max_nodes=SOLVE_MAX_NODES * CELLS // len(text))
+    return (grid_to_string(solution) if solution else None), unique
+
+
+def init_worker():
+    """Procesy robocze ignorują Ctrl+C - zamknięciem puli zajmuje się proces główny."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def generate_text(puzzle_id):
+    board, solution = generate_by_id(puzzle_id)
+    return grid_to_string(board), grid_to_string(solution)
+
+
+def parse_board(value):
+    """Plansza z JSON: lista wierszy albo tekst; zwraca listę wierszy lub zgłasza HTTPError 400."""
+    try:
+        grid = grid_from_string(value) if isinstance(value, str) else value
+        size = len(grid)
+        if math.isqrt(size) not in BOX_SIZES or math.isqrt(size) ** 2 != size:
+            raise ValueError(f"Nieobsługiwany rozmiar planszy: {size}")
+        for row in grid:
+            if len(row) != size or not all(type(num) is int and 0 <= num <= size for num in row):
+                raise ValueError("Plansza musi być kwadratem liczb 0..n")
+        return grid
+    except (TypeError, ValueError) as error:
+        raise HTTPError(400, str(error)) from None
+
+
+class Coalescer:
+    """Łączy równoczesne wywołania o tym samym kluczu w jedno zadanie."""
+
+    def __init__(self):
+        self.pending = {}
+        self.coalesced = 0
+
+    async def run(self, key, factory):
+        task = self.pending.get(key)
+        if task is None:
+            task = self.pending[key] = asyncio.ensure_future(factory())
+            task.add_done_callback(lambda _: self.pending.pop(key, None))
+        else:
+            self.coalesced += 1
+        # Rozłączenie jednego klienta nie może anulować wyniku, na który czekają inni
+        return await asyncio.shield(task)
+
+
+class PuzzleServer:
+    def __init__(self, workers=None, pool_size=POOL_SIZE, pool_file=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker)
+        # Z plikiem puli plansze wygenerowane przed zamknięciem są dostępne od razu po starcie
+        self.pool = PuzzlePool(low_water=pool_size, path=pool_file, executor=self.executor)
+        self.coalescer = Coalescer()
+        self.requests = 0
+
+    def start(self):
+        self.pool.start()
+
+    def close(self):
+        # Najpierw pula procesów: anulowane zadania kończą oczekiwanie wątku uzupełniającego,
+        # więc pool.close() od razu zapisuje plik puli
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.pool.close()
+
+    async def in_executor(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    async def puzzle(self, query):
+        if "id" in query:
+            puzzle_id = query["id"][0]
+            try:
+                parse_puzzle_id(puzzle_id)
+            except ValueError as error:
+                raise HTTPError(400, str(error)) from None
+            board, solution = await self.coalescer.run(("id", puzzle_id),
+                                                       lambda: self.in_executor(generate_text, puzzle_id))
+            return {"id": puzzle_id, "board": board, "solution": solution}
+
+        difficulty = query.get("difficulty", ["łatwy"])[0]
+        if difficulty not in DIFFICULTIES:
+            raise HTTPError(400, f"Nieznany poziom: {difficulty}")
+        size = query.get("size", ["9"])[0]
+        try:
+            size = int(size)
+        except ValueError:
+            raise HTTPError(400, f"Rozmiar musi być liczbą całkowitą, otrzymano {size!r}") from None
+        box_size = math.isqrt(max(size, 0))
+        if box_size * box_size != size or box_size not in BOX_SIZES:
+            raise HTTPError(400, "Obsługiwane rozmiary: 4, 9, 16, 25")
+        puzzle = self.pool.pop(difficulty, box_size)
+        if puzzle is None:
+            # Pusta pula - generowanie w procesie roboczym, pętla obsługuje w tym czasie inne żądania
+            puzzle = await self.in_executor(generate_puzzle, difficulty, box_size)
+        board, solution = puzzle
+        return {"board": grid_to_string(board), "solution": grid_to_string(solution)}
+
+    async def solve(self, body):
+        text = grid_to_string(parse_board(body.get("board")))
+        solution, unique = await self.coalescer.run(("solve", text), lambda: self.in_executor(solve_text, text))
+        if unique is None:
+            raise HTTPError(422, "Plansza nierozstrzygnięta w limicie przeszukiwania (zwykle zbyt mało wskazówek)")
+        return {"solved": solution is not None, "solution": solution, "unique": unique}
+
+    async def validate(self, body):
+        # Tanie sprawdzenie liczników - bez puli procesów
+        board = parse_board(body.get("board"))
+        tracker = ConflictTracker(Board.from_grid(board))
+        return {"valid": not tracker.cells, "complete": tracker.is_solved(),
+                "conflicts": sorted([row, col] for row, col in tracker.cells)}
+
+    def stats(self):
+        return {"requests": self.requests, "coalesced": self.coalescer.coalesced,
+                "pool": {f"{difficulty}/{box_size * box_size}": len(queue)
+                         for (difficulty, box_size), queue in list(self.pool.puzzles.items())}}
+
+    async def dispatch(self, method, target, body):
+        url = urlsplit(target)
+        if url.path == "/stats":
+            if method != "GET":
+                raise HTTPError(405, "Dozwolona metoda: GET")
+            return self.stats()
+        if url.path == "/puzzle":
+            if method != "GET":
+                raise HTTPError(405, "Dozwolona metoda: GET")
+            return await self.puzzle(parse_qs(url.query))
+        if url.path in ("/solve", "/validate"):
+            if method != "POST":
+                raise HTTPError(405, "Dozwolona metoda: POST")
+            try:
+                data = json.loads(body or b"{}")
+            except ValueError:
+                raise HTTPError(400, "Treść żądania nie jest poprawnym JSON") from None
+            if not isinstance(data, dict):
+                raise HTTPError(400, "Oczekiwano obiektu JSON")
+            handler = self.solve if url.path == "/solve" else self.validate
+            return await handler(data)
+        raise HTTPError(404, f"Nieznana ścieżka: {url.path}")
+
+    async def handle_connection(self, reader, writer):
+        # Utrzymywanie połączenia: kolejne żądania na tym samym gnieździe (HTTP/1.1 domyślnie,
+        # HTTP/1.0 tylko z nagłówkiem "Connection: keep-alive")
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split(" ", 2)
+                except ValueError:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                self.requests += 1
+                try:
+                    length = int(headers.get("content-length", 0))
+                    if length > MAX_BODY:
+                        raise HTTPError(413, "Zbyt duża treść żądania")
+                    body = await reader.readexactly(length) if length else b""
+                    status, payload = 200, await self.dispatch(method, target, body)
+                except HTTPError as error:
+                    status, payload = error.status, {"error": str(error)}
+                except ValueError:
+                    status, payload = 400, {"error": "Niepoprawny nagłówek Content-Length"}
+                except Exception as error:  # Błąd jednego żądania nie może zatrzymać serwera
+                    status, payload = 500, {"error": repr(error)}
+
+                data = json.dumps(payload, ensure_ascii=False).encode()
+                connection = headers.get("connection", "").lower()
+                if version.strip() == "HTTP/1.0":
+                    keep_alive = connection == "keep-alive"
+                else:
+                    keep_alive = connection != "close"
+                writer.write(f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                             f"Content-Type: application/json; charset=utf-8\r\n"
+                             f"Content-Length: {len(data)}\r\n"
+                             f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host=HOST, port=PORT, workers=None, pool_size=POOL_SIZE, pool_file=None):
+    server = PuzzleServer(workers, pool_size, pool_file)
+    server.start()
+    try:
+        listener = await asyncio.start_server(server.handle_connection, host, port)
+        async with listener:
+            print(f"Serwer plansz na http://{host}:{port} (procesy: {server.workers}, "
+                  f"pula: {pool_size} plansz na poziom)", flush=True)
+            await listener.serve_forever()
+    finally:
+        server.close()
+
+
+def run(args):
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.pool_size, args.pool_file))
+    except KeyboardInterrupt:
+        pass
+    return 0
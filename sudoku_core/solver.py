@@ -0,0 +1,380 @@
+"""Silnik rozwiązujący Sudoku oparty na maskach bitowych."""
+import copy
+from itertools import chain
+
+from sudoku_core.profiling import profiler
+from sudoku_core.units import GRID_SIZE, SHAPE, shape_of
+# Stałe rozmiaru i kształty plansz są w sudoku_core.units; nazwy zostają tu dla dawnych importów
+from sudoku_core.units import BOX_SIZE, BOX_SIZES, CELLS, Shape, get_shape  # noqa: F401
+
+ALL_DIGITS = ((1 << GRID_SIZE) - 1) << 1  # Bity 1..9, bit 0 nieużywany
+
+# Znaki cyfr na planszach do 25x25
+SYMBOLS = "123456789ABCDEFGHIJKLMNOP"
+
+
+_TABLES = {}
+
+
+def _tables(shape):
+    # Dla każdego pola: pozycje jego trzech jednostek w `_Search.counts` (bez cyfry) oraz sąsiedzi
+    # wraz z pozycjami tylko tych swoich jednostek, których pole nie współdzieli - w jednostkach
+    # wspólnych wstawiona cyfra jest już użyta, więc ich liczników dla niej nie trzeba zmieniać
+    tables = _TABLES.get(shape.box_size)
+    if tables is None:
+        stride = shape.grid_size + 1
+        bases = tuple(tuple(u * stride for u in units) for units in shape.units_of)
+        peer_keys = tuple(
+            tuple((p, tuple(base for u, base in zip(shape.units_of[p], bases[p]) if u not in shape.units_of[i]))
+                  for p in shape.peers[i])
+            for i in range(shape.cells))
+        tables = _TABLES[shape.box_size] = bases, peer_keys
+    return tables
+
+
+class _Search:
+    def __init__(self, shape=SHAPE):
+        self.shape = shape
+        n = shape.grid_size
+        self.bases, self.peer_keys = _tables(shape)
+        self.cells = [0] * shape.cells
+        # Kandydaci każdego pola jako maska bitowa; pole z wpisaną cyfrą ma 0
+        self.cand = [shape.all_digits] * shape.cells
+        # Cyfry wpisane w każdej jednostce (indeksy jak w `shape.units`)
+        self.used = [0] * len(shape.units)
+        # counts[u * (n + 1) + d]: w ilu pustych polach jednostki u cyfra d jest kandydatem
+        # (aktualne tylko dla cyfr jeszcze nie wpisanych w jednostce)
+        self.stride = n + 1
+        self.counts = [n] * (len(shape.units) * self.stride)
+        # Pola z jednym kandydatem i pozycje counts, w których cyfra ma jedno miejsce - do wstawienia
+        self.singles = []
+        self.hidden = []
+        self.solutions = []
+        self.nodes = 0  # Liczba odwiedzonych węzłów drzewa przeszukiwania
+        self.max_nodes = None  # Limit węzłów; po jego przekroczeniu przeszukiwanie się poddaje
+
+    def load(self, grid):
+        # Zwraca False, jeśli podane wskazówki same sobie przeczą albo któreś pole lub cyfra
+        # w jednostce nie ma miejsca. Kandydaci i liczniki są liczeni naraz, nie przez `place`.
+        shape = self.shape
+        cells, cand, used = self.cells, self.cand, self.used
+        units_of = shape.units_of
+        for i, num in enumerate(chain.from_iterable(grid)):
+            if num:
+                bit = 1 << num
+                r, c, b = units_of[i]
+                if bit & (used[r] | used[c] | used[b]):
+                    return False
+                cells[i] = num
+                used[r] |= bit
+                used[c] |= bit
+                used[b] |= bit
+
+        counts = self.counts = [0] * len(self.counts)
+        all_digits, bit_digit, bases = shape.all_digits, shape.bit_digit, self.bases
+        for i, num in enumerate(cells):
+            if num:
+                cand[i] = 0
+                continue
+            r, c, b = units_of[i]
+            mask = cand[i] = all_digits & ~(used[r] | used[c] | used[b])
+            if not mask & (mask - 1):
+                if not mask:
+                    return False
+                self.singles.append(i)
+            while mask:
+                low = mask & -mask
+                mask ^= low
+                d = bit_digit[low]
+                for k in bases[i]:
+                    counts[k + d] += 1
+        stride = self.stride
+        for u, mask in enumerate(used):
+            mask = all_digits & ~mask
+            while mask:
+                low = mask & -mask
+                mask ^= low
+                k = u * stride + bit_digit[low]
+                if counts[k] < 2:
+                    if not counts[k]:
+                        return False
+                    self.hidden.append(k)
+        return True
+
+    def place(self, i, num):
+        # Wpisuje cyfrę i przyrostowo aktualizuje kandydatów sąsiadów i liczniki jednostek.
+        # Zwraca False przy sprzeczności (cyfra nie jest kandydatem, pole lub cyfra bez miejsca).
+        bit = 1 << num
+        cand, counts, hidden = self.cand, self.counts, self.hidden
+        mask = cand[i]
+        if not mask & bit:
+            return False
+        self.cells[i] = num
+        cand[i] = 0
+        used = self.used
+        for u in self.shape.units_of[i]:
+            used[u] |= bit
+        # Pole przestaje być miejscem dla pozostałych kandydatów (liczniki wstawionej cyfry
+        # w jednostkach pola nie są już potrzebne)
+        mask ^= bit
+        if mask:
+            bit_digit, bases = self.shape.bit_digit, self.bases[i]
+            while mask:
+                low = mask & -mask
+                mask ^= low
+                d = bit_digit[low]
+                for k in bases:
+                    k += d
+                    count = counts[k] - 1
+                    counts[k] = count
+                    if count < 2:
+                        if not count:
+                            return False
+                        hidden.append(k)
+        for p, keys in self.peer_keys[i]:
+            mask = cand[p]
+            if mask & bit:
+                mask ^= bit
+                cand[p] = mask
+                if not mask & (mask - 1):
+                    if not mask:
+                        return False
+                    self.singles.append(p)
+                for k in keys:
+                    k += num
+                    count = counts[k] - 1
+                    counts[k] = count
+                    if count < 2:
+                        if not count:
+                            return False
+                        hidden.append(k)
+        return True
+
+    def copy(self):
+        other = copy.copy(self)
+        other.cells, other.cand, other.used, other.counts = self.save()
+        other.singles, other.hidden, other.solutions = self.singles[:], self.hidden[:], []
+        return other
+
+    def clear(self, i):
+        # Usuwa wskazówkę z pola w stanie zaraz po `load` (przed propagacją) - tak, jakby
+        # plansza była wczytana bez niej. Zmieniają się tylko kandydaci pola i jego sąsiadów,
+        # liczniki cyfr w ich jednostkach oraz kolejki pojedynczych kandydatur.
+        shape, cells, cand, used, counts = self.shape, self.cells, self.cand, self.used, self.counts
+        units_of, bit_digit, bases = shape.units_of, shape.bit_digit, self.bases[i]
+        num = cells[i]
+        bit = 1 << num
+        cells[i] = 0
+        r, c, b = units_of[i]
+        used[r] ^= bit
+        used[c] ^= bit
+        used[b] ^= bit
+        mask = cand[i] = shape.all_digits & ~(used[r] | used[c] | used[b])
+        # Pozostali kandydaci pola nie są użyci w jego jednostkach - ich liczniki rosną o to pole
+        mask ^= bit
+        while mask:
+            low = mask & -mask
+            mask ^= low
+            d = bit_digit[low]
+            for k in bases:
+                counts[k + d] += 1
+        for p, keys in self.peer_keys[i]:
+            if not cells[p]:
+                r, c, b = units_of[p]
+                if not (used[r] | used[c] | used[b]) & bit:
+                    cand[p] |= bit
+                    for k in keys:
+                        counts[k + num] += 1
+        # W jednostkach pola cyfra była użyta (licznik nieaktualny), więc liczy się ją od nowa
+        for k, u in zip(bases, units_of[i]):
+            count = counts[k + num] = sum(1 for j in shape.units[u] if cand[j] & bit)
+            if count == 1:
+                self.hidden.append(k + num)
+        # Sąsiedzi zyskali kandydata, więc część wpisów w kolejkach jest już nieaktualna
+        self.singles = [j for j in self.singles if not cand[j] & (cand[j] - 1)]
+        if not cand[i] & (cand[i] - 1):
+            self.singles.append(i)
+        self.hidden = [k for k in self.hidden if counts[k] == 1]
+
+    def save(self):
+        return self.cells[:], self.cand[:], self.used[:], self.counts[:]
+
+    def restore(self, state):
+        # Cofnięcie wszystkiego, co wstawiono od `save` (nawrót w przeszukiwaniu)
+        self.cells[:], self.cand[:], self.used[:], self.counts[:] = state
+        self.singles.clear()
+        self.hidden.clear()
+
+    def propagate(self, until=None):
+        # Wstawia pojedyncze kandydatury (naked/hidden singles) z kolejek wypełnianych przez
+        # `place` aż do punktu stałego. Zwraca (-1, 0) przy sprzeczności, (None, 0) dla pełnej
+        # planszy, w przeciwnym razie najbardziej ograniczoną komórkę (MRV) i jej kandydatów.
+        # Z `until` kończy jak dla pełnej planszy, gdy tylko pole o tym indeksie zostanie
+        # wypełnione albo zostanie mu jeden kandydat.
+        cells, cand, used, stride = self.cells, self.cand, self.used, self.stride
+        singles, hidden = self.singles, self.hidden
+        shape = self.shape
+        bit_digit, units = shape.bit_digit, shape.units
+        while singles or hidden:
+            if until is not None and not cand[until] & (cand[until] - 1):
+                return None, 0
+            if singles:
+                i = singles.pop()
+                if cells[i]:
+                    continue
+                num = bit_digit[cand[i]]
+            else:
+                u, num = divmod(hidden.pop(), stride)
+                bit = 1 << num
+                if used[u] & bit:
+                    continue
+                for i in units[u]:
+                    if cand[i] & bit:
+                        break
+                else:
+                    return -1, 0
+            if not self.place(i, num):
+                return -1, 0
+
+        best, best_mask, best_count = None, 0, shape.grid_size + 1
+        for i, mask in enumerate(cand):
+            if mask:
+                count = mask.bit_count()
+                if count < best_count:
+                    best, best_mask, best_count = i, mask, count
+                    if count == 2:
+                        break
+        return best, best_mask
+
+    def search(self, limit):
+        # Zwraca liczbę znalezionych rozwiązań (nie więcej niż limit)
+        self.nodes += 1
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            return 0
+        cell, mask = self.propagate()
+        if cell == -1:
+            return 0
+        if cell is None:
+            self.solutions.append(self.cells[:])
+            return 1
+
+        state = self.save()
+        found = 0
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            if self.place(cell, self.shape.bit_digit[bit]):
+                found += self.search(limit - found)
+            self.restore(state)
+            if found >= limit:
+                break
+        return found
+
+
+def solve(grid):
+    """Zwraca rozwiązaną kopię planszy lub None, gdy plansza nie ma rozwiązania."""
+    search = _Search(shape_of(grid))
+    found = search.load(grid) and search.search(1)
+    if profiler.enabled:
+        profiler.count("solver/nodes", search.nodes)
+    if not found:
+        return None
+    return search.shape.to_grid(search.solutions[0])
+
+
+def solve_unique(grid, max_nodes=None):
+    """(rozwiązanie lub None, czy jedyne) jednym przeszukiwaniem do dwóch rozwiązań.
+
+    Po odwiedzeniu `max_nodes` węzłów wynik jest nierozstrzygnięty - zwraca wtedy
+    (None, None) (np. dla rzadkich plansz 25x25 podanych przez klienta serwera).
+    """
+    search = _Search(shape_of(grid))
+    if not search.load(grid):
+        return None, False
+    search.max_nodes = max_nodes
+    found = search.search(2)
+    if profiler.enabled:
+        profiler.count("solver/nodes", search.nodes)
+    if max_nodes is not None and search.nodes > max_nodes:
+        return None, None
+    if not found:
+        return None, False
+    return search.shape.to_grid(search.solutions[0]), found == 1
+
+
+def solvable_by_singles(grid):
+    """Czy planszę da się rozwiązać samymi pojedynczymi kandydaturami, bez zgadywania.
+
+    Takie rozwiązanie jest wymuszone, więc jest też jedyne.
+    """
+    search = _Search(shape_of(grid))
+    return search.load(grid) and search.propagate()[0] is None
+
+
+class CarvedBoard:
+    """Plansza o jednym rozwiązaniu, z której generator kolejno usuwa liczby.
+
+    Plansza jest wczytywana raz; każde sprawdzenie usunięcia zaczyna od kopii tego stanu
+    bez usuwanej wskazówki zamiast wczytywać całą planszę od nowa.
+    """
+
+    def __init__(self, grid):
+        self.search = _Search(shape_of(grid))
+        if not self.search.load(grid):
+            raise ValueError("Plansza bez rozwiązania")
+
+    def check(self, cell, max_nodes=None, search=True):
+        """Skutek usunięcia liczby z pola `cell`; plansza się nie zmienia.
+
+        0 - plansza miałaby więcej rozwiązań (albo przeszukiwanie przekroczyło `max_nodes`
+        węzłów), 1 - pole odtwarzają pojedyncze kandydatury, 2 - jedno rozwiązanie potwierdziło
+        dopiero przeszukiwanie, więc plansza nie rozwiązuje się samymi pojedynczymi kandydaturami.
+        Szukane jest tylko rozwiązanie z inną liczbą w tym polu. Z `search=False` zamiast
+        przeszukiwania od razu zwraca 0.
+        """
+        num = self.search.cells[cell]
+        state = self.search.copy()
+        state.clear(cell)
+        if state.propagate(cell)[0] == -1:
+            return 0
+        mask = state.cand[cell]
+        if not mask & (mask - 1):
+            return 1
+        if not search:
+            return 0
+        state.max_nodes = max_nodes
+        mask ^= 1 << num
+        saved = state.save()
+        found = 0
+        while mask and not found:
+            bit = mask & -mask
+            mask ^= bit
+            if state.place(cell, state.shape.bit_digit[bit]):
+                found = state.search(1)
+            state.restore(saved)
+        if profiler.enabled:
+            profiler.count("solver/nodes", state.nodes)
+        if found or (max_nodes is not None and state.nodes > max_nodes):
+            return 0
+        return 2
+
+    def remove(self, cell):
+        self.search.clear(cell)
+
+
+def count_solutions(grid, limit=2, max_nodes=None):
+    """Zlicza rozwiązania planszy, przerywając po znalezieniu `limit` rozwiązań.
+
+    Po odwiedzeniu `max_nodes` węzłów zwraca `limit`, czyli wynik nierozstrzygnięty
+    jest traktowany jak plansza bez jednoznacznego rozwiązania.
+    """
+    search = _Search(shape_of(grid))
+    if not search.load(grid):
+        return 0
+    search.max_nodes = max_nodes
+    found = search.search(limit)
+    if profiler.enabled:
+        profiler.count("solver/nodes", search.nodes)
+    if max_nodes is not None and search.nodes > max_nodes:
+        return limit
+    return found
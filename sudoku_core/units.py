@@ -0,0 +1,82 @@
+"""Tablice jednostek i sąsiadów planszy, liczone raz na rozmiar.
+
+Pole ma indeks `row * n + col`. Jednostki planszy n x n to wiersze (0..n-1),
+kolumny (n..2n-1) i kwadraty (2n..3n-1). Tablice planszy 9x9 powstają przy
+imporcie i są dostępne jako stałe modułu (`UNITS`, `PEERS`, `CELL_UNITS`, `UNITS_OF`...),
+tablice innych rozmiarów zwraca `get_shape` / `shape_of`. Tablice są krotkami
+współdzielonymi przez silniki, generator, ocenę trudności, wskazówki i sprawdzanie
+konfliktów, więc zamiast liczyć `box * (row // box)` przy każdym wywołaniu wystarczy
+odczyt z tablicy.
+"""
+import math
+from operator import itemgetter
+
+BOX_SIZE = 3
+GRID_SIZE = BOX_SIZE * BOX_SIZE
+CELLS = GRID_SIZE * GRID_SIZE
+BOX_SIZES = (2, 3, 4, 5)
+
+
+class Shape:
+    """Tablice pomocnicze planszy o kwadratach box_size x box_size."""
+
+    def __init__(self, box_size):
+        n = box_size * box_size
+        self.box_size = box_size
+        self.grid_size = n
+        self.cells = n * n
+        self.row_of = tuple(i // n for i in range(self.cells))
+        self.col_of = tuple(i % n for i in range(self.cells))
+        self.box_of = tuple((r // box_size) * box_size + c // box_size for r, c in zip(self.row_of, self.col_of))
+        # Pole -> (wiersz, kolumna, kwadrat) oraz pole -> indeksy jego trzech jednostek w `units`
+        self.cell_units = tuple(zip(self.row_of, self.col_of, self.box_of))
+        self.units_of = tuple((r, n + c, 2 * n + b) for r, c, b in self.cell_units)
+        self.coords = tuple(zip(self.row_of, self.col_of))
+        self.rows = tuple(tuple(r * n + c for c in range(n)) for r in range(n))
+        self.cols = tuple(tuple(r * n + c for r in range(n)) for c in range(n))
+        self.boxes = tuple(tuple(i for i in range(self.cells) if self.box_of[i] == b) for b in range(n))
+        self.units = self.rows + self.cols + self.boxes
+        self.peers = tuple(tuple(sorted(set(self.rows[r] + self.cols[c] + self.boxes[b]) - {i}))
+                           for i, (r, c, b) in enumerate(self.cell_units))
+        # Sąsiedzi jako (wiersz, kolumna) - dla plansz w postaci listy wierszy
+        self.peer_coords = tuple(tuple(self.coords[p] for p in peers) for peers in self.peers)
+        # Wartości sąsiadów pola jednym wywołaniem: peer_getters[i](cells) -> krotka
+        self.peer_getters = tuple(itemgetter(*peers) for peers in self.peers)
+        # Maski kandydatów: cyfra d to bit d, bit 0 nieużywany
+        self.all_digits = ((1 << n) - 1) << 1
+        self.digit_bits = tuple(1 << d for d in range(1, n + 1))
+        self.bit_digit = {1 << d: d for d in range(1, n + 1)}
+
+    def to_grid(self, cells):
+        n = self.grid_size
+        return [cells[r * n:(r + 1) * n] for r in range(n)]
+
+
+_SHAPES = {}
+
+
+def get_shape(box_size=BOX_SIZE):
+    shape = _SHAPES.get(box_size)
+    if shape is None:
+        if box_size not in BOX_SIZES:
+            raise ValueError(f"Nieobsługiwany rozmiar kwadratu: {box_size}")
+        shape = _SHAPES[box_size] = Shape(box_size)
+    return shape
+
+
+def shape_of(grid):
+    """Kształt planszy na podstawie liczby wierszy (4, 9, 16 lub 25)."""
+    box_size = math.isqrt(len(grid))
+    if box_size * box_size != len(grid):
+        raise ValueError(f"Nieobsługiwany rozmiar planszy: {len(grid)}")
+    return get_shape(box_size)
+
+
+# Tablice planszy 9x9
+SHAPE = get_shape()
+ROW_OF, COL_OF, BOX_OF = SHAPE.row_of, SHAPE.col_of, SHAPE.box_of
+ROWS, COLS, BOXES = SHAPE.rows, SHAPE.cols, SHAPE.boxes
+UNITS = SHAPE.units  # 27 jednostek po 9 pól
+PEERS = SHAPE.peers  # 81 pól po 20 sąsiadów
+CELL_UNITS = SHAPE.cell_units
+UNITS_OF = SHAPE.units_of
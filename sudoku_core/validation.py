@@ -0,0 +1,24 @@
+"""Sprawdzanie poprawności planszy."""
+from sudoku_core.board import Board
+from sudoku_core.units import shape_of
+
+
+def has_conflict(board, row, col, num):
+    # Wiersz, kolumna i kwadrat naraz - sąsiedzi pola z tablic sudoku_core.units
+    if isinstance(board, Board):
+        return not board.is_valid(row, col, num)
+    shape = shape_of(board)
+    for r, c in shape.peer_coords[row * shape.grid_size + col]:
+        if board[r][c] == num:
+            return True
+    return False
+
+
+def is_solved(board, solution):
+    if isinstance(board, Board) and isinstance(solution, Board):
+        return board == solution
+    for row in range(len(board)):
+        for col in range(len(board)):
+            if board[row][col] != solution[row][col]:
+                return False
+    return True
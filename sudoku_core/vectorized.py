@@ -0,0 +1,154 @@
+"""Wektorowe (NumPy) sprawdzanie i rozwiązywanie wielu plansz naraz.
+
+Wszystkie funkcje przyjmują tablicę (N, 9, 9) liczb całkowitych (najlepiej uint8),
+w której 0 oznacza puste pole. Duże wejścia są przetwarzane w paczkach po
+CHUNK_SIZE plansz, więc zużycie pamięci nie rośnie z N. Wymaga pakietu numpy.
+"""
+import numpy as np
+
+from sudoku_core.solver import solve
+from sudoku_core.units import CELLS, GRID_SIZE, UNITS, UNITS_OF
+
+CHUNK_SIZE = 1 << 16
+ALL_DIGITS = ((1 << GRID_SIZE) - 1) << 1
+
+# Indeksy pól każdej z 27 jednostek i trzy jednostki każdego pola (tablice sudoku_core.units)
+_UNITS = np.array(UNITS, dtype=np.intp)
+_CELL_UNITS = np.array(UNITS_OF, dtype=np.intp)
+
+_DIGIT_BITS = (1 << np.arange(1, GRID_SIZE + 1)).astype(np.uint16)
+_POPCOUNT = np.array([bin(m).count("1") for m in range(ALL_DIGITS + 1)], dtype=np.uint8)
+_BIT_DIGIT = np.zeros(ALL_DIGITS + 1, dtype=np.uint8)
+_BIT_DIGIT[_DIGIT_BITS] = np.arange(1, GRID_SIZE + 1)
+
+
+def _as_boards(boards):
+    boards = np.asarray(boards)
+    if boards.ndim != 3 or boards.shape[1:] != (GRID_SIZE, GRID_SIZE):
+        raise ValueError(f"Oczekiwano tablicy (N, {GRID_SIZE}, {GRID_SIZE}), otrzymano {boards.shape}")
+    return boards
+
+
+def _chunks(boards):
+    for start in range(0, len(boards), CHUNK_SIZE):
+        flat = boards[start:start + CHUNK_SIZE].reshape(-1, CELLS)
+        if flat.dtype != np.uint8:
+            # Wartości spoza zakresu uint8 nie mogą się "zawinąć" do poprawnych cyfr
+            flat = np.where((flat < 0) | (flat > GRID_SIZE), 0xFF, flat)
+        yield start, flat.astype(np.uint8)
+
+
+def _bits(flat):
+    # Cyfra d -> bit d, puste pole (i wartości spoza zakresu) -> 0
+    digits = np.where(flat <= GRID_SIZE, flat, 0).astype(np.uint16)
+    return np.where(digits > 0, np.left_shift(np.uint16(1), digits), np.uint16(0))
+
+
+def _candidates(flat):
+    # Maska bitowa dozwolonych cyfr każdego pustego pola (0 dla wypełnionych)
+    used = np.bitwise_or.reduce(_bits(flat)[:, _UNITS], axis=2)
+    cell_used = np.bitwise_or.reduce(used[:, _CELL_UNITS], axis=2)
+    return np.where(flat == 0, ~cell_used & ALL_DIGITS, 0).astype(np.uint16)
+
+
+def _valid(flat):
+    # Brak powtórzeń w jednostce <=> liczba wypełnionych pól równa liczbie różnych cyfr
+    in_range = (flat <= GRID_SIZE).all(axis=1)
+    units = _bits(flat)[:, _UNITS]
+    distinct = _POPCOUNT[np.bitwise_or.reduce(units, axis=2)]
+    filled = np.count_nonzero(units, axis=2)
+    return in_range & (distinct == filled).all(axis=1)
+
+
+def validate_boards(boards):
+    """Zwraca (N,) bool: czy plansza nie zawiera powtórzeń ani wartości spoza 0..9."""
+    boards = _as_boards(boards)
+    result = np.empty(len(boards), dtype=bool)
+    for start, flat in _chunks(boards):
+        result[start:start + len(flat)] = _valid(flat)
+    return result
+
+
+def conflict_masks(boards):
+    """Zwraca (N, 9, 9) bool: pola, których cyfra powtarza się w wierszu, kolumnie lub kwadracie."""
+    boards = _as_boards(boards)
+    result = np.empty(boards.shape, dtype=bool)
+    for start, flat in _chunks(boards):
+        bits = _bits(flat)
+        units = bits[:, _UNITS]
+        # `twice`: cyfry występujące w jednostce co najmniej dwa razy
+        once = np.zeros(units.shape[:2], dtype=np.uint16)
+        twice = np.zeros_like(once)
+        for slot in range(GRID_SIZE):
+            twice |= once & units[:, :, slot]
+            once |= units[:, :, slot]
+        cell_twice = np.bitwise_or.reduce(twice[:, _CELL_UNITS], axis=2)
+        # Wartości spoza zakresu też są oznaczane jako konflikt
+        cells = ((cell_twice & bits) != 0) | (flat > GRID_SIZE)
+        result[start:start + len(flat)] = cells.reshape(-1, GRID_SIZE, GRID_SIZE)
+    return result
+
+
+def candidate_masks(boards):
+    """Zwraca (N, 9, 9) uint16: bit d ustawiony, gdy cyfra d jest dozwolona w pustym polu."""
+    boards = _as_boards(boards)
+    result = np.empty(boards.shape, dtype=np.uint16)
+    for start, flat in _chunks(boards):
+        result[start:start + len(flat)] = _candidates(flat).reshape(-1, GRID_SIZE, GRID_SIZE)
+    return result
+
+
+def _propagate(flat):
+    # Wstawia naked/hidden singles we wszystkich planszach naraz aż do punktu stałego.
+    # Zwraca maskę plansz sprzecznych; `flat` jest modyfikowane w miejscu.
+    failed = ~_valid(flat)
+    active = ~failed & (flat == 0).any(axis=1)
+    while active.any():
+        rows = np.flatnonzero(active)
+        sub = flat[rows]
+        cand = _candidates(sub)
+        empty = sub == 0
+        dead = (empty & (cand == 0)).any(axis=1)
+
+        # Naked singles: pole z jednym kandydatem
+        counts = _POPCOUNT[cand]
+        naked = empty & (counts == 1)
+        values = np.where(naked, _BIT_DIGIT[cand], 0).astype(np.uint8)
+
+        # Hidden singles: cyfra mieszcząca się w jednym polu jednostki
+        unit_bits = (cand[:, _UNITS, None] & _DIGIT_BITS) > 0  # (n, 27, 9 pól, 9 cyfr)
+        hidden = unit_bits.sum(axis=2) == 1
+        n, unit, digit = np.nonzero(hidden)
+        slot = unit_bits[n, unit, :, digit].argmax(axis=1)
+        cell = _UNITS[unit, slot]
+        free = values[n, cell] == 0
+        values[n[free], cell[free]] = digit[free] + 1
+
+        progress = (values > 0).any(axis=1)
+        sub = np.where(values > 0, values, sub)
+        dead |= ~_valid(sub)
+        flat[rows] = sub
+        failed[rows[dead]] = True
+        active[rows] = progress & ~dead & (sub == 0).any(axis=1)
+    return failed
+
+
+def solve_boards(boards):
+    """Rozwiązuje N plansz: propagacja wektorowa, a dla plansz wymagających zgadywania silnik skalarny.
+
+    Zwraca (rozwiązania (N, 9, 9) uint8, maska (N,) bool plansz rozwiązanych).
+    """
+    boards = _as_boards(boards)
+    solutions = np.empty(boards.shape, dtype=np.uint8)
+    solved = np.empty(len(boards), dtype=bool)
+    for start, flat in _chunks(boards):
+        failed = _propagate(flat)
+        done = ~failed & (flat != 0).all(axis=1)
+        for i in np.flatnonzero(~failed & ~done):
+            solution = solve(flat[i].reshape(GRID_SIZE, GRID_SIZE).tolist())
+            if solution is not None:
+                flat[i] = np.array(solution, dtype=np.uint8).ravel()
+                done[i] = True
+        solutions[start:start + len(flat)] = flat.reshape(-1, GRID_SIZE, GRID_SIZE)
+        solved[start:start + len(flat)] = done
+    return solutions, solved
@@ -0,0 +1,17 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest  # noqa: E402
+
+
+def solved_grid(box_size=3):
+    """Rozwiązana plansza z przesunięć wierszy (wzór bazowy generatora)."""
+    n = box_size * box_size
+    return [[(box_size * (row % box_size) + row // box_size + col) % n + 1 for col in range(n)] for row in range(n)]
+
+
+@pytest.fixture
+def solution():
+    return solved_grid()
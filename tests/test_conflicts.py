@@ -0,0 +1,97 @@
+from conftest import solved_grid
+from sudoku_core.board import Board
+from sudoku_core.conflicts import ConflictTracker
+
+
+def tracker_for(grid):
+    return ConflictTracker(Board.from_grid(grid))
+
+
+def test_solved_board(solution):
+    tracker = tracker_for(solution)
+    assert tracker.is_solved()
+    assert tracker.cells == set()
+
+
+def test_empty_cell_is_not_solved(solution):
+    solution[4][4] = 0
+    tracker = tracker_for(solution)
+    assert not tracker.is_solved()
+    assert tracker.cells == set()
+
+
+def test_initial_conflicts():
+    grid = [[0] * 9 for _ in range(9)]
+    grid[0][0] = grid[0][8] = 5  # Wiersz
+    grid[3][3] = grid[4][4] = 7  # Kwadrat
+    grid[8][1] = 2
+    tracker = tracker_for(grid)
+    assert tracker.cells == {(0, 0), (0, 8), (3, 3), (4, 4)}
+    assert tracker.is_conflict(0, 0)
+    assert not tracker.is_conflict(8, 1)
+
+
+def test_has_conflict():
+    grid = [[0] * 9 for _ in range(9)]
+    grid[0][0] = 5
+    tracker = tracker_for(grid)
+    assert tracker.has_conflict(0, 4, 5)  # Wiersz
+    assert tracker.has_conflict(6, 0, 5)  # Kolumna
+    assert tracker.has_conflict(2, 2, 5)  # Kwadrat
+    assert not tracker.has_conflict(4, 4, 5)
+    # Cyfra w samej komórce nie jest konfliktem ze sobą
+    assert not tracker.has_conflict(0, 0, 5)
+
+
+def test_set_updates_conflicts_and_win(solution):
+    board = Board.from_grid(solution)
+    tracker = ConflictTracker(board)
+    row, col, num = 0, 0, solution[0][0]
+    wrong = solution[0][1]
+
+    changed = tracker.set(row, col, wrong)
+    assert board.get(row, col) == wrong
+    # Pole (0, 0) koliduje z każdym wystąpieniem tej cyfry w swoim wierszu, kolumnie i kwadracie
+    peers = {(r, c) for r in range(9) for c in range(9)
+             if (r, c) != (0, 0) and (r == 0 or c == 0 or (r < 3 and c < 3)) and solution[r][c] == wrong}
+    assert (0, 1) in peers
+    assert tracker.cells == peers | {(0, 0)}
+    assert tracker.cells <= changed
+    assert not tracker.is_solved()
+
+    tracker.set(row, col, 0)
+    assert tracker.cells == set()
+    assert not tracker.is_solved()
+
+    tracker.set(row, col, num)
+    assert tracker.cells == set()
+    assert tracker.is_solved()
+    assert tracker.set(row, col, num) == set()
+
+
+def test_conflict_cleared_when_duplicate_removed():
+    grid = [[0] * 9 for _ in range(9)]
+    tracker = tracker_for(grid)
+    tracker.set(0, 0, 3)
+    tracker.set(0, 5, 3)
+    tracker.set(7, 0, 3)
+    assert tracker.cells == {(0, 0), (0, 5), (7, 0)}
+
+    # (0, 0) nadal koliduje z (7, 0) w kolumnie
+    tracker.set(0, 5, 0)
+    assert tracker.cells == {(0, 0), (7, 0)}
+    tracker.set(7, 0, 4)
+    assert tracker.cells == set()
+
+
+def test_matches_full_recount():
+    # Stan przyrostowy po serii wpisów zgadza się z trackerem policzonym od zera
+    grid = solved_grid(4)
+    board = Board.from_grid(grid)
+    tracker = ConflictTracker(board)
+    for step in range(200):
+        cell = step * 37 % 256
+        tracker.set(cell // 16, cell % 16, step * 11 % 17)
+        fresh = ConflictTracker(board.copy())
+        assert tracker.cells == fresh.cells
+        assert tracker.is_solved() == fresh.is_solved()
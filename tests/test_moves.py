@@ -0,0 +1,138 @@
+import pytest
+
+from sudoku_core.moves import MoveLog, apply_moves, pack_moves, unpack_moves
+
+
+def empty_board(n=4):
+    return [[0] * n for _ in range(n)]
+
+
+def test_pack_round_trip():
+    moves = [(0, 0, 5, 0.0), (80, 5, 0, 12.5), (255, 0, 25, 3600.0)]
+    data = pack_moves(moves)
+    assert unpack_moves(data) == moves
+    assert unpack_moves(b"") == []
+
+
+def test_apply_moves():
+    board = apply_moves(empty_board(), [(0, 0, 1, 0.0), (5, 0, 2, 0.0), (15, 0, 3, 0.0), (5, 2, 4, 0.0)])
+    assert board == [[1, 0, 0, 0], [0, 4, 0, 0], [0, 0, 0, 0], [0, 0, 0, 3]]
+
+
+def test_undo_redo():
+    log = MoveLog(empty_board())
+    log.record(0, 0, 0, 1, timestamp=1.0)
+    log.record(1, 2, 0, 3, timestamp=2.0)
+    log.record(0, 0, 1, 2, timestamp=3.0)
+    assert len(log) == 3
+
+    assert log.undo() == (0, 0, 1)
+    assert log.undo() == (1, 2, 0)
+    assert log.redo() == (1, 2, 3)
+    assert log.redo() == (0, 0, 2)
+    assert log.redo() is None
+
+    for _ in range(3):
+        assert log.undo() is not None
+    assert log.undo() is None
+    assert bytes(log.current) == bytes(16)
+
+
+def test_record_ignores_unchanged_value():
+    log = MoveLog(empty_board())
+    log.record(0, 0, 0, 0)
+    assert len(log) == 0
+
+
+def test_new_move_after_undo_drops_redo():
+    log = MoveLog(empty_board())
+    log.record(0, 0, 0, 1)
+    log.record(0, 1, 0, 2)
+    log.undo()
+    log.record(3, 3, 0, 4)
+
+    assert len(log) == 2
+    assert log.redo() is None
+    assert log.move(1) == (15, 0, 4, 0.0)
+    assert log.board_at(2) == [[1, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 4]]
+
+
+def test_board_at_replays_from_snapshots():
+    # Mała odległość między migawkami: odtwarzanie przechodzi przez kilka z nich
+    start = empty_board()
+    start[2][2] = 4
+    log = MoveLog(start, snapshot_every=3)
+    boards = [[row[:] for row in start]]
+    board = [row[:] for row in start]
+    for step in range(10):
+        row, col = divmod(step % 8, 4)
+        old = board[row][col]
+        new = old % 4 + 1
+        log.record(row, col, old, new, timestamp=float(step))
+        board[row][col] = new
+        boards.append([row[:] for row in board])
+
+    for position, expected in enumerate(boards):
+        assert log.board_at(position) == expected
+    with pytest.raises(IndexError):
+        log.board_at(11)
+    with pytest.raises(IndexError):
+        log.board_at(-1)
+
+
+def test_board_at_after_undo_and_new_moves():
+    log = MoveLog(empty_board(), snapshot_every=2)
+    for col in range(4):
+        log.record(0, col, 0, col + 1)
+    for _ in range(3):
+        log.undo()
+    # Migawki za pozycją cofnięcia należą do porzuconej gałęzi
+    log.record(1, 0, 0, 4)
+    log.record(1, 1, 0, 3)
+
+    assert len(log) == 3
+    assert log.board_at(3) == [[1, 0, 0, 0], [4, 3, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]
+
+
+def test_unsaved_replays_to_current_board():
+    start = empty_board()
+    log = MoveLog(start)
+    log.record(0, 0, 0, 1, timestamp=1.0)
+    log.mark_saved()
+    assert log.unsaved() == []
+
+    log.record(0, 1, 0, 2, timestamp=2.0)
+    log.record(0, 2, 0, 3, timestamp=3.0)
+    assert log.unsaved() == [(1, 0, 2, 2.0), (2, 0, 3, 3.0)]
+
+    saved = apply_moves(log.board_at(1), log.unsaved())
+    assert saved == log.board_at(3)
+
+
+def test_unsaved_after_undo_past_save():
+    log = MoveLog(empty_board())
+    log.record(0, 0, 0, 1)
+    log.record(0, 1, 0, 2)
+    log.mark_saved()
+    saved = log.board_at(2)
+
+    log.undo()
+    log.undo()
+    log.record(2, 2, 0, 3)
+    # Historia od zapisu przepadła, więc ruchy to różnica plansz
+    moves = log.unsaved(timestamp=9.0)
+    assert sorted(moves) == [(0, 1, 0, 9.0), (1, 2, 0, 9.0), (10, 0, 3, 9.0)]
+    assert apply_moves(saved, moves) == log.board_at(len(log))
+
+    log.mark_saved()
+    assert log.unsaved() == []
+
+
+def test_undo_before_save_without_new_move():
+    log = MoveLog(empty_board())
+    log.record(0, 0, 0, 1)
+    log.mark_saved()
+    log.undo()
+    assert log.unsaved(timestamp=5.0) == [(0, 1, 0, 5.0)]
+    log.redo()
+    assert log.unsaved() == []
@@ -0,0 +1,180 @@
+import json
+import sqlite3
+
+import pytest
+
+from conftest import solved_grid
+from sudoku_core.moves import MoveLog, pack_moves
+from sudoku_core.saves import DEFAULT_HINT_COUNT, SaveStore, make_save, migrate_json
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SaveStore(str(tmp_path / "saves.db"))
+    yield store
+    store.close()
+
+
+def puzzle_from(solution, removed):
+    board = [row[:] for row in solution]
+    for row, col in removed:
+        board[row][col] = 0
+    # Wskazówki to plansza startowa; `board` to jej kopia, do której wpisuje gracz
+    return board, [row[:] for row in board]
+
+
+def test_full_save_round_trip(store, solution):
+    board, givens = puzzle_from(solution, [(0, 0), (4, 4), (8, 8)])
+    store.append(make_save("Ala", "trudny", board, solution, givens, 12.5, 2))
+
+    save_data = store.latest("Ala")
+    assert save_data["board"] == board
+    assert save_data["solution"] == solution
+    assert save_data["givens"] == givens
+    assert save_data["elapsed_time"] == 12.5
+    assert save_data["hint_count"] == 2
+    assert store.latest("Ola") is None
+
+
+def test_delta_chain_rebuilds_board(store, solution):
+    board, givens = puzzle_from(solution, [(0, 0), (0, 1), (1, 0), (2, 2)])
+    base = store.append(make_save("Ala", "trudny", board, solution, givens, 0.0, 3))
+    log = MoveLog(board)
+
+    for step, (row, col) in enumerate([(0, 0), (0, 1), (1, 0)]):
+        log.record(row, col, 0, solution[row][col], timestamp=float(step))
+        board[row][col] = solution[row][col]
+        store.append_delta(base, make_save("Ala", "trudny", board, solution, givens, step + 1.0, 3),
+                           pack_moves(log.unsaved()))
+        log.mark_saved()
+
+        save_data = store.latest("Ala")
+        assert save_data["board"] == board
+        assert save_data["elapsed_time"] == step + 1.0
+        assert save_data["givens"] == givens
+
+
+def test_delta_chain_after_undo_past_save(store, solution):
+    board, givens = puzzle_from(solution, [(3, 3), (3, 4)])
+    base = store.append(make_save("Ala", "trudny", board, solution, givens, 0.0, 3))
+    log = MoveLog(board)
+    log.record(3, 3, 0, 7)
+    log.record(3, 4, 0, 8)
+    store.append_delta(base, make_save("Ala", "trudny", board, solution, givens, 1.0, 3), pack_moves(log.unsaved()))
+    log.mark_saved()
+
+    # Cofnięcie obu ruchów i nowy ruch: historia od zapisu znika, zapis niesie różnicę plansz
+    log.undo()
+    log.undo()
+    log.record(3, 4, 0, solution[3][4])
+    store.append_delta(base, make_save("Ala", "trudny", board, solution, givens, 2.0, 3), pack_moves(log.unsaved()))
+
+    assert store.latest("Ala")["board"] == log.board_at(len(log))
+
+
+def test_new_full_save_starts_new_chain(store, solution):
+    board, givens = puzzle_from(solution, [(0, 0)])
+    first = store.append(make_save("Ala", "trudny", board, solution, givens, 0.0, 3))
+    store.append_delta(first, make_save("Ala", "trudny", board, solution, givens, 1.0, 3), pack_moves([(0, 0, 9, 1.0)]))
+
+    # Ruchy łańcucha poprzedniej podstawy nie mogą trafić na planszę nowej gry
+    board, givens = puzzle_from(solution, [(8, 8)])
+    second = store.append(make_save("Ala", "łatwy", board, solution, givens, 0.0, 3))
+    assert store.latest("Ala")["board"][0][0] == solution[0][0]
+    store.append_delta(second, make_save("Ala", "łatwy", board, solution, givens, 1.0, 3),
+                       pack_moves([(80, 0, 4, 1.0)]))
+
+    save_data = store.latest("Ala")
+    assert save_data["difficulty"] == "łatwy"
+    assert save_data["board"][0][0] == solution[0][0]
+    assert save_data["board"][8][8] == 4
+
+
+def test_chains_of_players_are_separate(store, solution):
+    board, givens = puzzle_from(solution, [(0, 0)])
+    ala = store.append(make_save("Ala", "trudny", board, solution, givens, 0.0, 3))
+    ola = store.append(make_save("Ola", "trudny", board, solution, givens, 0.0, 3))
+    store.append_delta(ala, make_save("Ala", "trudny", board, solution, givens, 1.0, 3), pack_moves([(0, 0, 5, 1.0)]))
+    store.append_delta(ola, make_save("Ola", "trudny", board, solution, givens, 1.0, 3), pack_moves([(0, 0, 6, 1.0)]))
+
+    assert store.latest("Ala")["board"][0][0] == 5
+    assert store.latest("Ola")["board"][0][0] == 6
+
+
+def test_other_sizes_are_stored_as_json(store):
+    solution = solved_grid(4)
+    board, givens = puzzle_from(solution, [(0, 0), (15, 15)])
+    store.append(make_save("Ala", "łatwy", board, solution, givens, 3.0, 1))
+
+    save_data = store.latest("Ala")
+    assert save_data["board"] == board
+    assert save_data["solution"] == solution
+
+
+def test_migrate_json(tmp_path, store, solution):
+    board, _ = puzzle_from(solution, [(0, 0)])
+    legacy = tmp_path / "sudoku_saves.json"
+    # Dawne zapisy: bez pola gracza, bez wskazówek planszy i licznika podpowiedzi
+    legacy.write_text(json.dumps({
+        "Ala": [
+            {"board": solution, "solution": solution, "difficulty": "łatwy", "elapsed_time": 90.0,
+             "timestamp": "2024-05-02T10:00:00"},
+            {"board": board, "solution": solution, "difficulty": "trudny", "elapsed_time": 30.0,
+             "timestamp": "2024-05-01T10:00:00"},
+        ],
+        "Ola": [
+            {"board": board, "solution": solution, "difficulty": "średni", "elapsed_time": 5.0,
+             "timestamp": "2024-05-03T10:00:00"},
+        ],
+    }))
+
+    assert migrate_json(store, str(legacy)) == 3
+    assert not legacy.exists()
+    assert (tmp_path / "sudoku_saves.json.migrated").exists()
+
+    # Najnowszy według czasu, a nie według kolejności w pliku
+    save_data = store.latest("Ala")
+    assert save_data["difficulty"] == "łatwy"
+    assert save_data["player"] == "Ala"
+    assert save_data["hint_count"] == DEFAULT_HINT_COUNT
+    assert save_data["givens"] == [[0] * 9 for _ in range(9)]
+    assert store.latest("Ola")["board"] == board
+
+
+def test_migrate_json_missing_or_invalid(tmp_path, store):
+    assert migrate_json(store, str(tmp_path / "brak.json")) == 0
+    broken = tmp_path / "sudoku_saves.json"
+    broken.write_text("{")
+    assert migrate_json(store, str(broken)) == 0
+    assert broken.exists()
+
+
+def test_old_database_gets_new_columns(tmp_path, solution):
+    path = str(tmp_path / "saves.db")
+    connection = sqlite3.connect(path)
+    with connection:
+        # Schemat sprzed zapisu binarnego: plansze w `data`
+        connection.execute("CREATE TABLE saves (id INTEGER PRIMARY KEY, player TEXT NOT NULL, "
+                           "timestamp TEXT NOT NULL, data TEXT NOT NULL)")
+        connection.execute("INSERT INTO saves (player, timestamp, data) VALUES (?, ?, ?)",
+                           ("Ala", "2024-05-01T10:00:00",
+                            json.dumps({"board": solution, "solution": solution, "difficulty": "łatwy",
+                                        "player": "Ala", "elapsed_time": 1.0})))
+    connection.close()
+
+    store = SaveStore(path)
+    try:
+        columns = {row[1] for row in store.connection.execute("PRAGMA table_info(saves)")}
+        assert {"board", "puzzle", "base", "moves"} <= columns
+        save_data = store.latest("Ala")
+        assert save_data["board"] == solution
+        assert save_data["hint_count"] == DEFAULT_HINT_COUNT
+
+        # Nowe zapisy w starej bazie trafiają już do kolumn binarnych
+        board, givens = puzzle_from(solution, [(0, 0)])
+        base = store.append(make_save("Ala", "trudny", board, solution, givens, 0.0, 3))
+        store.append_delta(base, make_save("Ala", "trudny", board, solution, givens, 1.0, 3),
+                           pack_moves([(0, 0, solution[0][0], 1.0)]))
+        assert store.latest("Ala")["board"] == solution
+    finally:
+        store.close()
@@ -0,0 +1,142 @@
+import asyncio
+import json
+
+import pytest
+
+from sudoku_core.server import MAX_BODY, HTTPError, PuzzleServer, parse_board
+
+
+@pytest.fixture
+def server():
+    # Procesy robocze startują dopiero przy pierwszym zadaniu, a ścieżki błędów żadnego nie zlecają
+    server = PuzzleServer(workers=1, pool_size=1)
+    yield server
+    server.close()
+
+
+def dispatch(server, method, target, body=b""):
+    return asyncio.run(server.dispatch(method, target, body))
+
+
+def error_of(server, method, target, body=b""):
+    with pytest.raises(HTTPError) as info:
+        dispatch(server, method, target, body)
+    return info.value.status, str(info.value)
+
+
+def post(server, target, payload):
+    return error_of(server, "POST", target, json.dumps(payload).encode())
+
+
+@pytest.mark.parametrize("value, message", [
+    ("1" * 80 + "x", "Niedozwolony znak 'x' na pozycji 81"),
+    ("1" * 80, "Oczekiwano 16, 81, 256 lub 625 znaków"),
+    ([[0] * 9 for _ in range(8)], "Nieobsługiwany rozmiar"),
+    ([[0] * 9 for _ in range(8)] + [[0] * 8], "kwadratem"),
+    ([[0] * 9 for _ in range(8)] + [[0] * 8 + [10]], "kwadratem"),
+    ([[0] * 4, [0] * 4, [0] * 4, [0, 0, 0, "1"]], "kwadratem"),
+    ([[0] * 4, [0] * 4, [0] * 4, [0, 0, 0, True]], "kwadratem"),
+    ([[0] * 4, [0] * 4, [0] * 4, [0] * 3], "kwadratem"),
+    (None, ""),
+    (5, ""),
+])
+def test_parse_board_rejects(value, message):
+    with pytest.raises(HTTPError) as info:
+        parse_board(value)
+    assert info.value.status == 400
+    assert message in str(info.value)
+
+
+def test_parse_board_accepts_text_and_rows():
+    text = "1234341221434321"
+    rows = [[1, 2, 3, 4], [3, 4, 1, 2], [2, 1, 4, 3], [4, 3, 2, 1]]
+    assert parse_board(text) == rows
+    assert parse_board(rows) == rows
+
+
+@pytest.mark.parametrize("query, message", [
+    ("size=abc", "liczbą całkowitą"),
+    ("size=9.0", "liczbą całkowitą"),
+    ("size=10", "Obsługiwane rozmiary"),
+    ("size=-4", "Obsługiwane rozmiary"),
+    ("size=0", "Obsługiwane rozmiary"),
+    ("size=1", "Obsługiwane rozmiary"),
+    ("size=36", "Obsługiwane rozmiary"),
+    ("difficulty=koszmarny", "Nieznany poziom"),
+    ("id=trudny-9x9", "Niepoprawny identyfikator"),
+    ("id=4-trudny-10x10-1", "Niepoprawny identyfikator"),
+    ("id=4-trudny-9x9-abc", "Niepoprawny identyfikator"),
+    ("id=1-trudny-9x9-1", "innej wersji generatora"),
+])
+def test_puzzle_bad_query(server, query, message):
+    status, error = error_of(server, "GET", "/puzzle?" + query)
+    assert status == 400
+    assert message in error
+
+
+@pytest.mark.parametrize("target", ["/solve", "/validate"])
+def test_post_bad_body(server, target):
+    status, error = error_of(server, "POST", target, b"{nie json")
+    assert (status, error) == (400, "Treść żądania nie jest poprawnym JSON")
+    assert error_of(server, "POST", target, b"[1, 2]") == (400, "Oczekiwano obiektu JSON")
+    assert post(server, target, {})[0] == 400
+    assert post(server, target, {"board": "1" * 81 + "2"})[0] == 400
+    status, error = post(server, target, {"board": "0" * 80 + "-"})
+    assert status == 400
+    assert "Niedozwolony znak" in error
+
+
+def test_solve_rejects_board_before_executor(server):
+    # Błędna plansza nie może trafić do puli procesów
+    assert post(server, "/solve", {"board": [[0] * 9] * 9 + [[0] * 9]})[0] == 400
+    assert server.coalescer.pending == {}
+
+
+def test_validate_without_executor(server):
+    board = "1" + "0" * 8 + "1" + "0" * 71
+    assert dispatch(server, "POST", "/validate", json.dumps({"board": board}).encode()) == {
+        "valid": False, "complete": False, "conflicts": [[0, 0], [1, 0]]}
+
+
+def test_method_and_path_errors(server):
+    assert error_of(server, "POST", "/puzzle")[0] == 405
+    assert error_of(server, "POST", "/stats")[0] == 405
+    assert error_of(server, "GET", "/solve")[0] == 405
+    assert error_of(server, "GET", "/validate")[0] == 405
+    assert error_of(server, "GET", "/nieznana")[0] == 404
+
+
+def exchange(server, request):
+    """Wysyła surowe żądanie przez gniazdo i zwraca (status, treść JSON) odpowiedzi."""
+    async def run():
+        listener = await asyncio.start_server(server.handle_connection, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(request)
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            await writer.wait_closed()
+        return response
+
+    head, _, body = asyncio.run(run()).partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+
+def test_connection_error_responses(server):
+    status, payload = exchange(server, b"GET /puzzle?size=10 HTTP/1.1\r\nConnection: close\r\n\r\n")
+    assert status == 400
+    assert payload == {"error": "Obsługiwane rozmiary: 4, 9, 16, 25"}
+
+    body = b"{nie json"
+    status, payload = exchange(server, b"POST /solve HTTP/1.1\r\nConnection: close\r\nContent-Length: "
+                               + str(len(body)).encode() + b"\r\n\r\n" + body)
+    assert status == 400
+
+    status, payload = exchange(server, b"POST /solve HTTP/1.1\r\nConnection: close\r\nContent-Length: x\r\n\r\n")
+    assert (status, payload) == (400, {"error": "Niepoprawny nagłówek Content-Length"})
+
+    status, _ = exchange(server, b"POST /solve HTTP/1.1\r\nConnection: close\r\nContent-Length: "
+                         + str(MAX_BODY + 1).encode() + b"\r\n\r\n")
+    assert status == 413